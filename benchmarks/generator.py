@@ -0,0 +1,178 @@
+"""
+SimpleTestCaseGenerator scaling benchmark.
+
+Generates suites for synthetic JSON payloads of 10 to 10,000 fields at several
+nesting depths and measures, per (mode, depth, fields):
+- seconds: best of --repeats runs of generate_tests
+- peak_alloc_kb: peak traced allocation of one run (tracemalloc)
+Modes: suite (include_curl=False, as the API generates), suite_curl
+(include_curl=True) and per_field (one case per payload field and field rule).
+
+Regression thresholds are on scaling, so they hold on any machine. Building
+one case is linear in the payload, so going from n1 to n2 fields may multiply
+the time and peak allocation per generated case by at most (n2 / n1) * --slack.
+per_field suites have one case per field and rule, so their total output grows
+quadratically; their sizes are capped by --per-field-max-fields to keep the
+run in memory, but each case is held to the same linear bound.
+
+Usage: python benchmarks/generator.py [--fields 10,100,1000,10000] [--depths 1,3,5]
+       [--modes suite,suite_curl,per_field] [--repeats 3] [--slack 3]
+       [--per-field-max-fields 1000] [--output report.json]
+Prints a JSON report and exits with status 1 if a threshold is exceeded.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from src.services.simple_test_generator import SimpleTestCaseGenerator  # noqa: E402
+
+MODES = {
+    'suite': {'include_curl': False, 'per_field': False},
+    'suite_curl': {'include_curl': True, 'per_field': False},
+    'per_field': {'include_curl': False, 'per_field': True},
+}
+# Metrics checked for scaling, each divided by the number of generated cases
+SCALED_METRICS = ('seconds', 'peak_alloc_kb')
+LEAF_VALUES = (
+    lambda i: i,
+    lambda i: f'value-{i}',
+    lambda i: i % 2 == 0,
+    lambda i: i / 7,
+    lambda i: [i, i + 1],
+    lambda i: None,
+)
+
+
+def synthetic_payload(fields, depth):
+    """
+    A payload with `fields` leaf values of mixed types spread evenly over
+    `depth` levels: every level holds its share of leaves and one nested object
+    """
+    payload = {}
+    node = payload
+    per_level = -(-fields // depth)
+    for level in range(depth):
+        start = level * per_level
+        for i in range(start, min(start + per_level, fields)):
+            node[f'field_{i}'] = LEAF_VALUES[i % len(LEAF_VALUES)](i)
+        if level < depth - 1:
+            node = node.setdefault(f'nested_{level + 1}', {})
+    return payload
+
+
+def api_info_for(payload):
+    return {
+        'method': 'POST',
+        'url': 'http://127.0.0.1:8000/items',
+        'headers': {'content-type': 'application/json'},
+        'payload': payload,
+        'query_params': {},
+        'response': {'status_code': 201, 'content': {'id': 1}}
+    }
+
+
+def measure(generator, api_info, options, repeats):
+    best = None
+    cases = 0
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        suite = generator.generate_tests(api_info, **options)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        cases = sum(len(category_cases) for category_cases in suite.values())
+        del suite
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        generator.generate_tests(api_info, **options)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'cases': cases, 'seconds': best, 'peak_alloc_kb': peak / 1024}
+
+
+def check_scaling(results, slack):
+    """Compare the per-case cost of consecutive field counts of every (mode, depth) series"""
+    violations = []
+    series = {}
+    for result in results:
+        series.setdefault((result['mode'], result['depth']), []).append(result)
+    for (mode, depth), points in series.items():
+        points.sort(key=lambda point: point['fields'])
+        for smaller, larger in zip(points, points[1:]):
+            allowed = larger['fields'] / smaller['fields'] * slack
+            for metric in SCALED_METRICS:
+                if smaller[metric] <= 0 or not smaller['cases'] or not larger['cases']:
+                    continue
+                growth = (larger[metric] / larger['cases']) / (smaller[metric] / smaller['cases'])
+                if growth > allowed:
+                    violations.append({
+                        'mode': mode,
+                        'depth': depth,
+                        'metric': f'{metric}_per_case',
+                        'fields': [smaller['fields'], larger['fields']],
+                        'growth': round(growth, 2),
+                        'allowed': round(allowed, 2)
+                    })
+    return violations
+
+
+def int_list(value):
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure how SimpleTestCaseGenerator scales with payload size')
+    parser.add_argument('--fields', type=int_list, default=[10, 100, 1000, 10000])
+    parser.add_argument('--depths', type=int_list, default=[1, 3, 5])
+    parser.add_argument('--modes', default=','.join(MODES), help='comma-separated subset of ' + ', '.join(MODES))
+    parser.add_argument('--repeats', type=int, default=3, help='timed runs per point (the best is kept)')
+    parser.add_argument('--slack', type=float, default=3.0, help='allowed factor over the expected growth')
+    parser.add_argument('--per-field-max-fields', type=int, default=1000,
+                        help='largest payload measured in per_field mode (its total output grows quadratically)')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"unknown mode(s) {', '.join(unknown)}; choose from {', '.join(MODES)}")
+
+    generator = SimpleTestCaseGenerator()
+    results = []
+    for mode in modes:
+        for depth in args.depths:
+            for fields in args.fields:
+                if mode == 'per_field' and fields > args.per_field_max_fields:
+                    continue
+                api_info = api_info_for(synthetic_payload(fields, depth))
+                result = measure(generator, api_info, MODES[mode], args.repeats)
+                results.append(dict(mode=mode, depth=depth, fields=fields, **result))
+
+    violations = check_scaling(results, args.slack)
+    report = {
+        'python': sys.version.split()[0],
+        'repeats': args.repeats,
+        'slack': args.slack,
+        'results': results,
+        'violations': violations
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""
+Generate-and-execute pipeline benchmark.
+
+Starts a local stub target with configurable latency, error rate and body
+size, then drives the service's endpoints against it:
+- test-api: POST /api/test-api (capture the target's response)
+- generate-tests: POST /api/generate-tests with the rule-based generator
+  (generate the suite and execute every case against the stub)
+- execute-test-case: POST /api/execute-test-case
+
+Every (client, scenario) sample runs in a fresh interpreter, so its peak RSS
+is its own. The 'test' client calls the app in-process through Flask's test
+client; the 'server' client runs the app on a real (threaded werkzeug) server
+and sends HTTP requests to it from the same process.
+
+Usage: python benchmarks/pipeline.py [--requests 50] [--concurrency 4]
+       [--latency-ms 5] [--error-rate 0.05] [--body-size 1024]
+       [--clients test,server] [--scenarios test-api,generate-tests,execute-test-case]
+       [--seed 1] [--output report.json]
+Prints a JSON report with cases/sec, latency percentiles and peak RSS per sample.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLIENTS = ('test', 'server')
+SCENARIOS = ('test-api', 'generate-tests', 'execute-test-case')
+
+
+class StubTarget:
+    """Local HTTP target answering every request after latency_ms, with error_rate 500s and body_size-byte bodies"""
+
+    def __init__(self, latency_ms=5.0, error_rate=0.0, body_size=1024, seed=1):
+        self.latency = latency_ms / 1000.0
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        filler = max(body_size - len('{"ok":true,"data":""}'), 0)
+        self.body = json.dumps({'ok': True, 'data': 'x' * filler}).encode()
+        self.error_body = json.dumps({'error': 'stub failure'}).encode()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+
+    def _handler(self):
+        target = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are separate writes; with Nagle's algorithm the
+            # body would wait for the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def respond(self):
+                length = int(self.headers.get('content-length') or 0)
+                if length:
+                    self.rfile.read(length)
+                with target.random_lock:
+                    failed = target.random.random() < target.error_rate
+                if target.latency:
+                    time.sleep(target.latency)
+                body = target.error_body if failed else target.body
+                self.send_response(500 if failed else 200)
+                self.send_header('content-type', 'application/json')
+                self.send_header('content-length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = respond
+
+        return Handler
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server.server_address[1]}/items'
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def scenario_request(scenario, target_url):
+    """The (path, JSON body) one iteration of a scenario posts"""
+    headers = {'content-type': 'application/json'}
+    payload = {'name': 'Widget', 'price': 9.99, 'quantity': 3, 'tags': ['a', 'b']}
+    if scenario == 'test-api':
+        return '/api/test-api', {'method': 'POST', 'url': target_url, 'headers': headers, 'payload': payload}
+    if scenario == 'generate-tests':
+        api_info = {'method': 'POST', 'url': target_url, 'headers': headers, 'payload': payload,
+                    'query_params': {}, 'response': {'status_code': 200, 'content': {'ok': True}}}
+        return '/api/generate-tests', {'api_info': api_info, 'use_ai': False}
+    return '/api/execute-test-case', {'test_case': {'method': 'POST', 'endpoint': target_url,
+                                                    'headers': headers, 'payload': payload}}
+
+
+def cases_in(scenario, response_json):
+    """Target requests made by one scenario iteration"""
+    if scenario == 'generate-tests':
+        return sum(len(cases) for cases in (response_json.get('test_cases') or {}).values())
+    return 1
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024
+
+
+def run_sample(client, scenario, target_url, requests_count, concurrency):
+    """Run one sample in this process (the benchmark's --sample mode) and return its result"""
+    sys.path.insert(0, REPO_ROOT)
+    from src.main import app
+    from src.services.load_test import LatencyHistogram
+
+    path, body = scenario_request(scenario, target_url)
+    local = threading.local()
+
+    if client == 'test':
+        def post():
+            if not hasattr(local, 'client'):
+                local.client = app.test_client()
+            response = local.client.post(path, json=body)
+            return response.status_code, response.get_json()
+        server = None
+    else:
+        import requests
+        from werkzeug.serving import make_server
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+
+        def post():
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+            response = local.session.post(base_url + path, json=body)
+            return response.status_code, response.json()
+
+    latency = LatencyHistogram()
+    lock = threading.Lock()
+    totals = {'cases': 0, 'errors': 0}
+
+    def iteration(_):
+        started = time.perf_counter()
+        try:
+            status_code, response_json = post()
+            failed = status_code >= 400 or not (response_json or {}).get('success', True)
+            cases = cases_in(scenario, response_json or {})
+        except Exception:
+            failed, cases = True, 0
+        elapsed = time.perf_counter() - started
+        with lock:
+            latency.record(elapsed)
+            totals['cases'] += cases
+            totals['errors'] += int(failed)
+
+    # One untimed warm-up request (imports, connection pools, table creation)
+    iteration(None)
+    latency = LatencyHistogram()
+    totals.update(cases=0, errors=0)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(iteration, range(requests_count)))
+    wall_time = time.perf_counter() - started
+
+    if server is not None:
+        server.shutdown()
+
+    return {
+        'client': client,
+        'scenario': scenario,
+        'requests': requests_count,
+        'concurrency': concurrency,
+        # Failed calls to the service itself (stub 500s are ordinary results)
+        'errors': totals['errors'],
+        'cases': totals['cases'],
+        'wall_time': wall_time,
+        'requests_per_sec': requests_count / wall_time if wall_time > 0 else None,
+        'cases_per_sec': totals['cases'] / wall_time if wall_time > 0 else None,
+        'latency': latency.summary(),
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def spawn_sample(client, scenario, target_url, args, tmp_dir):
+    env = dict(os.environ, RUN_STORE_DATABASE_URI=f"sqlite:///{os.path.join(tmp_dir, f'{client}-{scenario}.db')}")
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--sample', client, scenario, '--target', target_url,
+         '--requests', str(args.requests), '--concurrency', str(args.concurrency)],
+        capture_output=True, text=True, check=True, env=env, cwd=REPO_ROOT
+    ).stdout
+    # The app may print while running; the sample is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def csv_choices(value, choices):
+    values = [item.strip() for item in value.split(',') if item.strip()]
+    unknown = [item for item in values if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown value(s) {', '.join(unknown)}; choose from {', '.join(choices)}")
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the generate-and-execute pipeline against a stub target')
+    parser.add_argument('--requests', type=int, default=50, help='timed requests per sample')
+    parser.add_argument('--concurrency', type=int, default=4, help='requests in flight per sample')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='stub response latency')
+    parser.add_argument('--error-rate', type=float, default=0.05, help='fraction of stub responses that are 500s')
+    parser.add_argument('--body-size', type=int, default=1024, help='stub response body size in bytes')
+    parser.add_argument('--clients', type=lambda value: csv_choices(value, CLIENTS), default=list(CLIENTS))
+    parser.add_argument('--scenarios', type=lambda value: csv_choices(value, SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=1, help='seed of the stub error sequence')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    parser.add_argument('--sample', nargs=2, metavar=('CLIENT', 'SCENARIO'), help=argparse.SUPPRESS)
+    parser.add_argument('--target', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.sample:
+        client, scenario = args.sample
+        print(json.dumps(run_sample(client, scenario, args.target, args.requests, args.concurrency)))
+        return
+
+    stub = StubTarget(args.latency_ms, args.error_rate, args.body_size, args.seed)
+    with stub, tempfile.TemporaryDirectory() as tmp_dir:
+        samples = [
+            spawn_sample(client, scenario, stub.url, args, tmp_dir)
+            for client in args.clients
+            for scenario in args.scenarios
+        ]
+
+    report = {
+        'python': sys.version.split()[0],
+        'config': {
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'latency_ms': args.latency_ms,
+            'error_rate': args.error_rate,
+            'body_size': args.body_size,
+            'seed': args.seed
+        },
+        'samples': samples
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Cold-start benchmark.
+
+Each sample runs in a fresh interpreter and measures:
+- app_import: importing src.main (blueprint, models, run store)
+- first_ai_generator: the first get_ai_generator() call (lazy openai import + shared client)
+- openai_loaded_at_startup: whether importing the app already pulled in openai
+
+Usage: python benchmarks/startup.py [--runs 5]
+Prints a JSON report with the median and max of every timing.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_SCRIPT = r"""
+import json, sys, time
+sys.path.insert(0, {repo_root!r})
+start = time.perf_counter()
+import src.main
+app_import = time.perf_counter() - start
+openai_loaded = 'openai' in sys.modules
+
+from src.routes.api_testing import OPENAI_AVAILABLE, get_ai_generator
+first_ai_generator = None
+if OPENAI_AVAILABLE:
+    start = time.perf_counter()
+    get_ai_generator()
+    first_ai_generator = time.perf_counter() - start
+
+print(json.dumps({{
+    'app_import': app_import,
+    'first_ai_generator': first_ai_generator,
+    'openai_loaded_at_startup': openai_loaded
+}}))
+"""
+
+
+def run_sample(database_uri):
+    env = dict(os.environ, RUN_STORE_DATABASE_URI=database_uri)
+    output = subprocess.run(
+        [sys.executable, '-c', SAMPLE_SCRIPT.format(repo_root=REPO_ROOT)],
+        capture_output=True, text=True, check=True, env=env, cwd=REPO_ROOT
+    ).stdout
+    # The app may print while starting; the sample is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(values):
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    return {'median': statistics.median(values), 'max': max(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold-start time of the API testing service')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to sample')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_uri = f"sqlite:///{os.path.join(tmp_dir, 'startup.db')}"
+        samples = [run_sample(database_uri) for _ in range(args.runs)]
+
+    report = {
+        'runs': args.runs,
+        'python': sys.version.split()[0],
+        'app_import': summarize([sample['app_import'] for sample in samples]),
+        'first_ai_generator': summarize([sample['first_ai_generator'] for sample in samples]),
+        'openai_loaded_at_startup': any(sample['openai_loaded_at_startup'] for sample in samples)
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from flask import Flask, send_from_directory
 from flask_cors import CORS
+from src.models.run import db
 from src.routes.api_testing import api_testing_bp
 
 
@@ -16,6 +17,17 @@ CORS(app)
 
 app.register_blueprint(api_testing_bp, url_prefix='/api')
 
+# Run store: generated test cases and execution results, keyed by run id
+database_dir = os.path.join(os.path.dirname(__file__), 'database')
+os.makedirs(database_dir, exist_ok=True)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
+    'RUN_STORE_DATABASE_URI', f"sqlite:///{os.path.join(database_dir, 'app.db')}"
+)
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db.init_app(app)
+with app.app_context():
+    db.create_all()
+
 
 
 @app.route('/', defaults={'path': ''})
@@ -0,0 +1,70 @@
+import uuid
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+
+def new_run_id():
+    return uuid.uuid4().hex
+
+
+class Run(db.Model):
+    """One generate/execute run"""
+    __tablename__ = 'runs'
+
+    id = db.Column(db.String(32), primary_key=True, default=new_run_id)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    kind = db.Column(db.String(16), nullable=False, default='generate')
+    method = db.Column(db.String(16))
+    url = db.Column(db.Text)
+    used_ai = db.Column(db.Boolean, default=False)
+    status = db.Column(db.String(16), nullable=False, default='running')
+    summary = db.Column(db.Text)
+
+    cases = db.relationship('RunCase', backref='run', lazy='dynamic', cascade='all, delete-orphan')
+
+
+class RunCase(db.Model):
+    """A test case of a run, addressed by (category, position) or by its ordinal within the run"""
+    __tablename__ = 'run_cases'
+    __table_args__ = (
+        db.UniqueConstraint('run_id', 'category', 'position', name='uq_run_cases_position'),
+        db.UniqueConstraint('run_id', 'ordinal', name='uq_run_cases_ordinal'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    run_id = db.Column(db.String(32), db.ForeignKey('runs.id', ondelete='CASCADE'), nullable=False)
+    category = db.Column(db.String(32), nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    ordinal = db.Column(db.Integer, nullable=False)
+    # Case fields as JSON; the payload is kept separately as its serialized JSON text
+    data = db.Column(db.Text, nullable=False)
+    payload = db.Column(db.Text)
+
+    result = db.relationship('RunResult', backref='case', uselist=False, cascade='all, delete-orphan')
+
+
+class RunResult(db.Model):
+    """Execution result of a run case"""
+    __tablename__ = 'run_results'
+
+    id = db.Column(db.Integer, primary_key=True)
+    case_id = db.Column(db.Integer, db.ForeignKey('run_cases.id', ondelete='CASCADE'), nullable=False, unique=True)
+    run_id = db.Column(db.String(32), db.ForeignKey('runs.id', ondelete='CASCADE'), nullable=False, index=True)
+    success = db.Column(db.Boolean, nullable=False)
+    passed = db.Column(db.Boolean, nullable=False)
+    status_code = db.Column(db.Integer)
+    response_time = db.Column(db.Float)
+    data = db.Column(db.Text, nullable=False)
+
+
+class ResponseBlob(db.Model):
+    """A captured response body, stored once per content hash and referenced by results"""
+    __tablename__ = 'response_blobs'
+
+    sha256 = db.Column(db.String(64), primary_key=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    # Captured content as JSON (parsed JSON body, text or truncated preview)
+    content = db.Column(db.Text, nullable=False)
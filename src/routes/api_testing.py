@@ -1,20 +1,40 @@
-from flask import Blueprint, jsonify, request, session
+from flask import Blueprint, Response, current_app, jsonify, request, session, stream_with_context
 import requests
 import json
 import os
 import curlify
 import time
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from werkzeug.utils import secure_filename
 import traceback
-try:
-    from src.services.test_generator import TestCaseGenerator
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+import queue
+import importlib.util
+import copy
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from src.services.simple_test_generator import SimpleTestCaseGenerator
+from src.services.execution_engine import ExecutionEngine
+from src.services.test_executor import TestCaseExecutor, add_file
+from src.services.http_pool import get_pool_manager, COOKIE_MODES
+from src.services.async_executor import AsyncTestCaseExecutor, AsyncExecutionEngine
+from src.services.run_store import RunStore
+from src.services.response_capture import CAPTURE_CHUNK_SIZE, capture_body
+from src.services.response_bodies import content_ref
+from src.services.load_test import LoadTest
+from src.services.rate_limiter import RateLimiter
+from src.services.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY, RUN_STORE_BYTES, RUN_STORE_ROWS, SUITES_GENERATED
 
 api_testing_bp = Blueprint('api_testing', __name__)
+run_store = RunStore()
+
+# The AI generator pulls in the openai/pydantic stack, so it is only imported
+# the first time a request actually asks for AI generation
+OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
+
+def get_ai_generator():
+    """Import the AI generator on first use and return the shared instance"""
+    from src.services.test_generator import get_test_generator
+    return get_test_generator()
 
 # Configure upload folder
 UPLOAD_FOLDER = '/tmp/uploads'
@@ -23,32 +43,6 @@ ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'pdf', 'pptx', 'mp3', 'txt', 'csv',
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def get_mime_type(file_extension):
-    """Determine MIME type based on file extension"""
-    mime_types = {
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.pdf': 'application/pdf',
-        '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-        '.mp3': 'audio/mpeg',
-        '.txt': 'text/plain',
-        '.csv': 'text/csv',
-        '.json': 'application/json',
-        '.xml': 'application/xml'
-    }
-    return mime_types.get(file_extension.lower(), 'application/octet-stream')
-
-def add_file(file_path, file_variable_name):
-    """Create file tuple for requests"""
-    file_name = os.path.basename(file_path)
-    file_extension = os.path.splitext(file_name)[1].lower()
-    mime_type = get_mime_type(file_extension)
-
-    file_tuple = (file_name, open(file_path, 'rb'), mime_type)
-    files = {file_variable_name: file_tuple}
-    return files
-
 def convert_response_to_curl(response):
     """Convert requests response object to cURL command"""
     try:
@@ -57,6 +51,30 @@ def convert_response_to_curl(response):
     except Exception as e:
         return f"# Failed to generate cURL command: {str(e)}"
 
+EXECUTION_BACKENDS = ('thread', 'async')
+
+def create_execution_engine(options):
+    """
+    Build the execution engine for a run from its request options:
+    backend ('thread' or 'async'), max_concurrency, cookie_mode, http2 and the
+    per-host rate limit (rate_limit_rps, rate_limit_burst)
+    """
+    backend = options.get('backend', 'thread')
+    cookie_mode = options.get('cookie_mode', 'isolated')
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(EXECUTION_BACKENDS)}")
+    if cookie_mode not in COOKIE_MODES:
+        raise ValueError(f"cookie_mode must be one of {', '.join(COOKIE_MODES)}")
+    rate_limiter = RateLimiter.from_options(options)
+
+    if backend == 'async':
+        cookies = get_pool_manager().shared_cookies if cookie_mode == 'shared' else None
+        executor = AsyncTestCaseExecutor(http2=bool(options.get('http2')), cookies=cookies, rate_limiter=rate_limiter)
+        return AsyncExecutionEngine(executor, max_workers=options.get('max_concurrency'))
+
+    executor = TestCaseExecutor(cookie_mode=cookie_mode, rate_limiter=rate_limiter)
+    return ExecutionEngine(executor.run, max_workers=options.get('max_concurrency'))
+
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
@@ -68,64 +86,15 @@ def execute_test_case():
         if not test_case:
             return jsonify({'error': 'Test case is required'}), 400
 
-        method = test_case.get('method', 'GET').upper()
-        url = test_case.get('endpoint', '')
-        headers = test_case.get('headers', {})
-        payload = test_case.get('payload', {})
-        query_params = test_case.get('query_params', {})
-        file_path = test_case.get('file_path')
-
-        if not url:
-            return jsonify({'error': 'URL is required'}), 400
-
-        request_kwargs = {
-            'url': url,
-            'headers': headers,
-            'params': query_params,
-            'timeout': 30
-        }
-
-        files_dict = None
-        if file_path and os.path.exists(file_path) and method in ['POST', 'PUT', 'PATCH']:
-            files_dict = add_file(file_path, 'file')
-            request_kwargs['files'] = files_dict
-            if payload:
-                request_kwargs['data'] = payload
-        elif method in ['POST', 'PUT', 'PATCH'] and payload:
-            if headers.get('content-type', '').lower() == 'application/json':
-                request_kwargs['json'] = payload
-            else:
-                request_kwargs['data'] = payload
-
-        start_time = time.time()
-        response = requests.request(method, **request_kwargs)
-        response_time = time.time() - start_time
-
-        response_data = {
-            'status_code': response.status_code,
-            'headers': dict(response.headers),
-            'content': None,
-            'content_type': response.headers.get('content-type', ''),
-            'response_time': response_time
-        }
-
+        executor = TestCaseExecutor()
         try:
-            if 'application/json' in response_data['content_type']:
-                response_data['content'] = response.json()
-            else:
-                response_data['content'] = response.text
-        except:
-            response_data['content'] = response.text
-
-        if files_dict:
-            for file_tuple in files_dict.values():
-                if hasattr(file_tuple[1], 'close'):
-                    file_tuple[1].close()
+            response_data = executor.execute(test_case)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
         return jsonify({
             'success': True,
             'response': response_data,
-            # 'curl_command': convert_response_to_curl(response)
         })
 
     except requests.exceptions.RequestException as e:
@@ -137,7 +106,7 @@ def execute_test_case():
         return jsonify({
             'success': False,
             'error': f'Unexpected error: {str(e)}'
-        }),
+        }), 500
 
 
 @api_testing_bp.route('/test-api', methods=['POST'])
@@ -206,29 +175,19 @@ def test_api():
             else:
                 request_kwargs['data'] = payload
 
-        # Make the API request
-        response = requests.request(method, **request_kwargs)
-
-        # Generate cURL command
-        curl_command = convert_response_to_curl(response)
+        # Make the API request over a pooled keep-alive connection, streaming
+        # the body so only MAX_CAPTURE_BYTES of it are kept
+        response = get_pool_manager().session().request(method, stream=True, **request_kwargs)
+        try:
+            body = capture_body(response.iter_content(CAPTURE_CHUNK_SIZE))
+        finally:
+            response.close()
 
         # Capture response details
-        response_data = {
-            'status_code': response.status_code,
-            'headers': dict(response.headers),
-            'content': None,
-            'content_type': response.headers.get('content-type', ''),
-            'curl_command': curl_command
-        }
+        response_data = TestCaseExecutor.capture_response(response, body=body)
 
-        # Try to parse response content
-        try:
-            if 'application/json' in response_data['content_type']:
-                response_data['content'] = response.json()
-            else:
-                response_data['content'] = response.text
-        except:
-            response_data['content'] = response.text
+        # Generate cURL command
+        response_data['curl_command'] = convert_response_to_curl(response)
 
         # Clean up uploaded file
         if files_dict:
@@ -272,9 +231,138 @@ def test_api():
         }), 500
 
 
+def generate_suite(api_info, use_ai, use_cache=True, fan_out=False, per_field=False):
+    """
+    Generate test cases with the AI generator when requested and available, else the simple one.
+    use_cache=False bypasses the generation cache and always calls the model;
+    fan_out requests each category in its own concurrent completion;
+    per_field adds one rule-based case per payload field and field rule.
+    """
+    if use_ai and OPENAI_AVAILABLE:
+        try:
+            generator = get_ai_generator()
+            return generator.generate_test_cases(api_info, include_curl=False, use_cache=use_cache, fan_out=fan_out)
+        except Exception as e:
+            print(f"OpenAI generation failed, falling back to simple generator: {str(e)}")
+    generator = SimpleTestCaseGenerator()
+    SUITES_GENERATED.inc(generator='simple')
+    return generator.generate_tests(api_info, include_curl=False, per_field=per_field)
+
+
+# Hedged generation: the rule-based suite runs right away while the AI suite is
+# generated in the background; AI cases that miss the deadline are attached to
+# the run later (see /api/runs/<run_id>)
+HEDGE_TIMEOUT = float(os.getenv('GENERATION_HEDGE_TIMEOUT', '10'))
+hedge_pool = ThreadPoolExecutor(max_workers=int(os.getenv('GENERATION_HEDGE_WORKERS', '4')),
+                                thread_name_prefix='hedged-ai')
+
+def merge_ai_cases(run_id, test_cases, ai_test_cases, api_info, engine):
+    """
+    Append AI cases after the rule-based ones of each category, execute them and
+    store them with the run. Returns the execution summary of the AI cases.
+    """
+    offsets = {category: len(test_cases.get(category, [])) for category in ai_test_cases}
+    for cases in ai_test_cases.values():
+        for case in cases:
+            case['source'] = 'ai'
+    run_store.add_cases(run_id, (
+        (category, offsets[category] + index, case)
+        for category, cases in ai_test_cases.items()
+        for index, case in enumerate(cases)
+    ))
+
+    executed_ai_cases, ai_summary = engine.run(ai_test_cases, api_info)
+    run_store.record_results(run_id, (
+        (category, offsets[category] + index, case['execution_result'], engine.case_passed(case))
+        for category, cases in executed_ai_cases.items()
+        for index, case in enumerate(cases)
+    ), engine.response_bodies)
+    for category, cases in executed_ai_cases.items():
+        test_cases.setdefault(category, []).extend(cases)
+    return ai_summary
+
+def attach_ai_cases(app, ai_future, run_id, test_cases, api_info, options, execution_summary):
+    """Background job: attach an AI suite that missed the hedge deadline to its run"""
+    with app.app_context():
+        hedge = execution_summary['hedge']
+        try:
+            ai_test_cases = ai_future.result()
+            ai_summary = merge_ai_cases(run_id, test_cases, ai_test_cases, api_info,
+                                        create_execution_engine(options))
+            hedge.update(ai_status='attached', ai_cases=ai_summary['total_cases'], ai_execution_summary=ai_summary)
+        except Exception as e:
+            print(f"Hedged AI generation failed for run {run_id}: {str(e)}")
+            hedge.update(ai_status='failed', ai_error=str(e))
+        run_store.finish_run(run_id, execution_summary)
+
+def run_hedged(api_info, options, engine, hedge_timeout):
+    """
+    Start AI generation in the background, generate and execute the rule-based
+    suite immediately, then merge the AI cases if they arrive within hedge_timeout
+    seconds. Later AI cases are attached to the run once they are ready.
+    If the AI generator cannot be created, the run has the rule-based cases only.
+    """
+    deadline = time.monotonic() + hedge_timeout
+    ai_future = None
+    try:
+        generator = get_ai_generator()
+        ai_future = hedge_pool.submit(
+            generator.generate_test_cases, api_info, include_curl=False,
+            use_cache=not options.get('bypass_cache'), fan_out=bool(options.get('fan_out')), fallback=False
+        )
+    except Exception as e:
+        print(f"OpenAI generator unavailable, running the rule-based suite only: {str(e)}")
+        ai_error = str(e)
+
+    test_cases = SimpleTestCaseGenerator().generate_tests(api_info, include_curl=False,
+                                                          per_field=bool(options.get('per_field')))
+    SUITES_GENERATED.inc(generator='simple')
+    for cases in test_cases.values():
+        for case in cases:
+            case['source'] = 'rules'
+    run_id = run_store.create_run(test_cases, api_info, used_ai=True)
+
+    executed_test_cases, execution_summary = engine.run(test_cases, api_info)
+    run_store.record_results(run_id, (
+        (category, index, case['execution_result'], engine.case_passed(case))
+        for category, cases in executed_test_cases.items()
+        for index, case in enumerate(cases)
+    ), engine.response_bodies)
+
+    hedge = execution_summary['hedge'] = {'timeout': hedge_timeout, 'ai_status': 'pending'}
+    if ai_future is None:
+        hedge.update(ai_status='failed', ai_error=ai_error)
+        run_store.finish_run(run_id, execution_summary)
+        return run_id, executed_test_cases, execution_summary
+    try:
+        ai_test_cases = ai_future.result(timeout=max(0.0, deadline - time.monotonic()))
+        ai_engine = create_execution_engine(options)
+        ai_summary = merge_ai_cases(run_id, executed_test_cases, ai_test_cases, api_info, ai_engine)
+        engine.response_bodies.update(ai_engine.response_bodies)
+        hedge.update(ai_status='merged', ai_cases=ai_summary['total_cases'], ai_execution_summary=ai_summary)
+        run_store.finish_run(run_id, execution_summary)
+    except FutureTimeoutError:
+        run_store.finish_run(run_id, execution_summary, status='ai_pending')
+        app = current_app._get_current_object()
+        attached_cases = OrderedDict((category, list(cases)) for category, cases in executed_test_cases.items())
+        ai_future.add_done_callback(lambda future: hedge_pool.submit(
+            attach_ai_cases, app, future, run_id, attached_cases, api_info, options, copy.deepcopy(execution_summary)
+        ))
+    except Exception as e:
+        print(f"Hedged AI generation failed for run {run_id}: {str(e)}")
+        hedge.update(ai_status='failed', ai_error=str(e))
+        run_store.finish_run(run_id, execution_summary)
+
+    return run_id, executed_test_cases, execution_summary
+
+
 @api_testing_bp.route('/generate-tests', methods=['POST'])
 def generate_tests():
-    """Generate test cases and execute them immediately"""
+    """
+    Generate test cases and execute them immediately.
+    With hedge (and AI generation), the rule-based suite runs first and AI cases
+    are merged if they are ready within hedge_timeout seconds.
+    """
     try:
         data = request.json
         api_info = data.get('api_info', {})
@@ -283,98 +371,316 @@ def generate_tests():
         if not api_info:
             return jsonify({'error': 'API information is required'}), 400
 
-        # Determine which generator to use
-        if use_ai and OPENAI_AVAILABLE:
+        try:
+            engine = create_execution_engine(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        if data.get('hedge') and use_ai and OPENAI_AVAILABLE:
             try:
-                generator = TestCaseGenerator()
-                test_cases = generator.generate_test_cases(api_info, include_curl=True)
-            except Exception as e:
-                print(f"OpenAI generation failed, falling back to simple generator: {str(e)}")
-                generator = SimpleTestCaseGenerator()
-                test_cases = generator.generate_tests(api_info)
+                hedge_timeout = float(data.get('hedge_timeout', HEDGE_TIMEOUT))
+            except (TypeError, ValueError):
+                return jsonify({'error': 'hedge_timeout must be a number of seconds'}), 400
+            run_id, executed_test_cases, execution_summary = run_hedged(api_info, data, engine, hedge_timeout)
+        else:
+            test_cases = generate_suite(api_info, use_ai, use_cache=not data.get('bypass_cache'),
+                                        fan_out=bool(data.get('fan_out')), per_field=bool(data.get('per_field')))
+            run_id = run_store.create_run(test_cases, api_info, used_ai=use_ai and OPENAI_AVAILABLE)
+
+            # Execute all test cases concurrently and in-process
+            executed_test_cases, execution_summary = engine.run(test_cases, api_info)
+
+            run_store.record_results(run_id, (
+                (category, index, case['execution_result'], engine.case_passed(case))
+                for category, cases in executed_test_cases.items()
+                for index, case in enumerate(cases)
+            ), engine.response_bodies)
+            run_store.finish_run(run_id, execution_summary)
+
+        # Only the run id goes into the (cookie) session; download reads the run store
+        session['last_run_id'] = run_id
+
+        return jsonify({
+            'success': True,
+            'run_id': run_id,
+            'test_cases': executed_test_cases,
+            # Execution results reference their response body by content_ref
+            'response_bodies': engine.response_bodies.bodies,
+            'message': 'Test cases generated and executed successfully',
+            'used_ai': use_ai and OPENAI_AVAILABLE,
+            'execution_summary': execution_summary
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Test generation failed: {str(e)}'
+        }), 500
+
+
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream'
+}
+
+def format_stream_frame(frame, stream_format):
+    """Serialize one stream frame as an NDJSON line or a Server-Sent Event"""
+    body = json.dumps(frame)
+    if stream_format == 'sse':
+        return f"event: {frame['type']}\ndata: {body}\n\n"
+    return body + "\n"
+
+
+@api_testing_bp.route('/generate-tests/stream', methods=['POST'])
+def generate_tests_stream():
+    """
+    Generate test cases and stream each execution result as soon as it finishes.
+    Frames: one 'suite' frame with the generated cases, one 'case' frame per
+    executed case (in completion order) and a final 'summary' frame.
+    With AI generation (and stream_generation not disabled) the 'suite' frame is
+    empty and each case arrives in a 'test_case' frame as soon as the model has
+    written it; it starts executing right away.
+    NDJSON by default; Server-Sent Events with ?format=sse or Accept: text/event-stream
+    """
+    try:
+        data = request.json
+        api_info = data.get('api_info', {})
+        use_ai = data.get('use_ai', True)
+        use_cache = not data.get('bypass_cache')
+
+        if not api_info:
+            return jsonify({'error': 'API information is required'}), 400
+
+        stream_format = request.args.get('format')
+        if not stream_format:
+            stream_format = 'sse' if 'text/event-stream' in request.headers.get('Accept', '') else 'ndjson'
+        if stream_format not in STREAM_FORMATS:
+            return jsonify({'error': f"format must be one of {', '.join(STREAM_FORMATS)}"}), 400
+
+        try:
+            engine = create_execution_engine(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        fan_out = bool(data.get('fan_out'))
+        # Fan-out generation returns the whole suite at once, so it is not streamed
+        stream_generation = use_ai and OPENAI_AVAILABLE and data.get('stream_generation', True) and not fan_out
+        if stream_generation:
+            # Cases are added to the run as the model produces them
+            test_cases = OrderedDict()
         else:
-            generator = SimpleTestCaseGenerator()
-            test_cases = generator.generate_tests(api_info)
+            test_cases = generate_suite(api_info, use_ai, use_cache=use_cache, fan_out=fan_out,
+                                        per_field=bool(data.get('per_field')))
+        run_id = run_store.create_run(test_cases, api_info, used_ai=use_ai and OPENAI_AVAILABLE)
 
-        # Execute all test cases and store responses
-        executed_test_cases = {}
+        # The session cookie is written with the response headers, before any frame is sent
+        session['last_run_id'] = run_id
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Test generation failed: {str(e)}'
+        }), 500
+
+    # Generated cases are handed to the engine from its feeder thread; the frames
+    # (and run store writes) for them are emitted from this request's thread
+    generated = queue.Queue()
+
+    def generated_cases():
+        generator = get_ai_generator()
+        for category, index, case in generator.iter_test_cases(api_info, include_curl=False, use_cache=use_cache):
+            generated.put((category, index, case))
+            yield category, index, case
+
+    def flush_generated():
+        while True:
+            try:
+                category, index, case = generated.get_nowait()
+            except queue.Empty:
+                return
+            test_cases.setdefault(category, []).append(case)
+            run_store.add_case(run_id, category, index, case)
+            yield format_stream_frame({
+                'type': 'test_case',
+                'category': category,
+                'index': index,
+                'test_case': {k: v for k, v in case.items() if k != 'execution_result'}
+            }, stream_format)
+
+    def generate_frames():
+        results = None
+        finished = False
+        try:
+            yield format_stream_frame({
+                'type': 'suite',
+                'run_id': run_id,
+                'test_cases': test_cases,
+                'total_cases': None if stream_generation else sum(len(cases) for cases in test_cases.values()),
+                'used_ai': use_ai and OPENAI_AVAILABLE
+            }, stream_format)
+            if stream_generation:
+                results = engine.iter_run_stream(generated_cases(), api_info)
+            else:
+                results = engine.iter_run(test_cases, api_info)
+            sent_refs = set()
+            for category, index, case in results:
+                yield from flush_generated()
+                run_store.record_result(run_id, category, index, case['execution_result'],
+                                        engine.case_passed(case), engine.response_bodies)
+                # Each distinct response body is sent once, with the first case that returned it
+                ref = content_ref(case['execution_result'])
+                new_refs = [ref] if ref and ref not in sent_refs else []
+                sent_refs.update(new_refs)
+                yield format_stream_frame({
+                    'type': 'case',
+                    'category': category,
+                    'index': index,
+                    'execution_result': case['execution_result'],
+                    'response_bodies': engine.response_bodies.subset(new_refs)
+                }, stream_format)
+            yield from flush_generated()
+            run_store.finish_run(run_id, engine.summary)
+            finished = True
+            yield format_stream_frame({
+                'type': 'summary',
+                'success': True,
+                'message': 'Test cases generated and executed successfully',
+                'execution_summary': engine.summary
+            }, stream_format)
+        except Exception as e:
+            run_store.finish_run(run_id, engine.summary, status='failed')
+            finished = True
+            yield format_stream_frame({
+                'type': 'error',
+                'success': False,
+                'error': f'Test execution failed: {str(e)}'
+            }, stream_format)
+        finally:
+            # The client went away mid-stream (GeneratorExit): stop executing
+            # and keep what was recorded so far as an aborted run
+            if not finished:
+                if results is not None:
+                    results.close()
+                run_store.finish_run(run_id, engine.summary, status='aborted')
+
+    return Response(
+        stream_with_context(generate_frames()),
+        mimetype=STREAM_FORMATS[stream_format],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def normalize_batch(test_cases):
+    """
+    Accept a batch as a plain list of cases, a {category: [cases]} dict or the
+    downloaded test_cases.json layout ([{category, test_cases}]) and return an
+    ordered {category: [cases]} dict without stale execution results
+    """
+    batch = OrderedDict()
+
+    def add_case(category, case):
+        if not isinstance(case, dict):
+            raise ValueError('Each test case must be a JSON object')
+        case = {k: v for k, v in case.items() if k != 'execution_result'}
+        batch.setdefault(category, []).append(case)
+
+    if isinstance(test_cases, dict):
         for category, cases in test_cases.items():
-            executed_test_cases[category] = []
             for case in cases:
-                # Prepare test case for execution
-                test_case_to_execute = {
-                    'method': case.get('method', api_info.get('method', 'GET')),
-                    'endpoint': case.get('endpoint', api_info.get('url', '')),
-                    'headers': case.get('headers', api_info.get('headers', {})),
-                    'payload': case.get('payload', api_info.get('payload', {})),
-                    'query_params': case.get('query_params', api_info.get('query_params', {}))
-                }
-
-                # Execute the test case
-                exec_response = requests.post(
-                    urljoin(request.host_url, '/api/execute-test-case'),
-                    json={'test_case': test_case_to_execute},
-                    headers={'Content-Type': 'application/json'}
-                )
-
-                if exec_response.ok:
-                    execution_result = exec_response.json()
-                    # print(exec_response.json())
-
-                    case['execution_result'] = execution_result
-                else:
-                    case['execution_result'] = {
-                        'success': False,
-                        'error': 'Failed to execute test case'
-                    }
+                add_case(category, case)
+    elif isinstance(test_cases, list):
+        for item in test_cases:
+            if isinstance(item, dict) and isinstance(item.get('test_cases'), list):
+                for case in item['test_cases']:
+                    add_case(item.get('category', 'Batch'), case)
+            else:
+                add_case(item.get('category', 'Batch') if isinstance(item, dict) else 'Batch', item)
+    else:
+        raise ValueError('test_cases must be a list or an object of categories')
+
+    return batch
 
-                executed_test_cases[category].append(case)
 
-        # In your generate_tests route:
-        minimized_test_cases = {}
+@api_testing_bp.route('/execute-batch', methods=['POST'])
+def execute_batch():
+    """
+    Execute a batch of stored test cases with shared connection pools.
+    Accepts JSON ({"test_cases": [...], options...} or a downloaded test_cases.json
+    array) or a multipart upload of test_cases.json in the 'file' field.
+    Options: max_concurrency, backend, cookie_mode, http2, fail_fast,
+    rate_limit_rps and rate_limit_burst (per target host)
+    """
+    try:
+        if request.is_json:
+            data = request.json
+            if isinstance(data, list):
+                data = {'test_cases': data}
+        else:
+            uploaded_file = request.files.get('file')
+            if not uploaded_file:
+                return jsonify({'error': 'Test cases are required'}), 400
+            data = {k: v for k, v in request.form.items()}
+            try:
+                data['test_cases'] = json.loads(uploaded_file.read())
+            except ValueError:
+                return jsonify({'error': 'Uploaded file is not valid JSON'}), 400
+            for flag in ('fail_fast', 'http2'):
+                if flag in data:
+                    data[flag] = data[flag].lower() in ('1', 'true', 'yes')
+
+        if not data.get('test_cases'):
+            return jsonify({'error': 'Test cases are required'}), 400
+
+        try:
+            test_cases = normalize_batch(data['test_cases'])
+            engine = create_execution_engine(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        run_id = run_store.create_run(test_cases, kind='batch')
+        executed_test_cases, execution_summary = engine.run(
+            test_cases, {}, fail_fast=bool(data.get('fail_fast'))
+        )
+
+        results = []
         for category, cases in executed_test_cases.items():
-            minimized_test_cases[category] = []
-            for case in cases:
-                minimized_case = {
+            for index, case in enumerate(cases):
+                results.append({
+                    'category': category,
+                    'index': index,
                     'description': case.get('description'),
-                    'method': case.get('method'),
-                    'endpoint': case.get('endpoint'),
-                    'headers': case.get('headers'),
                     'expected_status': case.get('expected_status'),
-                }
-                # Only add query_params if they exist and are not empty
-                if case.get('query_params'):
-                    minimized_case['query_params'] = case['query_params']
-
-                # Only add payload if it exists and is not empty
-                if case.get('payload'):
-                    minimized_case['payload'] = case['payload']
-
-                minimized_test_cases[category].append(minimized_case)
+                    'passed': engine.case_passed(case),
+                    'execution_result': case['execution_result']
+                })
 
-        print(minimized_test_cases)
-        print("###############################################")
-        # Store in session for download
-        session['last_test_cases'] = minimized_test_cases
+        run_store.record_results(run_id, (
+            (result['category'], result['index'], result['execution_result'], result['passed'])
+            for result in results
+        ), engine.response_bodies)
+        run_store.finish_run(run_id, execution_summary)
 
         return jsonify({
             'success': True,
-            'test_cases': executed_test_cases,
-            'message': 'Test cases generated and executed successfully',
-            'used_ai': use_ai and OPENAI_AVAILABLE
+            'run_id': run_id,
+            'results': results,
+            'response_bodies': engine.response_bodies.bodies,
+            'summary': execution_summary
         })
 
     except Exception as e:
         return jsonify({
             'success': False,
-            'error': f'Test generation failed: {str(e)}'
+            'error': f'Batch execution failed: {str(e)}'
         }), 500
 
 
 @api_testing_bp.route('/download-tests', methods=['POST'])
 def download_tests():
     try:
-        test_cases = session.get('last_test_cases')
+        data = request.get_json(silent=True) or {}
+        run_id = data.get('run_id') or session.get('last_run_id')
+        test_cases = run_store.get_test_cases(run_id)
         if not test_cases:
             return jsonify({'error': 'No test cases available'}), 404
 
@@ -387,10 +693,7 @@ def download_tests():
             if category in test_cases and test_cases[category]:
                 ordered_test_cases.append({
                     "category": category,
-                    "test_cases": [
-                        {k: v for k, v in case.items() if k != 'curl_command'}
-                        for case in test_cases[category]
-                    ]
+                    "test_cases": test_cases[category]
                 })
 
         # Return as JSON with ensure_ascii=False for better readability
@@ -404,6 +707,95 @@ def download_tests():
             'error': f'Download failed: {str(e)}'
         }), 500
 
+@api_testing_bp.route('/runs/<run_id>', methods=['GET'])
+def get_run(run_id):
+    """Return a stored run with its test cases and execution results"""
+    run = run_store.get_run(run_id)
+    if run is None:
+        return jsonify({'error': 'Run not found'}), 404
+    return jsonify(run)
+
+def case_curl_response(run_id, run_case):
+    if run_case is None:
+        return jsonify({'error': 'Test case not found'}), 404
+    return jsonify({
+        'run_id': run_id,
+        'category': run_case.category,
+        'position': run_case.position,
+        'ordinal': run_case.ordinal,
+        'curl_command': run_store.curl_command(run_case)
+    })
+
+@api_testing_bp.route('/runs/<run_id>/cases/<int:ordinal>/curl', methods=['GET'])
+def get_case_curl(run_id, ordinal):
+    """curl command of the n-th case of a run, rendered on demand"""
+    return case_curl_response(run_id, run_store.get_case(run_id, ordinal))
+
+@api_testing_bp.route('/runs/<run_id>/cases/<category>/<int:position>/curl', methods=['GET'])
+def get_case_curl_at(run_id, category, position):
+    """curl command of a case addressed by category and position (as the UI shows it)"""
+    return case_curl_response(run_id, run_store.get_case_at(run_id, category, position))
+
+@api_testing_bp.route('/load-test', methods=['POST'])
+def load_test():
+    """
+    Run one test case under load and report latency percentiles, throughput
+    and errors. The case is given inline (test_case) or taken from a stored
+    run: run_id (default: the last run) with ordinal, or category and
+    position (default: the first Positive case).
+    Options: duration (seconds), concurrency and rps (open-loop rate; without
+    it the test runs closed-loop with concurrency workers)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            test_case = data.get('test_case')
+            if test_case is not None and not isinstance(test_case, dict):
+                raise ValueError('test_case must be a JSON object')
+            if not test_case:
+                run_id = data.get('run_id') or session.get('last_run_id')
+                if data.get('ordinal') is not None:
+                    run_case = run_store.get_case(run_id, int(data['ordinal']))
+                else:
+                    run_case = run_store.get_case_at(run_id, data.get('category', 'Positive'),
+                                                     int(data.get('position', 0)))
+                if run_case is None:
+                    return jsonify({'error': 'Test case not found'}), 404
+                test_case = run_store.replay_case(run_case)
+            if not test_case.get('endpoint'):
+                raise ValueError('URL is required')
+
+            load = LoadTest(TestCaseExecutor().run, test_case, duration=data.get('duration'),
+                            concurrency=data.get('concurrency'), rps=data.get('rps'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        report = load.run()
+        run_id = run_store.create_run({'Load': [test_case]}, kind='load')
+        run_store.finish_run(run_id, report)
+
+        return jsonify({
+            'success': True,
+            'run_id': run_id,
+            'report': report
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Load test failed: {str(e)}'
+        }), 500
+
+@api_testing_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Service metrics in the Prometheus text format"""
+    stats = run_store.stats()
+    for table, rows in stats['rows'].items():
+        RUN_STORE_ROWS.set(rows, table=table)
+    if stats['size_bytes'] is not None:
+        RUN_STORE_BYTES.set(stats['size_bytes'])
+    return Response(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
 @api_testing_bp.route('/health', methods=['GET'])
 def health_check():
     """
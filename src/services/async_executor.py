@@ -0,0 +1,185 @@
+import asyncio
+import importlib.util
+import os
+import queue
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+import httpx
+
+from src.services.execution_engine import ExecutionEngine, FeedFinished, drain_completed
+from src.services.metrics import EXECUTIONS_IN_FLIGHT, observe_target_request
+from src.services.phase_timing import PhaseTimer
+from src.services.rate_limiter import RateLimiter
+from src.services.response_capture import CAPTURE_CHUNK_SIZE, capture_body_async
+from src.services.test_executor import DEFAULT_TIMEOUT, TestCaseExecutor, build_request, close_files
+
+# A single event loop can keep far more requests in flight than a thread
+# pool, so the async backend has its own (much higher) concurrency bounds
+DEFAULT_ASYNC_CONCURRENCY = int(os.getenv('ASYNC_EXECUTION_CONCURRENCY', '100'))
+ASYNC_CONCURRENCY_LIMIT = int(os.getenv('ASYNC_EXECUTION_CONCURRENCY_LIMIT', '1000'))
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+def to_httpx_kwargs(request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate requests-style kwargs from build_request into httpx kwargs"""
+    httpx_kwargs = dict(request_kwargs)
+    data = httpx_kwargs.get('data')
+    # requests sends a str/bytes `data` as the raw body; httpx calls that `content`
+    if isinstance(data, (str, bytes)):
+        httpx_kwargs['content'] = httpx_kwargs.pop('data')
+    return httpx_kwargs
+
+
+class AsyncTestCaseExecutor:
+    """
+    Execute test cases on an httpx.AsyncClient, producing the same
+    result shape as TestCaseExecutor.run
+    """
+
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT, http2: bool = False, cookies=None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.cookies = cookies
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            print("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+
+    def client(self, max_connections: int) -> httpx.AsyncClient:
+        """
+        Create a client whose connection pool matches the run's concurrency.
+        Redirects are followed like requests does, so both backends report the
+        final response.
+        """
+        return httpx.AsyncClient(
+            http2=self.http2,
+            cookies=self.cookies,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+
+    async def execute(self, client: httpx.AsyncClient, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send the request for a test case and return the captured response data
+        (body streamed), with phase timings taken from httpcore's trace events
+        """
+        method, request_kwargs, files_dict = build_request(test_case, self.timeout)
+        timer = PhaseTimer(resolves_dns=False)
+        try:
+            waited = None
+            if self.rate_limiter is not None and not test_case.get('rate_limit_exempt'):
+                waited = await self.rate_limiter.acquire_async(request_kwargs['url'])
+            with EXECUTIONS_IN_FLIGHT.track(backend='async'):
+                sent_at = time.monotonic()
+                start_time = time.perf_counter()
+                async with client.stream(method, extensions={'trace': timer.trace},
+                                         **to_httpx_kwargs(request_kwargs)) as response:
+                    with timer.phase('download'):
+                        body = await capture_body_async(response.aiter_bytes(CAPTURE_CHUNK_SIZE))
+                response_time = time.perf_counter() - start_time
+            observe_target_request(request_kwargs['url'], response_time)
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(request_kwargs['url'], response.status_code, response.headers,
+                                         sent_at=sent_at, exempt=bool(test_case.get('rate_limit_exempt')))
+            response_data = TestCaseExecutor.capture_response(response, response_time, body, timer)
+            if waited is not None:
+                response_data['rate_limit_wait'] = waited
+            return response_data
+        finally:
+            close_files(files_dict)
+
+    async def run(self, client: httpx.AsyncClient, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a test case and wrap the outcome like TestCaseExecutor.run"""
+        try:
+            return {
+                'success': True,
+                'response': await self.execute(client, test_case)
+            }
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        except httpx.HTTPError as e:
+            return {
+                'success': False,
+                'error': f'Request failed: {str(e)}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Unexpected error: {str(e)}'
+            }
+
+
+class AsyncExecutionEngine(ExecutionEngine):
+    """
+    ExecutionEngine backend that runs every case from one event loop,
+    bounded by a semaphore instead of a thread pool
+    """
+
+    backend = 'async'
+    default_workers = DEFAULT_ASYNC_CONCURRENCY
+    workers_limit = ASYNC_CONCURRENCY_LIMIT
+
+    def __init__(self, executor: AsyncTestCaseExecutor, max_workers: Optional[int] = None):
+        super().__init__(None, max_workers=max_workers)
+        self.executor = executor
+
+    def iter_completed(self, prepared_cases: Iterable[Dict[str, Any]],
+                       halt: Optional[threading.Event] = None) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+        """
+        Run the event loop on a helper thread and yield (position, result, elapsed)
+        to the calling (synchronous) code as each case finishes. halt works as in
+        ExecutionEngine.iter_completed.
+        """
+        completed = queue.Queue()
+        stop = threading.Event()
+        halt = halt or threading.Event()
+
+        def run_loop():
+            try:
+                asyncio.run(self._execute_all(prepared_cases, completed, stop, halt))
+            except BaseException as e:
+                completed.put(e)
+
+        loop_thread = threading.Thread(target=run_loop, name='test-exec-async', daemon=True)
+        loop_thread.start()
+        try:
+            yield from drain_completed(completed)
+        finally:
+            stop.set()
+
+    async def _execute_all(self, prepared_cases: Iterable[Dict[str, Any]], completed: queue.Queue,
+                           stop: threading.Event, halt: threading.Event):
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def execute_timed(client, position, test_case):
+            async with semaphore:
+                if stop.is_set() or halt.is_set():
+                    completed.put((position, None, 0.0))
+                    return
+                start_time = time.perf_counter()
+                execution_result = await self.executor.run(client, test_case)
+                completed.put((position, execution_result, time.perf_counter() - start_time))
+
+        # The input may be a lazy (blocking) iterable, so pull each case on
+        # a worker thread and schedule it without waiting for the rest
+        cases = enumerate(prepared_cases)
+        finished = object()
+        tasks = []
+        async with self.executor.client(self.max_workers) as client:
+            while not stop.is_set() and not halt.is_set():
+                item = await loop.run_in_executor(None, next, cases, finished)
+                if item is finished:
+                    break
+                position, test_case = item
+                tasks.append(asyncio.create_task(execute_timed(client, position, test_case)))
+            completed.put(FeedFinished(len(tasks)))
+            await asyncio.gather(*tasks)
@@ -0,0 +1,224 @@
+import json
+import re
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+CODE_FENCE = re.compile(r'```[A-Za-z]*[ \t]*\n?(.*?)(?:```|$)', re.DOTALL)
+
+
+def strip_code_fences(text: str) -> str:
+    """Return the contents of the first ``` fenced block, or text unchanged if there is none"""
+    match = CODE_FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def clean_json_text(text: str) -> str:
+    """
+    Make model-written JSON parseable: drop // and /* */ comments and trailing
+    commas before } or ]. String contents are left untouched.
+    """
+    # Pass 1: comments
+    out = []
+    in_string = escape = False
+    i, length = 0, len(text)
+    while i < length:
+        char = text[i]
+        if in_string:
+            out.append(char)
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            out.append(char)
+        elif text.startswith('//', i):
+            newline = text.find('\n', i)
+            i = length if newline == -1 else newline
+            continue
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            continue
+        else:
+            out.append(char)
+        i += 1
+    text = ''.join(out)
+
+    # Pass 2: trailing commas
+    out = []
+    in_string = escape = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ',':
+            j = i + 1
+            while j < len(text) and text[j].isspace():
+                j += 1
+            if j < len(text) and text[j] in '}]':
+                continue
+        out.append(char)
+    return ''.join(out)
+
+
+def parse_generated_suite(text: str) -> Tuple[OrderedDict, bool]:
+    """
+    Parse a model-generated {"Category": [cases]} suite as leniently as possible:
+    code fences, comments and trailing commas are cleaned up first, and if the
+    result still is not valid JSON (e.g. the completion was cut off at max_tokens)
+    every complete case object is salvaged.
+    Returns the suite and whether it parsed completely (False when salvaged).
+    Raises ValueError if no test case can be recovered.
+    """
+    cleaned = clean_json_text(strip_code_fences(text))
+    start, end = cleaned.find('{'), cleaned.rfind('}')
+    if start != -1 and end > start:
+        try:
+            suite = json.loads(cleaned[start:end + 1], object_pairs_hook=OrderedDict)
+            if isinstance(suite, dict) and suite:
+                return suite, True
+        except ValueError:
+            pass
+
+    parser = CaseStreamParser()
+    suite = OrderedDict()
+    for category, _, case in parser.feed(cleaned):
+        suite.setdefault(category, []).append(case)
+    if not suite:
+        raise ValueError('No test cases could be recovered from the model output')
+    print(f"Recovered {sum(len(cases) for cases in suite.values())} test cases from malformed model output")
+    return suite, False
+
+
+class CaseStreamParser:
+    """
+    Incrementally parse a generated suite of the form
+    {"Category": [{...case...}, ...], ...} as text arrives in chunks.
+
+    Only string/escape/comment state and nesting depth are tracked, so each
+    chunk is scanned once. Every case object is decoded (leniently) as soon as
+    its closing brace arrives; text outside the top-level object (prose, code
+    fences) is ignored, and so is a truncated trailing case.
+    """
+
+    # Nesting depth of a case object: top-level object -> category array -> case
+    CASE_DEPTH = 3
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.comment: Optional[str] = None
+        self.expect_key = False
+        self.category: Optional[str] = None
+        self.complete = False
+        self.errors: List[str] = []
+        self._slash = False
+        self._star = False
+        self._key: Optional[List[str]] = None
+        self._case: Optional[List[str]] = None
+        self._positions: Dict[str, int] = {}
+
+    def feed(self, text: str) -> List[Tuple[str, int, Dict[str, Any]]]:
+        """Consume a chunk of text and return the (category, index, case) objects it completed"""
+        completed = []
+        case_start = 0 if self._case is not None else None
+        key_start = 0 if self._key is not None else None
+
+        for i, char in enumerate(text):
+            if self.complete:
+                break
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                    if key_start is not None:
+                        self._key.append(text[key_start:i])
+                        self.category = json.loads('"' + ''.join(self._key) + '"')
+                        self._key = None
+                        key_start = None
+                continue
+
+            # Comments copied from the prompt template (// ... and /* ... */)
+            if self.comment == 'line':
+                if char == '\n':
+                    self.comment = None
+                continue
+            if self.comment == 'block':
+                if self._star and char == '/':
+                    self.comment = None
+                self._star = char == '*'
+                continue
+            if self._slash:
+                self._slash = False
+                if char == '/':
+                    self.comment = 'line'
+                    continue
+                if char == '*':
+                    self.comment = 'block'
+                    self._star = False
+                    continue
+            if char == '/':
+                self._slash = True
+                continue
+
+            if char == '"':
+                self.in_string = True
+                if self.depth == 1 and self.expect_key:
+                    self._key = []
+                    key_start = i + 1
+            elif char == ':' and self.depth == 1:
+                self.expect_key = False
+            elif char == ',' and self.depth == 1:
+                self.expect_key = True
+            elif char in '{[':
+                self.depth += 1
+                if self.depth == 1:
+                    self.expect_key = char == '{'
+                elif char == '{' and self.depth == self.CASE_DEPTH:
+                    self._case = []
+                    case_start = i
+            elif char in '}]':
+                if char == '}' and self.depth == self.CASE_DEPTH and self._case is not None:
+                    self._case.append(text[case_start:i + 1])
+                    case = self._decode(''.join(self._case))
+                    self._case = None
+                    case_start = None
+                    if case is not None:
+                        index = self._positions.get(self.category, 0)
+                        self._positions[self.category] = index + 1
+                        completed.append((self.category, index, case))
+                self.depth -= 1
+                if self.depth == 0:
+                    self.complete = True
+
+        # Carry partial case/key text over to the next chunk
+        if self._case is not None and case_start is not None:
+            self._case.append(text[case_start:])
+        if self._key is not None and key_start is not None:
+            self._key.append(text[key_start:])
+        return completed
+
+    def _decode(self, case_text: str) -> Optional[Dict[str, Any]]:
+        try:
+            case = json.loads(case_text)
+        except ValueError:
+            try:
+                case = json.loads(clean_json_text(case_text))
+            except ValueError as e:
+                self.errors.append(f'{self.category}: {str(e)}')
+                return None
+        return case if isinstance(case, dict) else None
@@ -0,0 +1,43 @@
+import json
+import shlex
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode
+
+from src.services.test_executor import sends_json
+
+
+def render_curl(endpoint: str, method: str, headers: Optional[Dict[str, Any]] = None, payload: Any = None,
+                query_params: Optional[Dict[str, Any]] = None, payload_json: Optional[str] = None) -> str:
+    """
+    Render a copy-pasteable curl command for a test case. Every argument is
+    shell-quoted. payload_json is the payload's JSON text when it has already
+    been serialized (e.g. by the run store); it is used as-is instead of
+    dumping payload again. String payloads are sent raw, except with a JSON
+    content-type, where the executors JSON-encode them (as a JSON string).
+    """
+    parts = ['curl', '-X', shlex.quote(method or 'GET')]
+
+    for key, value in (headers or {}).items():
+        parts += ['-H', shlex.quote(f'{key}: {value}')]
+
+    json_body = sends_json(headers)
+    if payload_json is not None and payload_json.startswith('"') and not json_body:
+        payload, payload_json = json.loads(payload_json), None
+    if payload_json is not None:
+        body = payload_json
+    elif isinstance(payload, str):
+        body = json.dumps(payload) if json_body else payload
+    elif payload:
+        body = json.dumps(payload)
+    else:
+        body = None
+    if body:
+        parts += ['-d', shlex.quote(body)]
+
+    url = endpoint or ''
+    if query_params:
+        separator = '&' if '?' in url else '?'
+        url = f'{url}{separator}{urlencode(query_params, doseq=True)}'
+    parts.append(shlex.quote(url))
+
+    return ' '.join(parts)
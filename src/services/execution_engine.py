@@ -0,0 +1,259 @@
+import functools
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from src.services.metrics import CASES_EXECUTED, case_outcome
+from src.services.response_bodies import ResponseBodies
+
+# Per-run concurrency defaults; a run may ask for fewer or more workers
+# but never more than MAX_WORKERS_LIMIT
+DEFAULT_MAX_WORKERS = int(os.getenv('EXECUTION_MAX_WORKERS', '8'))
+MAX_WORKERS_LIMIT = int(os.getenv('EXECUTION_MAX_WORKERS_LIMIT', '32'))
+
+
+class FeedFinished:
+    """Queue marker put once every case from the (lazy) input has been submitted"""
+
+    def __init__(self, submitted: int):
+        self.submitted = submitted
+
+
+def drain_completed(completed: queue.Queue) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+    """
+    Yield (position, result, elapsed) items from a completion queue until every
+    submitted case has been reported. Exceptions put on the queue are re-raised.
+    """
+    received = 0
+    submitted = None
+    while submitted is None or received < submitted:
+        item = completed.get()
+        if isinstance(item, BaseException):
+            raise item
+        if isinstance(item, FeedFinished):
+            submitted = item.submitted
+            continue
+        received += 1
+        yield item
+
+
+class ExecutionEngine:
+    """
+    Execute generated test cases across a bounded worker pool.
+    Results keep the (category, index) order of the generated suite.
+    Response bodies are deduplicated into self.response_bodies; execution
+    results reference them by content_ref.
+    """
+
+    backend = 'thread'
+    default_workers = DEFAULT_MAX_WORKERS
+    workers_limit = MAX_WORKERS_LIMIT
+
+    def __init__(self, execute_fn: Callable[[Dict[str, Any]], Dict[str, Any]], max_workers: Optional[int] = None):
+        self.execute_fn = execute_fn
+        self.max_workers = self.resolve_concurrency(max_workers)
+        self.summary = None
+        self.response_bodies = ResponseBodies()
+
+    @classmethod
+    def resolve_concurrency(cls, max_workers: Optional[Any]) -> int:
+        """Clamp a requested worker count to 1..workers_limit"""
+        try:
+            value = int(max_workers) if max_workers is not None else cls.default_workers
+        except (TypeError, ValueError):
+            value = cls.default_workers
+        return max(1, min(value, cls.workers_limit))
+
+    @staticmethod
+    def prepare_case(case: Dict[str, Any], api_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the executable request for a generated case, defaulting to the original API info.
+        Cases that expect a 429 are meant to trip the target's limiter, so they bypass the run's.
+        """
+        return {
+            'method': case.get('method', api_info.get('method', 'GET')),
+            'endpoint': case.get('endpoint', api_info.get('url', '')),
+            'headers': case.get('headers', api_info.get('headers', {})),
+            'payload': case.get('payload', api_info.get('payload', {})),
+            'query_params': case.get('query_params', api_info.get('query_params', {})),
+            'rate_limit_exempt': str(case.get('expected_status')) == '429'
+        }
+
+    def _execute_timed(self, test_case: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        """Run one case and return its execution result with the elapsed time"""
+        start_time = time.perf_counter()
+        try:
+            execution_result = self.execute_fn(test_case)
+        except Exception as e:
+            execution_result = {
+                'success': False,
+                'error': f'Failed to execute test case: {str(e)}'
+            }
+        return execution_result, time.perf_counter() - start_time
+
+    def iter_completed(self, prepared_cases: Iterable[Dict[str, Any]],
+                       halt: Optional[threading.Event] = None) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+        """
+        Execute prepared cases on the worker pool, yielding (position, result, elapsed) as each
+        finishes. prepared_cases may be lazy: a feeder thread submits each case as soon as the
+        iterable produces it, so execution overlaps with whatever is producing the cases.
+        Once halt is set no further case starts; cases already started still finish and
+        cases that never started are yielded with a None result.
+        """
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='test-exec')
+        completed = queue.Queue()
+        stop = threading.Event()
+        halt = halt or threading.Event()
+
+        def execute(test_case):
+            if halt.is_set():
+                return None, 0.0
+            return self._execute_timed(test_case)
+
+        def on_done(position, future):
+            if not future.cancelled():
+                execution_result, elapsed = future.result()
+                completed.put((position, execution_result, elapsed))
+
+        def feed():
+            submitted = 0
+            try:
+                for position, test_case in enumerate(prepared_cases):
+                    if stop.is_set() or halt.is_set():
+                        break
+                    future = pool.submit(execute, test_case)
+                    future.add_done_callback(functools.partial(on_done, position))
+                    submitted += 1
+            except BaseException as e:
+                completed.put(e)
+            completed.put(FeedFinished(submitted))
+
+        feeder = threading.Thread(target=feed, name='test-exec-feed', daemon=True)
+        feeder.start()
+        try:
+            yield from drain_completed(completed)
+        finally:
+            # Stop queued cases if the consumer goes away early
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def case_passed(case: Dict[str, Any]) -> bool:
+        """A case passes when it executed and returned its expected status (if it has one)"""
+        execution_result = case.get('execution_result') or {}
+        if not execution_result.get('success'):
+            return False
+        expected_status = case.get('expected_status')
+        if expected_status is None:
+            return True
+        try:
+            return execution_result['response']['status_code'] == int(expected_status)
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def iter_run(self, test_cases: Dict[str, Any], api_info: Dict[str, Any],
+                 halt: Optional[threading.Event] = None) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+        """
+        Execute every case in test_cases, attaching its execution_result, and yield
+        (category, index, case) in completion order. The timing summary is stored
+        on self.summary once the run finishes or the consumer stops iterating.
+        Setting halt stops new cases from starting (see iter_completed).
+        """
+        case_stream = (
+            (category, index, case)
+            for category, cases in test_cases.items()
+            for index, case in enumerate(cases)
+        )
+        total_cases = sum(len(cases) for cases in test_cases.values())
+        return self.iter_run_stream(case_stream, api_info, total_cases=total_cases, halt=halt)
+
+    def iter_run_stream(self, case_stream: Iterable[Tuple[str, int, Dict[str, Any]]], api_info: Dict[str, Any],
+                        total_cases: Optional[int] = None,
+                        halt: Optional[threading.Event] = None) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+        """
+        Like iter_run, but cases come from a (category, index, case) iterable that may
+        still be producing them, e.g. a streaming generator. Each case starts executing
+        as soon as it arrives.
+        """
+        start_time = time.perf_counter()
+        positions = []
+
+        def prepared_cases():
+            for category, index, case in case_stream:
+                positions.append((category, index, case))
+                yield self.prepare_case(case, api_info)
+
+        self.summary = None
+        executed = passed = 0
+        summed_case_time = 0.0
+        first_result_time = None
+        try:
+            for position, execution_result, elapsed in self.iter_completed(prepared_cases(), halt):
+                if execution_result is None:
+                    # Halted before it was sent
+                    continue
+                category, index, case = positions[position]
+                if first_result_time is None:
+                    first_result_time = time.perf_counter() - start_time
+                summed_case_time += elapsed
+                executed += 1
+                case['execution_result'] = self.response_bodies.intern(execution_result)
+                case_passed = self.case_passed(case)
+                if case_passed:
+                    passed += 1
+                CASES_EXECUTED.inc(outcome=case_outcome(execution_result, case_passed))
+                yield category, index, case
+        finally:
+            wall_time = time.perf_counter() - start_time
+            self.summary = {
+                'backend': self.backend,
+                'total_cases': total_cases if total_cases is not None else len(positions),
+                'executed': executed,
+                'passed': passed,
+                'failed': executed - passed,
+                'max_workers': self.max_workers,
+                'wall_time': wall_time,
+                'time_to_first_result': first_result_time,
+                'summed_case_time': summed_case_time,
+                'speedup': summed_case_time / wall_time if wall_time > 0 else None
+            }
+
+    def run(self, test_cases: Dict[str, Any], api_info: Dict[str, Any],
+            fail_fast: bool = False) -> Tuple[OrderedDict, Dict[str, Any]]:
+        """
+        Execute every case in test_cases and attach its execution_result.
+        With fail_fast, no case starts after the first failing one: cases
+        already sent keep their real results and the ones never sent are
+        marked as skipped.
+        Returns the executed suite, in its original (category, index) order,
+        and a timing summary for the run.
+        """
+        halt = threading.Event()
+        results = self.iter_run(test_cases, api_info, halt=halt)
+        try:
+            for _, _, case in results:
+                if fail_fast and not self.case_passed(case):
+                    halt.set()
+        finally:
+            results.close()
+
+        skipped = 0
+        for cases in test_cases.values():
+            for case in cases:
+                if 'execution_result' not in case:
+                    skipped += 1
+                    case['execution_result'] = {
+                        'success': False,
+                        'skipped': True,
+                        'error': 'Skipped after an earlier failure (fail_fast)'
+                    }
+        self.summary['skipped'] = skipped
+
+        executed_test_cases = OrderedDict(
+            (category, list(cases)) for category, cases in test_cases.items()
+        )
+        return executed_test_cases, self.summary
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# Generated suites are cached on disk keyed by a hash of the prompt inputs.
+# Entries expire after GENERATION_CACHE_TTL seconds and the least recently
+# used ones are evicted once the cache exceeds either size cap.
+GENERATION_CACHE_ENABLED = os.getenv('GENERATION_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+GENERATION_CACHE_DIR = os.getenv(
+    'GENERATION_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'generation_cache')
+)
+GENERATION_CACHE_TTL = float(os.getenv('GENERATION_CACHE_TTL', str(7 * 24 * 3600)))
+GENERATION_CACHE_MAX_ENTRIES = int(os.getenv('GENERATION_CACHE_MAX_ENTRIES', '500'))
+GENERATION_CACHE_MAX_BYTES = int(os.getenv('GENERATION_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# Bump when the prompts change in a way that should invalidate cached suites
+CACHE_KEY_VERSION = 2
+
+
+def normalize_api_info(api_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce api_info to the fields the prompts are built from. Header names are
+    case-insensitive and the captured response only contributes its status and
+    content, so per-request noise (Date, curl_command, ...) does not change the key.
+    """
+    response = api_info.get('response') or {}
+    headers = api_info.get('headers') or {}
+    return {
+        'method': (api_info.get('method') or 'GET').upper(),
+        'url': api_info.get('url', ''),
+        'headers': {str(key).lower(): value for key, value in headers.items()},
+        'payload': api_info.get('payload') or {},
+        'query_params': api_info.get('query_params') or {},
+        'response_status': response.get('status_code'),
+        'response_content': response.get('content')
+    }
+
+
+def generation_cache_key(api_info: Dict[str, Any], **params) -> str:
+    """Canonical hash of the prompt inputs plus any generation params (model, ...)"""
+    key_material = {
+        'version': CACHE_KEY_VERSION,
+        'api_info': normalize_api_info(api_info),
+        'params': params
+    }
+    canonical = json.dumps(key_material, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class GenerationCache:
+    """
+    Content-addressed disk cache for generated test suites. Each entry is one
+    JSON file; its mtime is the last use, which drives LRU eviction.
+    """
+
+    def __init__(self, directory: str = GENERATION_CACHE_DIR, ttl: float = GENERATION_CACHE_TTL,
+                 max_entries: int = GENERATION_CACHE_MAX_ENTRIES, max_bytes: int = GENERATION_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('created_at', 0) > self.ttl:
+            self._remove(path)
+            return None
+
+        try:
+            # Mark as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get('value')
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store value under key, then evict entries over the size caps"""
+        entry = json.dumps({'created_at': time.time(), 'value': value})
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(entry)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries and the least recently used ones beyond max_entries/max_bytes"""
+        with self._lock:
+            now = time.time()
+            entries = []
+            for name in os.listdir(self.directory):
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            # Unused for longer than the TTL means the entry is expired as well
+            removed = 0
+            live = []
+            for mtime, size, path in entries:
+                if now - mtime > self.ttl:
+                    removed += self._remove(path)
+                else:
+                    live.append((mtime, size, path))
+
+            live.sort()
+            total_bytes = sum(size for _, size, _ in live)
+            while live and (len(live) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, path = live.pop(0)
+                total_bytes -= size
+                removed += self._remove(path)
+            return removed
+
+    @staticmethod
+    def _remove(path: str) -> int:
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    self._remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, Any]:
+        """Describe the cache contents"""
+        sizes = [
+            os.path.getsize(os.path.join(self.directory, name))
+            for name in os.listdir(self.directory) if name.endswith('.json')
+        ]
+        return {
+            'directory': self.directory,
+            'entries': len(sizes),
+            'bytes': sum(sizes),
+            'ttl': self.ttl,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes
+        }
+
+
+_generation_cache = None
+_generation_cache_lock = threading.Lock()
+
+
+def get_generation_cache() -> GenerationCache:
+    """Return the process-wide generation cache"""
+    global _generation_cache
+    if _generation_cache is None:
+        with _generation_cache_lock:
+            if _generation_cache is None:
+                _generation_cache = GenerationCache()
+    return _generation_cache
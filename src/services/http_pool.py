@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+
+from src.services.phase_timing import TimedHTTPAdapter
+
+# Connections kept alive per (scheme, host, port) and how long an unused
+# origin may sit in the pool before its connections are dropped
+DEFAULT_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+DEFAULT_IDLE_TIMEOUT = float(os.getenv('HTTP_POOL_IDLE_TIMEOUT', '60'))
+
+COOKIE_MODES = ('isolated', 'shared')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def origin_key(url: str) -> Tuple[str, str, int]:
+    """Return the (scheme, host, port) a URL connects to"""
+    parsed = urlparse(url)
+    scheme = (parsed.scheme or 'http').lower()
+    host = (parsed.hostname or '').lower()
+    port = parsed.port or DEFAULT_PORTS.get(scheme, 0)
+    return scheme, host, port
+
+
+class PooledSession(requests.Session):
+    """
+    Session that sends every request through the manager's per-origin
+    keep-alive pool. Cookies stay on the session, so each session can
+    either own its jar or share the manager's jar.
+    """
+
+    def __init__(self, manager: 'ConnectionPoolManager', cookies: Optional[RequestsCookieJar] = None):
+        super().__init__()
+        self.manager = manager
+        if cookies is not None:
+            self.cookies = cookies
+
+    def get_adapter(self, url):
+        return self.manager.adapter_for(url)
+
+    def close(self):
+        # Pooled connections belong to the manager and outlive the session
+        pass
+
+
+class ConnectionPoolManager:
+    """
+    Keep one pooled HTTPAdapter per (scheme, host, port) and hand out
+    sessions that reuse those connections
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.shared_cookies = RequestsCookieJar()
+        self._adapters: Dict[Tuple[str, str, int], HTTPAdapter] = {}
+        self._last_used: Dict[Tuple[str, str, int], float] = {}
+        self._lock = threading.Lock()
+
+    def adapter_for(self, url: str) -> HTTPAdapter:
+        """Return the pooled adapter for the URL's origin, creating it on first use"""
+        key = origin_key(url)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle_locked(now)
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                adapter = TimedHTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                self._adapters[key] = adapter
+            self._last_used[key] = now
+            return adapter
+
+    def session(self, cookie_mode: str = 'isolated') -> PooledSession:
+        """
+        Create a session for one run. 'isolated' gives the run its own cookie jar,
+        'shared' reuses the process-wide jar.
+        """
+        if cookie_mode not in COOKIE_MODES:
+            raise ValueError(f"cookie_mode must be one of {', '.join(COOKIE_MODES)}")
+        if cookie_mode == 'shared':
+            return PooledSession(self, cookies=self.shared_cookies)
+        return PooledSession(self)
+
+    def evict_idle(self) -> int:
+        """Close adapters that have not been used within idle_timeout"""
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def _evict_idle_locked(self, now: float) -> int:
+        expired = [key for key, last_used in self._last_used.items() if now - last_used > self.idle_timeout]
+        for key in expired:
+            self._adapters.pop(key).close()
+            del self._last_used[key]
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Describe the current pools"""
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'idle_timeout': self.idle_timeout,
+                'origins': [f'{scheme}://{host}:{port}' for scheme, host, port in self._adapters]
+            }
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+            self._last_used.clear()
+
+
+_pool_manager = None
+_pool_manager_lock = threading.Lock()
+
+
+def get_pool_manager() -> ConnectionPoolManager:
+    """Return the process-wide connection pool manager"""
+    global _pool_manager
+    if _pool_manager is None:
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                _pool_manager = ConnectionPoolManager()
+    return _pool_manager
@@ -0,0 +1,129 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterator, Tuple, Union
+
+# A parsed path: object keys (str) and array indices (int) from the root down
+Path = Tuple[Union[str, int], ...]
+
+PATH_TOKEN = re.compile(r"""\.([A-Za-z_][\w-]*)|\[(\d+)\]|\[(['"])(.*?)\3\]""")
+PLAIN_KEY = re.compile(r'[A-Za-z_][\w-]*\Z')
+
+
+@lru_cache(maxsize=4096)
+def parse_path(path: str) -> Path:
+    """
+    Parse a JSON path such as $.items[3].price or $['odd key'][0] into its parts.
+    Raises ValueError for anything else.
+    """
+    if not path.startswith('$'):
+        raise ValueError(f'JSON path must start with $: {path!r}')
+    parts = []
+    position = 1
+    while position < len(path):
+        match = PATH_TOKEN.match(path, position)
+        if not match:
+            raise ValueError(f'Invalid JSON path {path!r} at position {position}')
+        name, index, _, quoted = match.groups()
+        if name is not None:
+            parts.append(name)
+        elif index is not None:
+            parts.append(int(index))
+        else:
+            parts.append(quoted)
+        position = match.end()
+    return tuple(parts)
+
+
+def format_path(parts: Path) -> str:
+    """Inverse of parse_path"""
+    out = ['$']
+    for part in parts:
+        if isinstance(part, int):
+            out.append(f'[{part}]')
+        elif PLAIN_KEY.match(part):
+            out.append(f'.{part}')
+        elif "'" in part:
+            out.append(f'["{part}"]')
+        else:
+            out.append(f"['{part}']")
+    return ''.join(out)
+
+
+def _as_parts(path: Union[str, Path]) -> Path:
+    return parse_path(path) if isinstance(path, str) else tuple(path)
+
+
+def get_path(document: Any, path: Union[str, Path]) -> Any:
+    """Value at path. Raises KeyError/IndexError/TypeError if the path does not exist"""
+    node = document
+    for part in _as_parts(path):
+        node = node[part]
+    return node
+
+
+def _copy_along(document: Any, parts: Path):
+    """
+    Shallow-copy every container on the way to the parent of the last part.
+    A shallow copy costs the container's width: O(n) for the root of a flat
+    n-field payload, so n mutations of it add up to O(n^2)
+    """
+    root = copy_node(document)
+    node = root
+    for part in parts[:-1]:
+        child = copy_node(node[part])
+        node[part] = child
+        node = child
+    return root, node
+
+
+def copy_node(node: Any) -> Any:
+    if isinstance(node, dict):
+        return node.copy()
+    if isinstance(node, list):
+        return list(node)
+    raise TypeError(f'Cannot descend into {type(node).__name__}')
+
+
+def set_path(document: Any, path: Union[str, Path], value: Any) -> Any:
+    """
+    Return a copy of document with the value at path replaced (or an object key added).
+    Only the containers along the path are copied; every other subtree is
+    shared with document, which is left untouched. The cost is the summed width
+    of those containers (not the size of the document), so a wide parent
+    object is copied in full; see _copy_along.
+    """
+    parts = _as_parts(path)
+    if not parts:
+        return value
+    root, parent = _copy_along(document, parts)
+    parent[parts[-1]] = value
+    return root
+
+
+def delete_path(document: Any, path: Union[str, Path]) -> Any:
+    """Return a copy of document without the key/element at path, copying only along the path"""
+    parts = _as_parts(path)
+    if not parts:
+        raise ValueError('Cannot delete the document root')
+    root, parent = _copy_along(document, parts)
+    del parent[parts[-1]]
+    return root
+
+
+def iter_fields(document: Any) -> Iterator[Tuple[Path, Any]]:
+    """
+    Yield (path, value) for every object member and array element below the
+    root, in document order. Iterative, so deeply nested documents are fine.
+    """
+    stack = [((), document)]
+    while stack:
+        path, node = stack.pop()
+        if path:
+            yield path, node
+        if isinstance(node, dict):
+            children = [(path + (key,), value) for key, value in node.items()]
+        elif isinstance(node, list):
+            children = [(path + (index,), value) for index, value in enumerate(node)]
+        else:
+            continue
+        stack.extend(reversed(children))
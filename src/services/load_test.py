@@ -0,0 +1,239 @@
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional
+
+from src.services.execution_engine import ExecutionEngine
+
+# Bounds on a single load test; a request may ask for less but never more
+MAX_LOAD_DURATION = float(os.getenv('LOAD_TEST_MAX_DURATION', '300'))
+MAX_LOAD_CONCURRENCY = int(os.getenv('LOAD_TEST_MAX_CONCURRENCY', '64'))
+MAX_LOAD_RPS = float(os.getenv('LOAD_TEST_MAX_RPS', '1000'))
+# Rate mode: scheduled requests allowed to wait for a free worker; when the
+# target cannot keep up, further requests are dropped instead of queued
+MAX_LOAD_BACKLOG = int(os.getenv('LOAD_TEST_MAX_BACKLOG', '1000'))
+DEFAULT_LOAD_DURATION = 10.0
+DEFAULT_LOAD_CONCURRENCY = 1
+# Distinct error messages reported individually; the rest are counted as 'other'
+MAX_ERROR_KINDS = 20
+# Object addresses in exception messages would make every error distinct
+ADDRESS_PATTERN = re.compile(r'0x[0-9a-fA-F]+')
+
+PERCENTILES = (('p50', 50.0), ('p90', 90.0), ('p99', 99.0), ('p99_9', 99.9))
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram. Bucket bounds grow by a factor of
+    (1 + precision), so any percentile is reported within that relative
+    error while memory stays proportional to the range of values, not the
+    number of samples. Values are in seconds.
+    """
+
+    def __init__(self, precision: float = 0.01, min_value: float = 1e-6):
+        self.precision = precision
+        self.min_value = min_value
+        self._log_base = math.log1p(precision)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) / self._log_base) + 1
+
+    def _value(self, index: int) -> float:
+        """Midpoint of a bucket"""
+        if index == 0:
+            return self.min_value
+        lower = self.min_value * math.exp((index - 1) * self._log_base)
+        return lower * (1 + self.precision / 2)
+
+    def record(self, value: float):
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add the samples of a histogram with the same precision"""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Value at a percentile (0-100), clamped to the observed min/max"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """count, min/mean/max and percentiles, in milliseconds"""
+        def ms(value):
+            return round(value * 1000, 3) if value is not None else None
+
+        summary = {
+            'count': self.count,
+            'min_ms': ms(self.min),
+            'mean_ms': ms(self.total / self.count) if self.count else None,
+            'max_ms': ms(self.max)
+        }
+        for name, percent in PERCENTILES:
+            summary[f'{name}_ms'] = ms(self.percentile(percent))
+        return summary
+
+
+class LoadTest:
+    """
+    Run one test case repeatedly for a duration, either closed-loop with a
+    fixed number of concurrent workers or open-loop at a target rate (rps).
+    In rate mode latency is measured from each request's scheduled start, so
+    a server that falls behind shows up in the percentiles instead of
+    silently lowering the rate. At most MAX_LOAD_BACKLOG requests wait for a
+    worker; the ones scheduled beyond that are not sent and count as dropped.
+    """
+
+    def __init__(self, execute_fn: Callable[[Dict[str, Any]], Dict[str, Any]], test_case: Dict[str, Any],
+                 duration: Any = None, concurrency: Any = None, rps: Any = None):
+        self.execute_fn = execute_fn
+        self.test_case = test_case
+        self.duration = self._bounded(duration, DEFAULT_LOAD_DURATION, MAX_LOAD_DURATION, 'duration')
+        self.rps = self._bounded(rps, None, MAX_LOAD_RPS, 'rps')
+        # In rate mode concurrency only caps the requests in flight
+        default_concurrency = MAX_LOAD_CONCURRENCY if self.rps else DEFAULT_LOAD_CONCURRENCY
+        self.concurrency = int(self._bounded(concurrency, default_concurrency, MAX_LOAD_CONCURRENCY, 'concurrency'))
+
+        self.latency = LatencyHistogram()
+        self.status_codes = Counter()
+        self.errors = Counter()
+        self.passed = 0
+        self.failed = 0
+        self.late = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bounded(value: Any, default: Optional[float], limit: float, name: str) -> Optional[float]:
+        if value is None:
+            return default
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'{name} must be a number')
+        if value <= 0:
+            raise ValueError(f'{name} must be positive')
+        return min(value, limit)
+
+    def _execute(self, started: float):
+        try:
+            execution_result = self.execute_fn(self.test_case)
+        except Exception as e:
+            execution_result = {'success': False, 'error': f'Unexpected error: {str(e)}'}
+        latency = time.perf_counter() - started
+        passed = ExecutionEngine.case_passed(dict(self.test_case, execution_result=execution_result))
+
+        with self._lock:
+            self.latency.record(latency)
+            if passed:
+                self.passed += 1
+            else:
+                self.failed += 1
+            if execution_result.get('success'):
+                self.status_codes[str(execution_result['response'].get('status_code'))] += 1
+            else:
+                error = ADDRESS_PATTERN.sub('0x...', execution_result.get('error') or 'Unknown error')
+                if error not in self.errors and len(self.errors) >= MAX_ERROR_KINDS:
+                    error = 'other'
+                self.errors[error] += 1
+
+    def _run_closed_loop(self, deadline: float):
+        def worker():
+            while time.perf_counter() < deadline:
+                self._execute(time.perf_counter())
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_open_loop(self, start: float, deadline: float):
+        interval = 1.0 / self.rps
+        slots = threading.BoundedSemaphore(self.concurrency + MAX_LOAD_BACKLOG)
+
+        def execute(scheduled):
+            try:
+                self._execute(scheduled)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            count = 0
+            while True:
+                scheduled = start + count * interval
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                elif -delay > interval:
+                    # The scheduler itself fell a whole interval behind
+                    self.late += 1
+                if slots.acquire(blocking=False):
+                    pool.submit(execute, scheduled)
+                else:
+                    self.dropped += 1
+                count += 1
+
+    def run(self) -> Dict[str, Any]:
+        """Run the load test and return its report"""
+        start = time.perf_counter()
+        deadline = start + self.duration
+        if self.rps:
+            self._run_open_loop(start, deadline)
+        else:
+            self._run_closed_loop(deadline)
+        elapsed = time.perf_counter() - start
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        requests_sent = self.latency.count
+        report = {
+            'mode': 'rps' if self.rps else 'concurrency',
+            'target_rps': self.rps,
+            'concurrency': self.concurrency,
+            'duration': self.duration,
+            'elapsed': elapsed,
+            'requests': requests_sent,
+            'throughput': requests_sent / elapsed if elapsed > 0 else 0.0,
+            'passed': self.passed,
+            'failed': self.failed,
+            'error_rate': (requests_sent - sum(self.status_codes.values())) / requests_sent if requests_sent else 0.0,
+            'status_codes': dict(self.status_codes),
+            'errors': dict(self.errors),
+            'latency': self.latency.summary()
+        }
+        if self.rps:
+            report['late_sends'] = self.late
+            report['dropped'] = self.dropped
+        return report
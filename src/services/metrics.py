@@ -0,0 +1,237 @@
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Distinct target hosts tracked individually; further hosts share the 'other' label
+METRICS_MAX_HOSTS = int(os.getenv('METRICS_MAX_HOSTS', '100'))
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LLM_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """A named metric family whose samples are keyed by their label values"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes the labels {', '.join(self.labelnames) or '(none)'}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...], extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in pairs) + '}'
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            return [f'{self.name}{self._labels(key)} {format_value(value)}'
+                    for key, value in sorted(self._values.items())]
+
+    def render(self) -> List[str]:
+        return [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {self.metric_type}'] + self.samples()
+
+
+class Counter(Metric):
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    metric_type = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track(self, **labels):
+        """Count the block as in progress while it runs"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram with _bucket, _sum and _count samples"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f'{self.name}_bucket{self._labels(key, ("le", format_value(bound)))} {cumulative}')
+                lines.append(f'{self.name}_sum{self._labels(key)} {format_value(total)}')
+                lines.append(f'{self.name}_count{self._labels(key)} {cumulative}')
+        return lines
+
+
+class Registry:
+    """The metrics exposed by /api/metrics, rendered in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+SUITES_GENERATED = REGISTRY.register(Counter(
+    'api_tester_suites_generated_total', 'Test suites generated, by generator (ai, cache or simple)', ['generator']))
+LLM_REQUESTS = REGISTRY.register(Counter(
+    'api_tester_llm_requests_total', 'Completions requested from the model, by mode and outcome (ok, error or cancelled)', ['mode', 'outcome']))
+LLM_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'api_tester_llm_request_duration_seconds', 'Model completion latency, by mode', ['mode'], buckets=LLM_BUCKETS))
+LLM_TOKENS = REGISTRY.register(Counter(
+    'api_tester_llm_tokens_total', 'Tokens used by model completions, by type (prompt or completion)', ['type']))
+CASES_EXECUTED = REGISTRY.register(Counter(
+    'api_tester_cases_executed_total', 'Test cases executed, by outcome (passed, failed or error)', ['outcome']))
+TARGET_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'api_tester_target_request_duration_seconds', 'Response time of the APIs under test, by host', ['host']))
+EXECUTIONS_IN_FLIGHT = REGISTRY.register(Gauge(
+    'api_tester_executions_in_flight', 'Requests to APIs under test currently in flight, by backend', ['backend']))
+RUN_STORE_ROWS = REGISTRY.register(Gauge(
+    'api_tester_run_store_rows', 'Rows in the run store, by table', ['table']))
+RUN_STORE_BYTES = REGISTRY.register(Gauge(
+    'api_tester_run_store_size_bytes', 'Size of the run store database file'))
+
+_hosts = set()
+_hosts_lock = threading.Lock()
+
+
+def host_label(url: str) -> str:
+    """host[:port] of a target URL, bounded to METRICS_MAX_HOSTS distinct values"""
+    host = urlparse(url).netloc.rsplit('@', 1)[-1].lower() or 'unknown'
+    with _hosts_lock:
+        if host in _hosts:
+            return host
+        if len(_hosts) >= METRICS_MAX_HOSTS:
+            return 'other'
+        _hosts.add(host)
+        return host
+
+
+def observe_target_request(url: str, response_time: float):
+    TARGET_REQUEST_SECONDS.observe(response_time, host=host_label(url))
+
+
+class LLMRequest:
+    """One observed completion; time spent in paused() blocks is not part of its latency"""
+
+    def __init__(self):
+        self.paused_seconds = 0.0
+
+    @contextmanager
+    def paused(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.paused_seconds += time.perf_counter() - started
+
+
+@contextmanager
+def observe_llm_request(mode: str):
+    """
+    Time a model completion (mode: suite, category or stream) and count its outcome.
+    A streamed completion whose consumer went away (GeneratorExit) counts as
+    cancelled and its latency is not observed.
+    """
+    request = LLMRequest()
+    started = time.perf_counter()
+    outcome = 'error'
+    try:
+        yield request
+        outcome = 'ok'
+    except GeneratorExit:
+        outcome = 'cancelled'
+        raise
+    finally:
+        LLM_REQUESTS.inc(mode=mode, outcome=outcome)
+        if outcome != 'cancelled':
+            LLM_REQUEST_SECONDS.observe(time.perf_counter() - started - request.paused_seconds, mode=mode)
+
+
+def record_llm_usage(usage):
+    """Count the tokens of a completion's usage object, if the response had one"""
+    if usage is None:
+        return
+    LLM_TOKENS.inc(getattr(usage, 'prompt_tokens', 0) or 0, type='prompt')
+    LLM_TOKENS.inc(getattr(usage, 'completion_tokens', 0) or 0, type='completion')
+
+
+def case_outcome(execution_result: Dict[str, Any], passed: bool) -> str:
+    if not execution_result.get('success'):
+        return 'error'
+    return 'passed' if passed else 'failed'
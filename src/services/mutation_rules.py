@@ -0,0 +1,560 @@
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional
+
+from src.services.json_path import Path, delete_path, format_path, set_path
+
+CATEGORIES = ['Positive', 'Negative', 'Boundary', 'Semantic', 'Security']
+
+# Parts of the original request a rule can replace, in the order they are mutated
+REQUEST_FIELDS = ('endpoint', 'method', 'headers', 'query_params', 'payload')
+
+# expected_status placeholder: the status of the captured response (or the method's default)
+RESPONSE_STATUS = object()
+
+# Field mutator result meaning "remove the field"
+DELETE = object()
+
+
+class MutationRule:
+    """
+    One generated test case: its category and description, how it changes the
+    original request and the status the API is expected to answer with.
+
+    Mutators are given per request field (see REQUEST_FIELDS) as callables that
+    receive the original value and return the replacement; any other value is
+    used as a fixed replacement. Fields without a mutator are sent unchanged.
+    """
+
+    def __init__(self, rule_id: str, category: str, description: str,
+                 expected_status: Any = RESPONSE_STATUS, expected_schema: Optional[Dict] = None,
+                 **mutators):
+        if category not in CATEGORIES:
+            raise ValueError(f'Unknown category {category!r} for rule {rule_id}')
+        unknown = set(mutators) - set(REQUEST_FIELDS)
+        if unknown:
+            raise ValueError(f'Rule {rule_id} mutates unknown request fields: {sorted(unknown)}')
+
+        self.rule_id = rule_id
+        self.category = category
+        self.description = description
+        self.expected_status = expected_status
+        self.expected_schema = expected_schema
+        self.mutators = tuple(
+            (field, mutators[field] if callable(mutators[field]) else _fixed(mutators[field]))
+            for field in REQUEST_FIELDS if field in mutators
+        )
+
+    def apply(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the mutated copy of request (a dict keyed by REQUEST_FIELDS)"""
+        mutated = dict(request)
+        for field, mutator in self.mutators:
+            mutated[field] = mutator(request[field])
+        return mutated
+
+    def status(self, response_status: int) -> int:
+        """Expected status, given the status the original request is expected to return"""
+        if self.expected_status is RESPONSE_STATUS:
+            return response_status
+        return self.expected_status
+
+    def __repr__(self):
+        return f'MutationRule({self.rule_id!r}, {self.category!r})'
+
+
+class FieldRule:
+    """
+    A rule applied to each payload field it matches rather than to the request
+    as a whole: it produces one test case per matching field (any depth, see
+    json_path.iter_fields) with only that field changed. The description is a
+    template with a {path} placeholder.
+    """
+
+    def __init__(self, rule_id: str, category: str, description: str,
+                 matches: Callable[[Path, Any], bool], mutate: Callable[[Any], Any],
+                 expected_status: Any = RESPONSE_STATUS, expected_schema: Optional[Dict] = None):
+        if category not in CATEGORIES:
+            raise ValueError(f'Unknown category {category!r} for rule {rule_id}')
+        self.rule_id = rule_id
+        self.category = category
+        self.description = description
+        self.matches = matches
+        self.mutate = mutate
+        self.expected_status = expected_status
+        self.expected_schema = expected_schema
+
+    def apply_field(self, payload: Any, path: Path, value: Any) -> Any:
+        """Copy of payload with the field at path mutated; unchanged subtrees are shared"""
+        replacement = self.mutate(value)
+        if replacement is DELETE:
+            return delete_path(payload, path)
+        return set_path(payload, path, replacement)
+
+    def describe(self, path: Path) -> str:
+        return self.description.format(path=format_path(path))
+
+    def status(self, response_status: int) -> int:
+        if self.expected_status is RESPONSE_STATUS:
+            return response_status
+        return self.expected_status
+
+    def __repr__(self):
+        return f'FieldRule({self.rule_id!r}, {self.category!r})'
+
+
+class RuleSet:
+    """An ordered, indexed collection of rules, compiled once when it is built"""
+
+    def __init__(self, rules: Iterable):
+        self.rules: List = list(rules)
+        self.by_id: Dict[str, Any] = {}
+        self.by_category: Dict[str, List] = OrderedDict((category, []) for category in CATEGORIES)
+        for rule in self.rules:
+            if rule.rule_id in self.by_id:
+                raise ValueError(f'Duplicate rule id {rule.rule_id}')
+            self.by_id[rule.rule_id] = rule
+            self.by_category[rule.category].append(rule)
+
+    def select(self, categories: Optional[Iterable[str]] = None,
+               rule_ids: Optional[Iterable[str]] = None) -> Iterator:
+        """
+        Yield the rules in category order, restricted to the given categories
+        and/or rule ids. Raises ValueError for an unknown category or rule id.
+        """
+        if categories is not None:
+            categories = set(categories)
+            unknown = categories - set(CATEGORIES)
+            if unknown:
+                raise ValueError(f'Unknown categories: {sorted(unknown)}')
+        if rule_ids is not None:
+            rule_ids = set(rule_ids)
+            unknown = rule_ids - set(self.by_id)
+            if unknown:
+                raise ValueError(f'Unknown rule ids: {sorted(unknown)}')
+
+        for category, rules in self.by_category.items():
+            if categories is not None and category not in categories:
+                continue
+            for rule in rules:
+                if rule_ids is None or rule.rule_id in rule_ids:
+                    yield rule
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __add__(self, other: 'RuleSet') -> 'RuleSet':
+        return RuleSet(self.rules + other.rules)
+
+
+def _fixed(value: Any) -> Callable[[Any], Any]:
+    # Hand out a fresh copy of fixed dicts so callers can't change the rule through a test case
+    if isinstance(value, dict):
+        return lambda _: dict(value)
+    return lambda _: value
+
+
+# Payload mutators. Each one returns a new top-level dict and leaves its input untouched.
+
+def map_fields(transform: Callable[[str, Any], Any]) -> Callable[[Dict], Dict]:
+    """Mutator that replaces every top-level field value with transform(key, value)"""
+    def mutate(payload: Dict) -> Dict:
+        modified = payload.copy()
+        for key, value in payload.items():
+            modified[key] = transform(key, value)
+        return modified
+    return mutate
+
+
+def replace_strings(replacement: str) -> Callable[[Dict], Dict]:
+    """Mutator that replaces every top-level string value"""
+    return map_fields(lambda key, value: replacement if isinstance(value, str) else value)
+
+
+def minimal_valid_payload(payload: Dict) -> Dict:
+    """Keep only the fields that look required"""
+    # This is a simplified approach - in real implementation,
+    # you'd need schema information to determine required fields
+    essential_keys = ['id', 'name', 'title', 'email', 'username']
+    minimal = {}
+    for key, value in payload.items():
+        if any(essential in key.lower() for essential in essential_keys):
+            minimal[key] = value
+    return minimal if minimal else payload
+
+
+def remove_first_field(payload: Dict) -> Dict:
+    """Remove a field to test missing required fields"""
+    modified = payload.copy()
+    for key in list(modified.keys())[:1]:
+        modified.pop(key, None)
+    return modified
+
+
+def invalid_data_type(key: str, value: Any) -> Any:
+    if isinstance(value, str):
+        return 12345
+    if isinstance(value, (int, float)):
+        return "invalid_number"
+    return value
+
+
+def add_fields(fields: Dict[str, Any]) -> Callable[[Dict], Dict]:
+    """Mutator that adds (or overwrites) top-level fields"""
+    def mutate(payload: Dict) -> Dict:
+        modified = payload.copy()
+        modified.update(fields)
+        return modified
+    return mutate
+
+
+ENUM_FIELDS = ['status', 'type', 'category', 'role', 'priority']
+
+
+def invalid_enum(key: str, value: Any) -> Any:
+    if any(enum_field in key.lower() for enum_field in ENUM_FIELDS):
+        return "INVALID_ENUM_VALUE"
+    return value
+
+
+def invalid_format(key: str, value: Any) -> Any:
+    if isinstance(value, str):
+        if 'email' in key.lower():
+            return "invalid.email.format"
+        elif 'date' in key.lower():
+            return "not-a-date"
+        elif 'url' in key.lower():
+            return "not://valid.url"
+        elif 'phone' in key.lower():
+            return "not-a-phone-number"
+    return value
+
+
+def replace_numbers(int_value: Any, float_value: Any) -> Callable[[Dict], Dict]:
+    """Mutator that replaces top-level ints (and bools) and floats"""
+    def transform(key: str, value: Any) -> Any:
+        if isinstance(value, int):
+            return int_value
+        if isinstance(value, float):
+            return float_value
+        return value
+    return map_fields(transform)
+
+
+def max_array(payload: Dict) -> Dict:
+    """Replace lists (and tags/items fields) with a 1000 element array"""
+    large_array = ["item"] * 1000
+    return map_fields(
+        lambda key, value: large_array if isinstance(value, list) or 'tags' in key.lower() or 'items' in key.lower()
+        else value
+    )(payload)
+
+
+def precision_float(key: str, value: Any) -> Any:
+    if isinstance(value, float):
+        return 3.141592653589793238462643383279502884197
+    if isinstance(value, (int, str)) and 'price' in key.lower():
+        return 999999.999999999999999999
+    return value
+
+
+def multiline_description(key: str, value: Any) -> Any:
+    if isinstance(value, str) and 'description' in key.lower():
+        return "This is line 1\\nThis is line 2\\nThis is line 3"
+    return value
+
+
+def transform_strings(transform: Callable[[str], Any]) -> Callable[[Dict], Dict]:
+    """Mutator that replaces every top-level string value with transform(value)"""
+    return map_fields(lambda key, value: transform(value) if isinstance(value, str) else value)
+
+
+def alternate_case(value: str) -> str:
+    return ''.join(c.upper() if i % 2 == 0 else c.lower() for i, c in enumerate(value))
+
+
+def numeric_string(key: str, value: Any) -> Any:
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+def nosql_operator(key: str, value: Any) -> Any:
+    if isinstance(value, str):
+        return {"$ne": None}
+    if isinstance(value, (int, float)):
+        return {"$gt": ""}
+    return value
+
+
+def malicious_file(key: str, value: Any) -> Any:
+    if 'file' in key.lower() or 'upload' in key.lower():
+        return "../../../etc/passwd"
+    return value
+
+
+# Header mutators
+
+def without_auth_headers(headers: Dict) -> Dict:
+    return {k: v for k, v in headers.items() if 'authorization' not in k.lower() and 'token' not in k.lower()}
+
+
+def set_header(name: str, value: str) -> Callable[[Dict], Dict]:
+    def mutate(headers: Dict) -> Dict:
+        modified = headers.copy()
+        modified[name] = value
+        return modified
+    return mutate
+
+
+XXE_PATTERN = "<?xml version='1.0'?><!DOCTYPE root [<!ENTITY test SYSTEM 'file:///etc/passwd'>]><root>&test;</root>"
+MINIMAL_HEADERS = {"accept": "application/json"}
+NEGATIVE = {'expected_status': 422, 'expected_schema': {}}
+
+
+# Requests with a JSON body (POST, PUT, PATCH)
+BODY_RULES = RuleSet([
+    MutationRule('body.positive.valid', 'Positive',
+                 "Test with all valid inputs as specified in API information"),
+    MutationRule('body.positive.minimal', 'Positive',
+                 "Test with minimal valid payload (only required fields)",
+                 payload=minimal_valid_payload),
+
+    MutationRule('body.negative.empty_payload', 'Negative', "Test with empty payload",
+                 payload={}, **NEGATIVE),
+    MutationRule('body.negative.missing_fields', 'Negative', "Test with missing required fields",
+                 payload=remove_first_field, **NEGATIVE),
+    MutationRule('body.negative.invalid_types', 'Negative', "Test with invalid data types",
+                 payload=map_fields(invalid_data_type), **NEGATIVE),
+    MutationRule('body.negative.null_values', 'Negative', "Test with null values in required fields",
+                 payload=map_fields(lambda key, value: None), **NEGATIVE),
+    MutationRule('body.negative.malformed_json', 'Negative', "Test with malformed JSON payload",
+                 payload="invalid_json_string", expected_status=400, expected_schema={}),
+    MutationRule('body.negative.unknown_fields', 'Negative', "Test with unknown/extra fields in payload",
+                 payload=add_fields({
+                     "unknown_field_1": "unexpected_value",
+                     "extra_param": 999,
+                     "invalid_key": ["unexpected", "array"],
+                     "nested_unknown": {"surprise": "field"}
+                 }), **NEGATIVE),
+    MutationRule('body.negative.invalid_enum', 'Negative', "Test with invalid enum/choice values",
+                 payload=map_fields(invalid_enum), **NEGATIVE),
+    MutationRule('body.negative.invalid_format', 'Negative', "Test with invalid format values (email, date, URL)",
+                 payload=map_fields(invalid_format), **NEGATIVE),
+
+    MutationRule('body.boundary.max_length', 'Boundary', "Test with maximum length strings (boundary condition)",
+                 payload=replace_strings("A" * 1000)),
+    MutationRule('body.boundary.min_length', 'Boundary', "Test with minimum length strings (boundary condition)",
+                 payload=replace_strings("A")),
+    MutationRule('body.boundary.max_numeric', 'Boundary', "Test with maximum numeric values (boundary condition)",
+                 payload=replace_numbers(2147483647, 1.7976931348623157e+308)),
+    MutationRule('body.boundary.zero_values', 'Boundary', "Test with zero values (boundary condition)",
+                 payload=replace_numbers(0, 0)),
+    MutationRule('body.boundary.empty_strings', 'Boundary', "Test with empty strings (boundary condition)",
+                 payload=replace_strings(""), expected_status=422),
+    MutationRule('body.boundary.large_payload', 'Boundary', "Test with very large payload size (boundary condition)",
+                 payload=add_fields({f"large_field_{i}": "A" * 100 for i in range(100)}), expected_status=413),
+    MutationRule('body.boundary.min_numeric', 'Boundary', "Test with minimum numeric values (boundary condition)",
+                 payload=replace_numbers(-2147483648, -1.7976931348623157e+308)),
+    MutationRule('body.boundary.length_limit', 'Boundary', "Test with strings at exact length limit (255 chars)",
+                 payload=replace_strings("A" * 255)),
+    MutationRule('body.boundary.over_length_limit', 'Boundary', "Test with strings one character over limit (256 chars)",
+                 payload=replace_strings("A" * 256), expected_status=422),
+    MutationRule('body.boundary.max_array', 'Boundary', "Test with maximum array/list size (boundary condition)",
+                 payload=max_array),
+    MutationRule('body.boundary.empty_array', 'Boundary', "Test with empty arrays (boundary condition)",
+                 payload=map_fields(lambda key, value: [] if isinstance(value, list) else value)),
+    MutationRule('body.boundary.float_precision', 'Boundary',
+                 "Test with maximum float precision values (boundary condition)",
+                 payload=map_fields(precision_float)),
+
+    MutationRule('body.semantic.multiline', 'Semantic', "Test with multiline text in description field",
+                 payload=map_fields(multiline_description)),
+    MutationRule('body.semantic.special_chars', 'Semantic', "Test with special characters in input fields",
+                 payload=transform_strings(lambda value: f"{value} !@#$%^&*()_+-=")),
+    MutationRule('body.semantic.unicode', 'Semantic', "Test with Unicode characters in text fields",
+                 payload=transform_strings(lambda value: f"{value} 测试 🚀 ñáéíóú")),
+    MutationRule('body.semantic.whitespace', 'Semantic', "Test with leading and trailing whitespace in text fields",
+                 payload=transform_strings(lambda value: f"  {value}  \t\n")),
+    MutationRule('body.semantic.mixed_case', 'Semantic', "Test with mixed case values for case-sensitive fields",
+                 payload=transform_strings(alternate_case)),
+    MutationRule('body.semantic.numeric_strings', 'Semantic', "Test with numeric values as strings vs actual numbers",
+                 payload=map_fields(numeric_string)),
+
+    MutationRule('body.security.sql_injection', 'Security', "Test with SQL injection patterns in input fields",
+                 payload=replace_strings("'; DROP TABLE users; --"), expected_status=400),
+    MutationRule('body.security.xss', 'Security', "Test with XSS (Cross-Site Scripting) patterns in input fields",
+                 payload=replace_strings("<script>alert('XSS')</script>"), expected_status=400),
+    MutationRule('body.security.command_injection', 'Security', "Test with command injection patterns in input fields",
+                 payload=replace_strings("; ls -la"), expected_status=400),
+    MutationRule('body.security.path_traversal', 'Security', "Test with path traversal patterns in input fields",
+                 payload=replace_strings("../../../etc/passwd"), expected_status=400),
+    MutationRule('body.security.no_auth', 'Security', "Test without authentication headers (security validation)",
+                 headers=without_auth_headers, expected_status=401),
+    MutationRule('body.security.invalid_content_type', 'Security',
+                 "Test with invalid content-type header (security validation)",
+                 headers=set_header('content-type', 'text/plain'), expected_status=415),
+    MutationRule('body.security.ldap_injection', 'Security', "Test with LDAP injection patterns in input fields",
+                 payload=replace_strings("*)(uid=*))(|(uid=*"), expected_status=400),
+    MutationRule('body.security.nosql_injection', 'Security', "Test with NoSQL injection patterns in input fields",
+                 payload=map_fields(nosql_operator), expected_status=400),
+    MutationRule('body.security.xxe', 'Security', "Test with XXE (XML External Entity) patterns in input fields",
+                 payload=replace_strings(XXE_PATTERN), expected_status=400),
+    MutationRule('body.security.ssti', 'Security', "Test with Server-Side Template Injection patterns",
+                 payload=replace_strings("{{7*7}}"), expected_status=400),
+    MutationRule('body.security.malicious_file', 'Security', "Test with malicious file upload patterns",
+                 payload=map_fields(malicious_file), expected_status=400),
+    MutationRule('body.security.rate_limit', 'Security', "Test for rate limiting protection (security validation)",
+                 expected_status=429),
+])
+
+
+# Requests without a body (GET, DELETE, ...): mutations go to the URL, query and headers
+QUERY_RULES = RuleSet([
+    MutationRule('query.positive.valid', 'Positive', "Test fetching data with valid parameters"),
+    MutationRule('query.positive.minimal_headers', 'Positive',
+                 "Test with minimal valid headers and no query parameters",
+                 headers=MINIMAL_HEADERS, query_params=None),
+
+    MutationRule('query.negative.invalid_path', 'Negative', "Test with invalid endpoint path",
+                 endpoint=lambda url: url + "/invalid", expected_status=404, expected_schema={}),
+    MutationRule('query.negative.invalid_params', 'Negative', "Test with invalid query parameters",
+                 query_params={"invalid_param": "invalid_value"}, expected_status=400, expected_schema={}),
+    MutationRule('query.negative.missing_headers', 'Negative', "Test with missing required headers",
+                 headers=MINIMAL_HEADERS, expected_status=400, expected_schema={}),
+    MutationRule('query.negative.malformed_request', 'Negative', "Test with malformed request structure",
+                 endpoint=lambda url: url.replace("https://", "http://"), expected_status=400, expected_schema={}),
+    MutationRule('query.negative.nonexistent_id', 'Negative', "Test with non-existent resource ID",
+                 query_params={"id": "999999999"}, expected_status=404, expected_schema={}),
+    MutationRule('query.negative.invalid_method', 'Negative', "Test with invalid HTTP method",
+                 method="INVALID", expected_status=405, expected_schema={}),
+    MutationRule('query.negative.malformed_values', 'Negative', "Test with malformed query parameter values",
+                 query_params={"date": "invalid-date-format", "number": "not-a-number"},
+                 expected_status=400, expected_schema={}),
+    MutationRule('query.negative.duplicate_params', 'Negative', "Test with duplicate query parameter names",
+                 endpoint=lambda url: url + "?param=value1&param=value2", query_params=None,
+                 expected_status=400, expected_schema={}),
+
+    MutationRule('query.boundary.max_length', 'Boundary',
+                 "Test with maximum length query parameters (boundary condition)",
+                 query_params=lambda query_params: (
+                     {k: "A" * 1000 for k in query_params} if query_params else {"test": "A" * 1000}
+                 ),
+                 expected_status=414),
+    MutationRule('query.boundary.empty_params', 'Boundary', "Test with empty query parameters (boundary condition)",
+                 query_params={}),
+    MutationRule('query.boundary.zero_values', 'Boundary',
+                 "Test with zero values in numeric parameters (boundary condition)",
+                 query_params={"id": "0", "page": "0", "limit": "0"}),
+    MutationRule('query.boundary.negative_values', 'Boundary',
+                 "Test with negative values in numeric parameters (boundary condition)",
+                 query_params={"id": "-1", "page": "-5"}, expected_status=400),
+    MutationRule('query.boundary.large_values', 'Boundary', "Test with very large numeric values (boundary condition)",
+                 query_params={"id": "999999999", "limit": "2147483647"}, expected_status=400),
+    MutationRule('query.boundary.max_url_length', 'Boundary', "Test with maximum URL length (boundary condition)",
+                 endpoint=lambda url: url + "?" + "&".join([f"param{i}=value{i}" for i in range(100)]),
+                 query_params=None, expected_status=414),
+    MutationRule('query.boundary.single_char', 'Boundary',
+                 "Test with single character query parameters (boundary condition)",
+                 query_params={"q": "a", "s": "1"}),
+    MutationRule('query.boundary.max_int', 'Boundary',
+                 "Test with maximum integer boundary values (boundary condition)",
+                 query_params={"int32": "2147483647", "int64": "9223372036854775807"}),
+    MutationRule('query.boundary.min_int', 'Boundary',
+                 "Test with minimum integer boundary values (boundary condition)",
+                 query_params={"int32": "-2147483648", "int64": "-9223372036854775808"}),
+    MutationRule('query.boundary.empty_strings', 'Boundary',
+                 "Test with empty string query parameters (boundary condition)",
+                 query_params={"search": "", "filter": ""}),
+
+    MutationRule('query.semantic.special_chars', 'Semantic', "Test with special characters in query parameters",
+                 query_params={"search": "test@#$%^&*()"}),
+    MutationRule('query.semantic.unicode', 'Semantic', "Test with Unicode characters in query parameters",
+                 query_params={"search": "测试数据🚀"}),
+    MutationRule('query.semantic.url_encoded', 'Semantic', "Test with URL encoded characters in query parameters",
+                 query_params={"search": "hello%20world"}),
+    MutationRule('query.semantic.case_sensitive_names', 'Semantic', "Test with case-sensitive query parameter names",
+                 query_params={"Search": "test", "FILTER": "value", "search": "test2"}),
+    MutationRule('query.semantic.boolean_strings', 'Semantic',
+                 "Test with boolean-like string values in query parameters",
+                 query_params={"active": "true", "enabled": "false", "visible": "1", "hidden": "0"}),
+    MutationRule('query.semantic.datetime_formats', 'Semantic',
+                 "Test with various date and time formats in query parameters",
+                 query_params={"start_date": "2024-01-01", "end_date": "2024-12-31T23:59:59Z",
+                               "timestamp": "1640995200"}),
+
+    MutationRule('query.security.sql_injection', 'Security', "Test with SQL injection patterns in query parameters",
+                 query_params={"search": "'; DROP TABLE users; --"}, expected_status=400),
+    MutationRule('query.security.xss', 'Security', "Test with XSS patterns in query parameters",
+                 query_params={"search": "<script>alert('XSS')</script>"}, expected_status=400),
+    MutationRule('query.security.path_traversal', 'Security', "Test with path traversal patterns in query parameters",
+                 query_params={"file": "../../../etc/passwd"}, expected_status=400),
+    MutationRule('query.security.no_auth', 'Security', "Test without authentication headers (security validation)",
+                 headers=without_auth_headers, expected_status=401),
+    MutationRule('query.security.invalid_accept', 'Security', "Test with invalid accept header (security validation)",
+                 headers=set_header('accept', 'text/html'), expected_status=406),
+    MutationRule('query.security.command_injection', 'Security',
+                 "Test with command injection patterns in query parameters",
+                 query_params={"cmd": "; ls -la", "exec": "| cat /etc/passwd"}, expected_status=400),
+    MutationRule('query.security.ldap_injection', 'Security', "Test with LDAP injection patterns in query parameters",
+                 query_params={"user": "admin)(|(password=*))", "filter": "*)(uid=*))(|(uid=*"}, expected_status=400),
+    MutationRule('query.security.nosql_injection', 'Security', "Test with NoSQL injection patterns in query parameters",
+                 query_params={"id": "1'; return true; //", "filter": "{$where: 'this.name == this.name'}"},
+                 expected_status=400),
+    MutationRule('query.security.header_injection', 'Security', "Test with HTTP header injection patterns",
+                 headers=set_header('X-Custom-Header', "value\r\nX-Injected: malicious"), expected_status=400),
+    MutationRule('query.security.template_injection', 'Security',
+                 "Test with server-side template injection patterns in query parameters",
+                 query_params={"template": "{{7*7}}", "expr": "${7*7}", "code": "<%=7*7%>"}, expected_status=400),
+])
+
+
+def is_string(path: Path, value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def is_number(path: Path, value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_scalar(path: Path, value: Any) -> bool:
+    return isinstance(value, (str, int, float))
+
+
+def is_object_member(path: Path, value: Any) -> bool:
+    return isinstance(path[-1], str)
+
+
+def is_non_empty_array(path: Path, value: Any) -> bool:
+    return isinstance(value, list) and bool(value)
+
+
+# Opt-in per-field rules for JSON payloads: one case per matching field
+FIELD_RULES = RuleSet([
+    FieldRule('field.negative.missing', 'Negative', "Test with field {path} removed",
+              is_object_member, lambda value: DELETE, **NEGATIVE),
+    FieldRule('field.negative.null', 'Negative', "Test with null value in field {path}",
+              lambda path, value: value is not None, lambda value: None, **NEGATIVE),
+    FieldRule('field.negative.invalid_type', 'Negative', "Test with invalid data type in field {path}",
+              is_scalar, lambda value: invalid_data_type('', value), **NEGATIVE),
+
+    FieldRule('field.boundary.max_length', 'Boundary', "Test with maximum length string in field {path}",
+              is_string, lambda value: "A" * 1000),
+    FieldRule('field.boundary.empty_string', 'Boundary', "Test with empty string in field {path}",
+              is_string, lambda value: "", expected_status=422),
+    FieldRule('field.boundary.max_numeric', 'Boundary', "Test with maximum numeric value in field {path}",
+              is_number, lambda value: 2147483647 if isinstance(value, int) else 1.7976931348623157e+308),
+    FieldRule('field.boundary.empty_array', 'Boundary', "Test with empty array in field {path}",
+              is_non_empty_array, lambda value: []),
+
+    FieldRule('field.security.sql_injection', 'Security', "Test with SQL injection pattern in field {path}",
+              is_string, lambda value: "'; DROP TABLE users; --", expected_status=400),
+    FieldRule('field.security.xss', 'Security', "Test with XSS pattern in field {path}",
+              is_string, lambda value: "<script>alert('XSS')</script>", expected_status=400),
+])
+
+# Body rules followed, within each category, by the per-field rules
+BODY_FIELD_RULES = BODY_RULES + FIELD_RULES
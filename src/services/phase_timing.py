@@ -0,0 +1,178 @@
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import connection
+from urllib3.util.connection import allowed_gai_family
+
+PHASES = ('dns', 'connect', 'tls', 'write', 'ttfb', 'download')
+
+# httpcore trace events (the part after the 'connection.'/'http11.'/'http2.'
+# prefix) that start and end each phase
+TRACE_STARTS = {
+    'connect_tcp.started': 'connect',
+    'start_tls.started': 'tls',
+    'send_request_headers.started': 'write',
+    'receive_response_headers.started': 'ttfb'
+}
+TRACE_ENDS = {
+    'connect_tcp': 'connect',
+    'start_tls': 'tls',
+    'send_request_body': 'write',
+    'receive_response_headers': 'ttfb'
+}
+
+_current = threading.local()
+
+
+class PhaseTimer:
+    """
+    Per-request time spent in each phase (seconds, perf_counter based):
+    dns, connect (TCP), tls, write (request headers and body), ttfb (request
+    sent to response headers) and download (body). Phases of a reused
+    connection stay 0; redirects add up. The async backend cannot separate
+    name resolution from connecting, so there dns is None and included in connect.
+    """
+
+    def __init__(self, resolves_dns: bool = True):
+        self.phases: Dict[str, Optional[float]] = dict.fromkeys(PHASES, 0.0)
+        if not resolves_dns:
+            self.phases['dns'] = None
+        self._started: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = (self.phases[phase] or 0.0) + max(seconds, 0.0)
+
+    def recorded(self) -> float:
+        return sum(seconds for seconds in self.phases.values() if seconds)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as one phase, excluding phases recorded inside it (e.g. a lazy connect)"""
+        started = time.perf_counter()
+        nested = self.recorded()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.add(name, elapsed - (self.recorded() - nested))
+
+    @contextmanager
+    def activate(self):
+        """Make this the timer of the current thread's requests (thread backend)"""
+        previous = getattr(_current, 'timer', None)
+        _current.timer = self
+        try:
+            yield self
+        finally:
+            _current.timer = previous
+
+    async def trace(self, event_name: str, info: Dict[str, Any]):
+        """httpx/httpcore 'trace' extension callback (async backend)"""
+        event = event_name.split('.', 1)[-1]
+        if event in TRACE_STARTS:
+            self._started[TRACE_STARTS[event]] = time.perf_counter()
+            return
+        step, _, state = event.rpartition('.')
+        phase = TRACE_ENDS.get(step)
+        if phase and state in ('complete', 'failed') and phase in self._started:
+            self.add(phase, time.perf_counter() - self._started.pop(phase))
+
+    def timings(self, total: float) -> Dict[str, Any]:
+        """The phases plus the total response time"""
+        return dict(self.phases, total=total)
+
+
+def current_timer() -> Optional[PhaseTimer]:
+    return getattr(_current, 'timer', None)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """urllib3 connection that reports dns, connect, write and ttfb to the thread's PhaseTimer"""
+
+    def _new_conn(self) -> socket.socket:
+        timer = current_timer()
+        if timer is None:
+            return super()._new_conn()
+
+        with timer.phase('dns'):
+            try:
+                addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+            except socket.gaierror as e:
+                raise NameResolutionError(self.host, self, e) from e
+
+        # Connect to the resolved addresses in order (as create_connection
+        # does), so the lookup is not repeated inside the connect phase
+        with timer.phase('connect'):
+            error = None
+            for _family, _type, _proto, _canonname, sockaddr in addresses:
+                try:
+                    sock = connection.create_connection(
+                        (sockaddr[0], self.port),
+                        self.timeout,
+                        source_address=self.source_address,
+                        socket_options=self.socket_options,
+                    )
+                    break
+                except socket.timeout as e:
+                    raise ConnectTimeoutError(
+                        self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+                    ) from e
+                except OSError as e:
+                    error = e
+            else:
+                raise NewConnectionError(self, f"Failed to establish a new connection: {error}") from error
+
+        sys.audit("http.client.connect", self, self.host, self.port)
+        return sock
+
+    def request(self, *args, **kwargs):
+        timer = current_timer()
+        if timer is None:
+            return super().request(*args, **kwargs)
+        with timer.phase('write'):
+            return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        timer = current_timer()
+        if timer is None:
+            return super().getresponse(*args, **kwargs)
+        with timer.phase('ttfb'):
+            return super().getresponse(*args, **kwargs)
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """TimedHTTPConnection over TLS; the handshake is reported as tls"""
+
+    def connect(self):
+        timer = current_timer()
+        if timer is None:
+            return super().connect()
+        with timer.phase('tls'):
+            return super().connect()
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report phase timings"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool
+        }
@@ -0,0 +1,88 @@
+import importlib.util
+import math
+import os
+from typing import Dict, Any, Callable
+
+# Hard limit on prompt size (system + user message). gpt-4 has an 8k context and
+# the completion is allowed up to 4000 tokens, so the prompt has to stay below that.
+PROMPT_TOKEN_BUDGET = int(os.getenv('PROMPT_TOKEN_BUDGET', '3500'))
+
+# Exact token counts need the optional tiktoken package; otherwise ~4 characters per token
+TIKTOKEN_AVAILABLE = importlib.util.find_spec('tiktoken') is not None
+CHARS_PER_TOKEN = 4
+
+# Progressively smaller response summaries tried until the prompt fits the budget
+SUMMARY_LEVELS = [
+    {'max_items': 3, 'max_string': 80, 'max_depth': 6},
+    {'max_items': 2, 'max_string': 40, 'max_depth': 4},
+    {'max_items': 1, 'max_string': 20, 'max_depth': 2},
+]
+OMITTED_CONTENT = '<response content omitted to fit the prompt budget>'
+
+
+class PromptBudgetExceeded(ValueError):
+    """The prompt does not fit PROMPT_TOKEN_BUDGET even with the response content omitted"""
+
+
+_encoding = None
+
+
+def estimate_tokens(text: str) -> int:
+    """Count (or, without tiktoken, estimate) the tokens in text"""
+    global _encoding
+    if TIKTOKEN_AVAILABLE:
+        if _encoding is None:
+            import tiktoken
+            _encoding = tiktoken.get_encoding('cl100k_base')
+        return len(_encoding.encode(text))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def summarize_response(content: Any, max_items: int = 3, max_string: int = 80, max_depth: int = 6) -> Any:
+    """
+    Reduce a response body to a compact structural summary: objects keep every key,
+    arrays keep their first max_items elements plus a count of the rest, long strings
+    are cut to max_string characters and anything nested deeper than max_depth is
+    replaced by its type.
+    """
+    if isinstance(content, dict):
+        if max_depth <= 0:
+            return f'<object with {len(content)} keys>'
+        return {
+            key: summarize_response(value, max_items, max_string, max_depth - 1)
+            for key, value in content.items()
+        }
+    if isinstance(content, list):
+        if max_depth <= 0:
+            return f'<array of {len(content)} items>'
+        summary = [summarize_response(item, max_items, max_string, max_depth - 1) for item in content[:max_items]]
+        if len(content) > max_items:
+            summary.append(f'<{len(content) - max_items} more items>')
+        return summary
+    if isinstance(content, str) and len(content) > max_string:
+        return f'{content[:max_string]}<{len(content) - max_string} more chars>'
+    return content
+
+
+def fit_prompt(build_prompt: Callable[[Dict[str, Any]], str], api_info: Dict[str, Any],
+               system_prompt: str = '', budget: int = PROMPT_TOKEN_BUDGET) -> str:
+    """
+    Build the prompt from api_info with its response content summarized, shrinking
+    the summary until the prompt fits the token budget.
+    Raises PromptBudgetExceeded if it does not fit even without the response content.
+    """
+    response = api_info.get('response') or {}
+    content = response.get('content', {})
+    system_tokens = estimate_tokens(system_prompt) if system_prompt else 0
+
+    candidates = [summarize_response(content, **level) for level in SUMMARY_LEVELS]
+    candidates.append(OMITTED_CONTENT)
+    tokens = None
+    for summary in candidates:
+        compact_info = dict(api_info, response=dict(response, content=summary))
+        prompt = build_prompt(compact_info)
+        tokens = system_tokens + estimate_tokens(prompt)
+        if tokens <= budget:
+            return prompt
+
+    raise PromptBudgetExceeded(f'Prompt needs {tokens} tokens, budget is {budget}')
@@ -0,0 +1,228 @@
+import asyncio
+import math
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+from src.services.http_pool import origin_key
+
+# Requests per second and burst allowed per target host. 0 means no fixed
+# limit: requests are only held back when the target signals a limit.
+DEFAULT_RATE_LIMIT_RPS = float(os.getenv('EXECUTION_RATE_LIMIT_RPS', '0'))
+DEFAULT_RATE_LIMIT_BURST = int(os.getenv('EXECUTION_RATE_LIMIT_BURST', '5'))
+# Upper bound on a wait requested by Retry-After / X-RateLimit-Reset, and the
+# pause after a 429 that does not say how long to wait
+MAX_RATE_LIMIT_WAIT = float(os.getenv('EXECUTION_RATE_LIMIT_MAX_WAIT', '60'))
+DEFAULT_429_BACKOFF = 1.0
+# How often callers check whether the probe request after a pause has returned,
+# and how long before another probe is sent if it never does (e.g. it failed)
+PROBE_POLL_INTERVAL = 0.05
+PROBE_TIMEOUT = 5.0
+
+REMAINING_HEADERS = ('x-ratelimit-remaining', 'ratelimit-remaining')
+RESET_HEADERS = ('x-ratelimit-reset', 'ratelimit-reset')
+# Reset values above this are epoch timestamps rather than seconds from now
+EPOCH_THRESHOLD = 10 ** 9
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After value (delay-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds until an X-RateLimit-Reset (delta seconds or epoch timestamp)"""
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return None
+    if reset > EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0.0)
+
+
+def first_header(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            # Some APIs list one value per policy; the first is the one in effect
+            return str(value).split(',')[0].strip()
+    return None
+
+
+class TokenBucket:
+    """
+    Token bucket for one host: rate tokens per second up to burst. The target
+    can lower the rate (X-RateLimit-Remaining over the time to X-RateLimit-Reset)
+    or pause the bucket (Retry-After, exhausted limit). After a pause a single
+    probe request goes out and the rest wait for its response, which tells the
+    limiter what the target now allows; responses to requests sent before the
+    pause ended do not count as that answer. Waiting callers retry with
+    whatever rate is in effect when they wake up.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate if rate > 0 else math.inf
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.limit_rate: Optional[float] = None
+        self.limit_until = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def _rate_at(self, when: float) -> float:
+        if self.limit_rate is not None and when < self.limit_until:
+            return min(self.rate, self.limit_rate)
+        return self.rate
+
+    def try_acquire(self) -> float:
+        """Take a token and return 0, or return how long to wait before trying again"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.probing:
+                if self.tokens >= 1 or now - self.updated > PROBE_TIMEOUT:
+                    self.tokens = 0.0
+                    self.updated = now
+                    return 0.0
+                return PROBE_POLL_INTERVAL
+            rate = self._rate_at(now)
+            if now > self.updated:
+                self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * rate)
+                self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / rate
+
+    def block(self, seconds: float):
+        """Send nothing for the next seconds, then a single probe request"""
+        with self._lock:
+            until = time.monotonic() + min(seconds, MAX_RATE_LIMIT_WAIT)
+            if until > self.blocked_until:
+                self.blocked_until = until
+                # No tokens accumulate during the pause
+                self.updated = until
+                self.tokens = 1.0
+                self.probing = True
+
+    def resume(self, sent_at: Optional[float] = None):
+        """
+        A response arrived: refill at the bucket's rate again (unless it pauses
+        the bucket anew). sent_at is when its request was sent (time.monotonic);
+        only a request sent after the pause, i.e. the probe, ends probing.
+        """
+        with self._lock:
+            if self.probing and (sent_at is None or sent_at >= self.blocked_until):
+                self.probing = False
+                self.updated = max(self.updated, time.monotonic())
+
+    def limit(self, remaining: float, reset: float):
+        """Spread the remaining requests of the target's window over the time until it resets"""
+        reset = min(reset, MAX_RATE_LIMIT_WAIT)
+        if reset <= 0:
+            return
+        with self._lock:
+            self.limit_rate = remaining / reset
+            self.limit_until = time.monotonic() + reset
+
+
+class RateLimiter:
+    """
+    Per-host (scheme, host, port) token buckets shared by the workers of a run.
+    Executors acquire before each request and report every response back, so
+    the buckets follow Retry-After and X-RateLimit-* headers.
+    """
+
+    def __init__(self, rps: Optional[float] = None, burst: Optional[int] = None):
+        self.rps = DEFAULT_RATE_LIMIT_RPS if rps is None else rps
+        self.burst = DEFAULT_RATE_LIMIT_BURST if burst is None else burst
+        if self.rps < 0 or self.burst < 1:
+            raise ValueError('rate_limit_rps must be >= 0 and rate_limit_burst >= 1')
+        self._buckets: Dict[Tuple[str, str, int], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any]) -> 'RateLimiter':
+        """Build the limiter of a run from its rate_limit_rps and rate_limit_burst options"""
+        try:
+            rps = float(options['rate_limit_rps']) if options.get('rate_limit_rps') is not None else None
+            burst = int(options['rate_limit_burst']) if options.get('rate_limit_burst') is not None else None
+        except (TypeError, ValueError):
+            raise ValueError('rate_limit_rps and rate_limit_burst must be numbers')
+        return cls(rps, burst)
+
+    def bucket(self, url: str) -> TokenBucket:
+        key = origin_key(url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rps, self.burst)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to url may be sent; returns the time waited"""
+        bucket = self.bucket(url)
+        waited = 0.0
+        wait = bucket.try_acquire()
+        while wait > 0:
+            time.sleep(wait)
+            waited += wait
+            wait = bucket.try_acquire()
+        return waited
+
+    async def acquire_async(self, url: str) -> float:
+        """acquire for the async backend"""
+        bucket = self.bucket(url)
+        waited = 0.0
+        wait = bucket.try_acquire()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+            wait = bucket.try_acquire()
+        return waited
+
+    def observe(self, url: str, status_code: int, headers: Mapping[str, str],
+                sent_at: Optional[float] = None, exempt: bool = False):
+        """
+        Adapt the host's bucket to a response's rate-limit headers. sent_at is
+        when the request was sent (time.monotonic). Responses to exempt requests
+        (cases that expect a 429) never pause the bucket or end its probing.
+        """
+        bucket = self.bucket(url)
+        if not exempt:
+            bucket.resume(sent_at)
+            if status_code in (429, 503):
+                retry_after = parse_retry_after(headers.get('retry-after'))
+                if retry_after is not None:
+                    bucket.block(retry_after)
+                elif status_code == 429:
+                    bucket.block(DEFAULT_429_BACKOFF)
+
+        remaining = first_header(headers, REMAINING_HEADERS)
+        reset = parse_reset(first_header(headers, RESET_HEADERS))
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return
+        if remaining > 0:
+            bucket.limit(remaining, reset)
+        elif not exempt:
+            bucket.block(reset)
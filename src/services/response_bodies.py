@@ -0,0 +1,61 @@
+import hashlib
+import json
+from typing import Dict, Any, Iterable, Optional
+
+
+def content_hash(content: Any) -> str:
+    """SHA-256 of a captured content value, as stored (parsed JSON or decoded text)"""
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResponseBodies:
+    """
+    Content-addressed response bodies of a set of execution results. Each
+    distinct body is kept once, keyed by the hash of its stored content, and
+    results refer to it by content_ref instead of carrying their own copy.
+    The raw body_sha256 is not used as the key: identical bytes served with a
+    different content-type or charset decode to different contents.
+    """
+
+    def __init__(self):
+        self.bodies: Dict[str, Any] = {}
+
+    def intern(self, execution_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return execution_result with its response content moved into the store and
+        replaced by a content_ref. The input is not modified; results without a
+        response (errors) or already interned are returned as they are.
+        """
+        response = execution_result.get('response')
+        if not isinstance(response, dict) or 'content' not in response:
+            return execution_result
+        response = dict(response)
+        content = response.pop('content')
+        ref = content_hash(content)
+        self.bodies.setdefault(ref, content)
+        response['content_ref'] = ref
+        return dict(execution_result, response=response)
+
+    def update(self, other: 'ResponseBodies'):
+        """Add the bodies of another store"""
+        for ref, content in other.bodies.items():
+            self.bodies.setdefault(ref, content)
+
+    def subset(self, refs: Iterable[str]) -> Dict[str, Any]:
+        """The {ref: content} entries for refs that are in the store"""
+        return {ref: self.bodies[ref] for ref in refs if ref in self.bodies}
+
+    def __contains__(self, ref: str) -> bool:
+        return ref in self.bodies
+
+    def __len__(self):
+        return len(self.bodies)
+
+
+def content_ref(execution_result: Optional[Dict[str, Any]]) -> Optional[str]:
+    """The content_ref of an interned execution result, if any"""
+    response = (execution_result or {}).get('response')
+    if isinstance(response, dict):
+        return response.get('content_ref')
+    return None
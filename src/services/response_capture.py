@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Any, AsyncIterable, Iterable, Optional
+
+# Response bodies are read as a stream. Only the first MAX_CAPTURE_BYTES are
+# kept (and returned as the content, or as a truncated preview); the size and
+# SHA-256 always cover the whole body.
+MAX_CAPTURE_BYTES = int(os.getenv('MAX_CAPTURE_BYTES', str(1024 * 1024)))
+CAPTURE_CHUNK_SIZE = int(os.getenv('CAPTURE_CHUNK_SIZE', str(64 * 1024)))
+# When set, bodies larger than MAX_CAPTURE_BYTES are written in full to this
+# directory as <sha256>.body
+RESPONSE_SPILL_DIR = os.getenv('RESPONSE_SPILL_DIR', '')
+
+
+class BodyCapture:
+    """
+    Consume a response body chunk by chunk in bounded memory: keep the first
+    max_bytes, count and hash everything and, with a spill_dir, write bodies
+    that do not fit to disk.
+    """
+
+    def __init__(self, max_bytes: int = MAX_CAPTURE_BYTES, spill_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.spill_dir = RESPONSE_SPILL_DIR if spill_dir is None else spill_dir
+        self.size = 0
+        self.truncated = False
+        self.path: Optional[str] = None
+        self._head = bytearray()
+        self._hash = hashlib.sha256()
+        self._spill = None
+
+    def feed(self, chunk: bytes):
+        if not chunk:
+            return
+        self.size += len(chunk)
+        self._hash.update(chunk)
+
+        room = self.max_bytes - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+        if len(chunk) <= room:
+            return
+
+        overflow = chunk[max(room, 0):]
+        if not self.truncated:
+            self.truncated = True
+            if self.spill_dir:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                self._spill = tempfile.NamedTemporaryFile(dir=self.spill_dir, suffix='.tmp', delete=False)
+                self._spill.write(self._head)
+        if self._spill is not None:
+            self._spill.write(overflow)
+
+    def finish(self):
+        """Call once the body is complete: moves a spilled body to its content-addressed path"""
+        if self._spill is None:
+            return
+        self._spill.close()
+        self.path = os.path.join(self.spill_dir, f'{self.sha256}.body')
+        os.replace(self._spill.name, self.path)
+        self._spill = None
+
+    def abort(self):
+        """Drop a partially spilled body (the read failed)"""
+        if self._spill is None:
+            return
+        self._spill.close()
+        try:
+            os.remove(self._spill.name)
+        except OSError:
+            pass
+        self._spill = None
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def head(self) -> bytes:
+        return bytes(self._head)
+
+    def fields(self, content_type: str = '', encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Response fields for the captured body: content (parsed JSON when the whole
+        body is JSON, else text; a preview of the first max_bytes if truncated),
+        body_size, body_sha256, truncated and, if spilled, body_path
+        """
+        content = None
+        if 'application/json' in (content_type or '') and not self.truncated:
+            try:
+                content = json.loads(self.head)
+            except ValueError:
+                pass
+        if content is None:
+            content = decode_text(self.head, encoding)
+
+        fields = {
+            'content': content,
+            'body_size': self.size,
+            'body_sha256': self.sha256,
+            'truncated': self.truncated
+        }
+        if self.path:
+            fields['body_path'] = self.path
+        return fields
+
+
+def decode_text(body: bytes, encoding: Optional[str]) -> str:
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+def capture_body(chunks: Iterable[bytes], max_bytes: int = MAX_CAPTURE_BYTES) -> BodyCapture:
+    """Read a (requests) body iterator to the end into a BodyCapture"""
+    body = BodyCapture(max_bytes)
+    try:
+        for chunk in chunks:
+            body.feed(chunk)
+    except BaseException:
+        body.abort()
+        raise
+    body.finish()
+    return body
+
+
+async def capture_body_async(chunks: AsyncIterable[bytes], max_bytes: int = MAX_CAPTURE_BYTES) -> BodyCapture:
+    """Read an (httpx) async body iterator to the end into a BodyCapture"""
+    body = BodyCapture(max_bytes)
+    try:
+        async for chunk in chunks:
+            body.feed(chunk)
+    except BaseException:
+        body.abort()
+        raise
+    body.finish()
+    return body
@@ -0,0 +1,256 @@
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from src.models.run import db, Run, RunCase, RunResult, ResponseBlob
+from src.services.curl_renderer import render_curl
+from src.services.response_bodies import ResponseBodies, content_ref
+
+# Bound on the number of SQL parameters in one IN (...) lookup
+BLOB_LOOKUP_BATCH = 500
+
+
+def minimize_test_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields needed to replay a test case (used for download)"""
+    minimized_case = {
+        'description': case.get('description'),
+        'method': case.get('method'),
+        'endpoint': case.get('endpoint'),
+        'headers': case.get('headers'),
+        'expected_status': case.get('expected_status'),
+    }
+    # Only add query_params if they exist and are not empty
+    if case.get('query_params'):
+        minimized_case['query_params'] = case['query_params']
+
+    # Only add payload if it exists and is not empty
+    if case.get('payload'):
+        minimized_case['payload'] = case['payload']
+
+    return minimized_case
+
+
+class RunStore:
+    """
+    SQLite-backed store for runs, their (minimized) test cases and execution results.
+    Runs are looked up by primary key and cases by their (run_id, ...) unique indexes.
+    """
+
+    def create_run(self, test_cases: Dict[str, Any], api_info: Optional[Dict[str, Any]] = None,
+                   kind: str = 'generate', used_ai: bool = False) -> str:
+        """Store a new run with its test cases and return the run id"""
+        api_info = api_info or {}
+        run = Run(kind=kind, method=api_info.get('method'), url=api_info.get('url'), used_ai=bool(used_ai))
+        db.session.add(run)
+        db.session.flush()
+
+        ordinal = 0
+        for category, cases in test_cases.items():
+            for position, case in enumerate(cases):
+                db.session.add(self._run_case(run.id, category, position, ordinal, case))
+                ordinal += 1
+
+        db.session.commit()
+        return run.id
+
+    def add_case(self, run_id: str, category: str, position: int, case: Dict[str, Any]):
+        """Append a case to a run whose suite is still being generated"""
+        self.add_cases(run_id, [(category, position, case)])
+
+    def add_cases(self, run_id: str, cases: Iterable[Tuple[str, int, Dict[str, Any]]]):
+        """Append (category, position, case) entries to an existing run"""
+        ordinal = db.session.query(RunCase.id).filter_by(run_id=run_id).count()
+        for category, position, case in cases:
+            db.session.add(self._run_case(run_id, category, position, ordinal, case))
+            ordinal += 1
+        db.session.commit()
+
+    @staticmethod
+    def _run_case(run_id: str, category: str, position: int, ordinal: int, case: Dict[str, Any]) -> RunCase:
+        minimized_case = minimize_test_case(case)
+        payload = minimized_case.pop('payload', None)
+        # Hedged runs tag each case with the generator it came from ('rules' or 'ai')
+        if case.get('source'):
+            minimized_case['source'] = case['source']
+        return RunCase(
+            run_id=run_id,
+            category=category,
+            position=position,
+            ordinal=ordinal,
+            data=json.dumps(minimized_case),
+            payload=json.dumps(payload) if payload is not None else None
+        )
+
+    def _case_ids(self, run_id: str) -> Dict[Tuple[str, int], int]:
+        rows = db.session.query(RunCase.category, RunCase.position, RunCase.id).filter_by(run_id=run_id)
+        return {(category, position): case_id for category, position, case_id in rows}
+
+    def record_results(self, run_id: str, results: Iterable[Tuple[str, int, Dict[str, Any], bool]],
+                       response_bodies: Optional[ResponseBodies] = None):
+        """
+        Store (category, position, execution_result, passed) results of a run.
+        Response bodies are stored once per hash: results keep only their
+        content_ref (inline content is interned first) and bodies from
+        response_bodies that are not stored yet are added.
+        """
+        bodies = response_bodies if response_bodies is not None else ResponseBodies()
+        refs = set()
+        case_ids = None
+        for category, position, execution_result, passed in results:
+            if case_ids is None:
+                case_ids = self._case_ids(run_id)
+            execution_result = bodies.intern(execution_result)
+            ref = content_ref(execution_result)
+            if ref:
+                refs.add(ref)
+            response = execution_result.get('response') or {}
+            db.session.add(RunResult(
+                case_id=case_ids[(category, position)],
+                run_id=run_id,
+                success=bool(execution_result.get('success')),
+                passed=bool(passed),
+                status_code=response.get('status_code'),
+                response_time=response.get('response_time'),
+                data=json.dumps(execution_result)
+            ))
+        self._store_bodies(bodies, refs)
+        db.session.commit()
+
+    def _store_bodies(self, bodies: ResponseBodies, refs: Iterable[str]):
+        refs = [ref for ref in refs if ref in bodies]
+        stored = set()
+        for start in range(0, len(refs), BLOB_LOOKUP_BATCH):
+            batch = refs[start:start + BLOB_LOOKUP_BATCH]
+            stored.update(sha for sha, in db.session.query(ResponseBlob.sha256).filter(ResponseBlob.sha256.in_(batch)))
+        for ref in refs:
+            if ref in stored:
+                continue
+            try:
+                # Another run may store the same body concurrently
+                with db.session.begin_nested():
+                    db.session.add(ResponseBlob(sha256=ref, content=json.dumps(bodies.bodies[ref])))
+            except IntegrityError:
+                pass
+
+    def get_response_bodies(self, refs: Iterable[str]) -> Dict[str, Any]:
+        """Return the stored {ref: content} bodies for refs"""
+        refs = list(set(refs))
+        bodies = {}
+        for start in range(0, len(refs), BLOB_LOOKUP_BATCH):
+            batch = refs[start:start + BLOB_LOOKUP_BATCH]
+            for blob in ResponseBlob.query.filter(ResponseBlob.sha256.in_(batch)):
+                bodies[blob.sha256] = json.loads(blob.content)
+        return bodies
+
+    def record_result(self, run_id: str, category: str, position: int, execution_result: Dict[str, Any],
+                      passed: bool, response_bodies: Optional[ResponseBodies] = None):
+        """Store the execution result of a single case"""
+        self.record_results(run_id, [(category, position, execution_result, passed)], response_bodies)
+
+    def finish_run(self, run_id: str, summary: Optional[Dict[str, Any]] = None, status: str = 'completed'):
+        """Mark a run as finished and keep its execution summary"""
+        run = db.session.get(Run, run_id)
+        if run is None:
+            return
+        run.status = status
+        run.summary = json.dumps(summary) if summary is not None else None
+        db.session.commit()
+
+    @staticmethod
+    def _load_case(run_case: RunCase) -> Dict[str, Any]:
+        case = json.loads(run_case.data)
+        if run_case.payload is not None:
+            case['payload'] = json.loads(run_case.payload)
+        return case
+
+    def get_test_cases(self, run_id: str) -> Optional[OrderedDict]:
+        """Return the minimized test cases of a run grouped by category, or None for an unknown run"""
+        if not run_id or db.session.get(Run, run_id) is None:
+            return None
+        test_cases = OrderedDict()
+        for run_case in RunCase.query.filter_by(run_id=run_id).order_by(RunCase.ordinal):
+            case = self._load_case(run_case)
+            case.pop('source', None)
+            test_cases.setdefault(run_case.category, []).append(case)
+        return test_cases
+
+    def get_case(self, run_id: str, ordinal: int) -> Optional[RunCase]:
+        """Return the n-th case of a run"""
+        return RunCase.query.filter_by(run_id=run_id, ordinal=ordinal).first()
+
+    def get_case_at(self, run_id: str, category: str, position: int) -> Optional[RunCase]:
+        """Return the case at position within a category of a run"""
+        return RunCase.query.filter_by(run_id=run_id, category=category, position=position).first()
+
+    def replay_case(self, run_case: RunCase) -> Dict[str, Any]:
+        """A stored case ready to execute again, with the run's method and URL filling in missing fields"""
+        case = self._load_case(run_case)
+        case['endpoint'] = case.get('endpoint') or run_case.run.url
+        case['method'] = case.get('method') or run_case.run.method
+        return case
+
+    @staticmethod
+    def curl_command(run_case: RunCase) -> str:
+        """
+        Render the curl command of a stored case. The payload's stored JSON text
+        goes into the command as-is; the run's method and URL fill in missing fields.
+        """
+        case = json.loads(run_case.data)
+        run = run_case.run
+        return render_curl(
+            case.get('endpoint') or run.url,
+            case.get('method') or run.method,
+            case.get('headers'),
+            query_params=case.get('query_params'),
+            payload_json=run_case.payload
+        )
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return a run with its cases and any recorded execution results"""
+        run = db.session.get(Run, run_id)
+        if run is None:
+            return None
+
+        results = {
+            result.case_id: json.loads(result.data)
+            for result in RunResult.query.filter_by(run_id=run_id)
+        }
+        test_cases = OrderedDict()
+        for run_case in run.cases.order_by(RunCase.ordinal):
+            case = self._load_case(run_case)
+            if run_case.id in results:
+                case['execution_result'] = results[run_case.id]
+            test_cases.setdefault(run_case.category, []).append(case)
+        refs = (content_ref(execution_result) for execution_result in results.values())
+
+        return {
+            'run_id': run.id,
+            'created_at': run.created_at.isoformat(),
+            'kind': run.kind,
+            'method': run.method,
+            'url': run.url,
+            'used_ai': run.used_ai,
+            'status': run.status,
+            'summary': json.loads(run.summary) if run.summary else None,
+            'test_cases': test_cases,
+            'response_bodies': self.get_response_bodies(ref for ref in refs if ref)
+        }
+
+    def count_runs(self) -> int:
+        """Number of stored runs"""
+        return db.session.query(Run.id).count()
+
+    def stats(self) -> Dict[str, Any]:
+        """Row count per table and, for a SQLite file, its size in bytes"""
+        rows = {
+            model.__tablename__: db.session.query(model).count()
+            for model in (Run, RunCase, RunResult, ResponseBlob)
+        }
+        database = db.engine.url.database
+        size_bytes = None
+        if db.engine.url.get_backend_name() == 'sqlite' and database and os.path.exists(database):
+            size_bytes = os.path.getsize(database)
+        return {'rows': rows, 'size_bytes': size_bytes}
@@ -0,0 +1,197 @@
+import os
+import time
+import requests
+from typing import Dict, Any, Optional, Tuple
+
+from src.services.http_pool import get_pool_manager
+from src.services.metrics import EXECUTIONS_IN_FLIGHT, observe_target_request
+from src.services.phase_timing import PhaseTimer
+from src.services.rate_limiter import RateLimiter
+from src.services.response_capture import CAPTURE_CHUNK_SIZE, BodyCapture, capture_body
+
+DEFAULT_TIMEOUT = 30
+BODY_METHODS = ['POST', 'PUT', 'PATCH']
+
+
+def get_mime_type(file_extension):
+    """Determine MIME type based on file extension"""
+    mime_types = {
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.pdf': 'application/pdf',
+        '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+        '.mp3': 'audio/mpeg',
+        '.txt': 'text/plain',
+        '.csv': 'text/csv',
+        '.json': 'application/json',
+        '.xml': 'application/xml'
+    }
+    return mime_types.get(file_extension.lower(), 'application/octet-stream')
+
+
+def add_file(file_path, file_variable_name):
+    """Create file tuple for requests"""
+    file_name = os.path.basename(file_path)
+    file_extension = os.path.splitext(file_name)[1].lower()
+    mime_type = get_mime_type(file_extension)
+
+    file_tuple = (file_name, open(file_path, 'rb'), mime_type)
+    files = {file_variable_name: file_tuple}
+    return files
+
+
+def close_files(files_dict):
+    """Close file handles opened by add_file"""
+    if files_dict:
+        for file_tuple in files_dict.values():
+            if hasattr(file_tuple[1], 'close'):
+                file_tuple[1].close()
+
+
+def sends_json(headers: Optional[Dict[str, Any]]) -> bool:
+    """Whether build_request JSON-encodes the payload for these headers"""
+    return (headers or {}).get('content-type', '').lower() == 'application/json'
+
+
+def build_request(test_case: Dict[str, Any], timeout: int = DEFAULT_TIMEOUT) -> Tuple[str, Dict[str, Any], Optional[Dict]]:
+    """
+    Build the method, requests kwargs and (optional) files dict for a test case
+    """
+    method = test_case.get('method', 'GET').upper()
+    url = test_case.get('endpoint', '')
+    headers = test_case.get('headers', {})
+    payload = test_case.get('payload', {})
+    query_params = test_case.get('query_params', {})
+    file_path = test_case.get('file_path')
+
+    if not url:
+        raise ValueError('URL is required')
+
+    request_kwargs = {
+        'url': url,
+        'headers': headers,
+        'params': query_params,
+        'timeout': timeout
+    }
+
+    files_dict = None
+    if file_path and os.path.exists(file_path) and method in BODY_METHODS:
+        files_dict = add_file(file_path, 'file')
+        request_kwargs['files'] = files_dict
+        if payload:
+            request_kwargs['data'] = payload
+    elif method in BODY_METHODS and payload:
+        if sends_json(headers):
+            request_kwargs['json'] = payload
+        else:
+            request_kwargs['data'] = payload
+
+    return method, request_kwargs, files_dict
+
+
+class TestCaseExecutor:
+    """
+    Execute a single test case in-process: build the HTTP request,
+    send it and capture the response in the shape the UI expects
+    """
+
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT, session: Optional[requests.Session] = None,
+                 cookie_mode: str = 'isolated', rate_limiter: Optional[RateLimiter] = None):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        # Requests go through the per-origin keep-alive pool; the session
+        # only decides whether this run's cookies are isolated or shared
+        self.session = session or get_pool_manager().session(cookie_mode)
+
+    def build_request(self, test_case: Dict[str, Any]) -> Tuple[str, Dict[str, Any], Optional[Dict]]:
+        """Build the method, requests kwargs and (optional) files dict for a test case"""
+        return build_request(test_case, self.timeout)
+
+    @staticmethod
+    def capture_response(response, response_time: Optional[float] = None,
+                         body: Optional[BodyCapture] = None, timer: Optional[PhaseTimer] = None) -> Dict[str, Any]:
+        """
+        Capture status, headers and (parsed) content of a response, plus the
+        body size and hash. body is the streamed BodyCapture; without it the
+        already-read response content is captured under the same size limit.
+        With a timer the phase breakdown of response_time is added as timings.
+        """
+        if body is None:
+            body = capture_body([response.content])
+        response_data = {
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'content': None,
+            'content_type': response.headers.get('content-type', '')
+        }
+        if response_time is not None:
+            response_data['response_time'] = response_time
+            if timer is not None:
+                response_data['timings'] = timer.timings(response_time)
+
+        encoding = getattr(response, 'charset_encoding', None) or response.encoding
+        response_data.update(body.fields(response_data['content_type'], encoding))
+        return response_data
+
+    def execute(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send the request for a test case and return the captured response data.
+        The body is streamed, so at most MAX_CAPTURE_BYTES of it are held in memory.
+        response_time and its phase timings use the monotonic perf_counter clock.
+        With a rate limiter the request first waits for its host's token (not
+        counted in response_time) and the response adapts the limiter.
+        Raises ValueError for an invalid test case and RequestException on transport errors.
+        """
+        method, request_kwargs, files_dict = self.build_request(test_case)
+        timer = PhaseTimer()
+        try:
+            waited = None
+            if self.rate_limiter is not None and not test_case.get('rate_limit_exempt'):
+                waited = self.rate_limiter.acquire(request_kwargs['url'])
+            with EXECUTIONS_IN_FLIGHT.track(backend='thread'):
+                sent_at = time.monotonic()
+                start_time = time.perf_counter()
+                with timer.activate():
+                    response = self.session.request(method, stream=True, **request_kwargs)
+                try:
+                    with timer.phase('download'):
+                        body = capture_body(response.iter_content(CAPTURE_CHUNK_SIZE))
+                finally:
+                    response.close()
+                response_time = time.perf_counter() - start_time
+            observe_target_request(request_kwargs['url'], response_time)
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(request_kwargs['url'], response.status_code, response.headers,
+                                         sent_at=sent_at, exempt=bool(test_case.get('rate_limit_exempt')))
+            response_data = self.capture_response(response, response_time, body, timer)
+            if waited is not None:
+                response_data['rate_limit_wait'] = waited
+            return response_data
+        finally:
+            close_files(files_dict)
+
+    def run(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a test case and wrap the outcome the same way /api/execute-test-case does
+        """
+        try:
+            return {
+                'success': True,
+                'response': self.execute(test_case)
+            }
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+        except requests.exceptions.RequestException as e:
+            return {
+                'success': False,
+                'error': f'Request failed: {str(e)}'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Unexpected error: {str(e)}'
+            }
@@ -1,16 +1,91 @@
 import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 from openai import OpenAI
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple
 
 from src.services.simple_test_generator import SimpleTestCaseGenerator
+from src.services.case_stream_parser import CaseStreamParser, parse_generated_suite
+from src.services.curl_renderer import render_curl
+from src.services.prompt_budget import fit_prompt
+from src.services.generation_cache import GENERATION_CACHE_ENABLED, generation_cache_key, get_generation_cache
+from src.services.metrics import SUITES_GENERATED, observe_llm_request, record_llm_usage
+
+OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4')
+# Connections the shared OpenAI client keeps to the API (fan-out mode
+# has one completion per category in flight)
+OPENAI_POOL_SIZE = int(os.getenv('OPENAI_POOL_SIZE', '20'))
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', '120'))
+SYSTEM_PROMPT = "You are an expert API testing specialist. Generate comprehensive test cases in the exact JSON format specified."
+
+# Fan-out mode: one smaller completion per category, all in flight at once.
+# Categories are merged in the same order the single prompt asks for them.
+CATEGORIES = ['Positive', 'Semantic', 'Boundary', 'Negative', 'Security']
+CATEGORY_MAX_TOKENS = int(os.getenv('OPENAI_CATEGORY_MAX_TOKENS', '1500'))
+CATEGORY_GUIDANCE = {
+    'body': {
+        'Positive': 'Exactly 1 test case with all valid inputs as specified in the API information.',
+        'Semantic': '1-2 test cases with meaningful variations (special characters, formats, edge cases).',
+        'Boundary': '1-2 test cases covering all boundary conditions (min/max values, lengths).',
+        'Negative': '1-2 test cases covering various error scenarios (invalid types, missing fields, etc.).',
+        'Security': '1-2 test cases covering authentication, authorization and injection attempts.'
+    },
+    'query': {
+        'Positive': 'Exactly 1 test case fetching data with valid parameters.',
+        'Semantic': '5-6 test cases with meaningful variations (special characters, formats).',
+        'Boundary': '5-6 test cases covering all boundary conditions (min/max values, pagination limits).',
+        'Negative': '8-10 test cases covering various error scenarios (invalid values, missing parameters).',
+        'Security': '4-5 test cases covering authentication, authorization and injection attempts.'
+    }
+}
+
+
+_openai_client = None
+_openai_client_lock = threading.Lock()
+_test_generator = None
+_test_generator_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client. The client is thread-safe and keeps
+    its own keep-alive pool, so every request reuses the same connections.
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                _openai_client = OpenAI(
+                    api_key=os.getenv('OPENAI_API_KEY', 'your-api-key-here'),
+                    timeout=OPENAI_TIMEOUT,
+                    http_client=httpx.Client(
+                        timeout=OPENAI_TIMEOUT,
+                        limits=httpx.Limits(max_connections=OPENAI_POOL_SIZE,
+                                            max_keepalive_connections=OPENAI_POOL_SIZE)
+                    )
+                )
+    return _openai_client
+
+
+def get_test_generator() -> 'TestCaseGenerator':
+    """Return the process-wide TestCaseGenerator (it holds no per-request state)"""
+    global _test_generator
+    if _test_generator is None:
+        with _test_generator_lock:
+            if _test_generator is None:
+                _test_generator = TestCaseGenerator()
+    return _test_generator
 
 
 class TestCaseGenerator:
-    def __init__(self):
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY', 'your-api-key-here'))
+    def __init__(self, cache=None, client=None):
+        # Shared OpenAI client unless one is passed in
+        self.client = client or get_openai_client()
         self.fallback_generator = SimpleTestCaseGenerator()
+        self.cache = cache if cache is not None else (get_generation_cache() if GENERATION_CACHE_ENABLED else None)
 
     # def generate_test_cases(self, api_info: Dict[str, Any]) -> Dict[str, Any]:
     #     """
@@ -60,83 +135,257 @@ class TestCaseGenerator:
     #         print("call generate fallback tests")
     #         # return self._generate_fallback_tests(api_info)
     #         return self.fallback_generator.generate_tests(api_info)
-    def generate_test_cases(self, api_info: Dict[str, Any], include_curl: bool = True) -> Dict[str, Any]:
+    def generate_test_cases(self, api_info: Dict[str, Any], include_curl: bool = True,
+                            use_cache: bool = True, fan_out: bool = False,
+                            fallback: bool = True) -> Dict[str, Any]:
         """
-        Generate test cases based on API information
+        Generate test cases based on API information.
+        Suites for identical prompt inputs are served from the generation cache
+        unless use_cache is False. With fan_out, each category is requested in
+        its own (concurrent) completion. With fallback=False, failures raise
+        instead of returning the simple generator's suite (failed fan-out
+        categories are left out).
         """
-        method = api_info.get('method', 'GET')
-        url = api_info.get('url', '')
-        headers = api_info.get('headers', {})
-        payload = api_info.get('payload', {})
-        query_params = api_info.get('query_params', {})
+        cache_params = {'model': OPENAI_MODEL}
+        if fan_out:
+            cache_params['mode'] = 'per_category'
+        cache_key = generation_cache_key(api_info, **cache_params)
+        test_cases = self._cached_suite(cache_key, api_info, include_curl) if use_cache else None
+        if test_cases is not None:
+            return test_cases
 
-        # Create prompt based on method type
-        if method.upper() in ['POST', 'PUT', 'PATCH']:
-            prompt = self._create_post_prompt(api_info)
-        else:
-            prompt = self._create_get_prompt(api_info)
+        if fan_out:
+            test_cases, fully_generated = self._generate_per_category(api_info, fallback=fallback)
+            # Suites patched with fallback sections are not cached
+            if fully_generated and self.cache is not None:
+                try:
+                    self.cache.set(cache_key, test_cases)
+                except OSError as e:
+                    print(f"Failed to write generation cache: {str(e)}")
+            SUITES_GENERATED.inc(generator='ai')
+            if include_curl:
+                self._add_curl_commands(test_cases, api_info)
+            return test_cases
 
         try:
+            prompt = self._create_prompt(api_info)
+
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert API testing specialist. Generate comprehensive test cases in the exact JSON format specified."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=4000
-            )
+            with observe_llm_request('suite'):
+                response = self.client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=self._messages(prompt),
+                    temperature=0.7,
+                    max_tokens=4000
+                )
+            record_llm_usage(response.usage)
 
-            # Parse the response
+            # Parse the response; comments, code fences and trailing commas copied
+            # from the template are tolerated and a truncated suite is salvaged
             test_cases_text = response.choices[0].message.content
-            test_cases = json.loads(test_cases_text)
+            test_cases, parsed_completely = parse_generated_suite(test_cases_text)
+
+            # Cache the suite as generated (without curl commands); a bypassed
+            # lookup still refreshes the entry. Salvaged suites are not cached.
+            if parsed_completely and self.cache is not None:
+                try:
+                    self.cache.set(cache_key, test_cases)
+                except OSError as e:
+                    print(f"Failed to write generation cache: {str(e)}")
+            SUITES_GENERATED.inc(generator='ai')
 
             # Add curl commands if requested
             if include_curl:
-                for category in test_cases.values():
-                    for test_case in category:
-                        curl_cmd = self._generate_curl_command(
-                            test_case.get('endpoint', url),
-                            test_case.get('method', method),
-                            test_case.get('headers', headers),
-                            test_case.get('payload', payload),
-                            test_case.get('query_params', query_params)
-                        )
-                        test_case['curl_command'] = curl_cmd
+                self._add_curl_commands(test_cases, api_info)
 
             return test_cases
 
         except Exception as e:
+            if not fallback:
+                raise
             # Use the SimpleTestCaseGenerator as fallback
             print(f"OpenAI generation failed --falling back to simple generator: {str(e)}")
-            return self.fallback_generator.generate_tests(api_info)
+            SUITES_GENERATED.inc(generator='simple')
+            return self.fallback_generator.generate_tests(api_info, include_curl=include_curl)
 
-    def _generate_curl_command(self, endpoint, method, headers=None, payload=None, query_params=None):
-        """Generate a curl command for the test case"""
-        curl_parts = [f"curl -X {method}"]
+    def _generate_per_category(self, api_info: Dict[str, Any], fallback: bool = True) -> Tuple[OrderedDict, bool]:
+        """
+        Request every category in parallel and merge them in CATEGORIES order.
+        A category whose completion fails is replaced by the matching section of
+        the simple generator (or left out without fallback). Returns the suite and
+        whether every category came from the model.
+        """
+        with ThreadPoolExecutor(max_workers=len(CATEGORIES), thread_name_prefix='openai-category') as pool:
+            futures = OrderedDict(
+                (category, pool.submit(self._generate_category, api_info, category))
+                for category in CATEGORIES
+            )
 
-        if headers:
-            for key, value in headers.items():
-                curl_parts.append(f"-H '{key}: {value}'")
+        test_cases = OrderedDict()
+        failed = []
+        for category, future in futures.items():
+            try:
+                test_cases[category] = future.result()
+            except Exception as e:
+                failed.append(category)
+                if not fallback:
+                    print(f"OpenAI generation failed for {category}: {str(e)}")
+                    continue
+                print(f"OpenAI generation failed for {category} --falling back to simple generator: {str(e)}")
+                # Curl commands are added to the merged suite afterwards
+                fallback_suite = self.fallback_generator.generate_tests(api_info, categories=[category],
+                                                                        include_curl=False)
+                test_cases[category] = fallback_suite.get(category, [])
+        if not test_cases:
+            raise ValueError('OpenAI generation failed for every category')
+        return test_cases, not failed
 
-        if payload and isinstance(payload, dict):
-            curl_parts.append(f"-d '{json.dumps(payload)}'")
+    def _generate_category(self, api_info: Dict[str, Any], category: str) -> list:
+        """Generate the test cases of a single category"""
+        messages = self._messages(fit_prompt(
+            lambda info: self._create_category_prompt(info, category), api_info, system_prompt=SYSTEM_PROMPT
+        ))
+        with observe_llm_request('category'):
+            response = self.client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=CATEGORY_MAX_TOKENS
+            )
+        record_llm_usage(response.usage)
+        suite, _ = parse_generated_suite(response.choices[0].message.content)
+        cases = suite.get(category)
+        if not isinstance(cases, list) or not cases:
+            raise ValueError(f'No {category} test cases in the response')
+        return cases
 
-        # Add query params to URL
-        url = endpoint
-        if query_params:
-            query_string = "&".join([f"{k}={v}" for k, v in query_params.items()])
-            url = f"{endpoint}?{query_string}"
+    def iter_test_cases(self, api_info: Dict[str, Any], include_curl: bool = True,
+                        use_cache: bool = True) -> Iterator[Tuple[str, int, Dict[str, Any]]]:
+        """
+        Stream the completion and yield (category, index, test_case) as soon as each
+        case object is complete, so it can be executed while the rest is generated.
+        Falls back to the simple generator if the model produced no usable case.
+        """
+        cache_key = generation_cache_key(api_info, model=OPENAI_MODEL)
+        test_cases = self._cached_suite(cache_key, api_info, include_curl) if use_cache else None
+        if test_cases is not None:
+            for category, cases in test_cases.items():
+                for index, test_case in enumerate(cases):
+                    yield category, index, test_case
+            return
+
+        parser = CaseStreamParser()
+        test_cases = OrderedDict()
+        try:
+            messages = self._messages(self._create_prompt(api_info))
+            # Only the model stream is timed, not the consumer's work between cases
+            with observe_llm_request('stream') as llm_request:
+                stream = self.client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=4000,
+                    stream=True,
+                    # The last chunk then carries the token usage (and no choices)
+                    stream_options={'include_usage': True}
+                )
+                for chunk in stream:
+                    record_llm_usage(getattr(chunk, 'usage', None))
+                    if not chunk.choices:
+                        continue
+                    text = chunk.choices[0].delta.content
+                    if not text:
+                        continue
+                    for category, index, test_case in parser.feed(text):
+                        test_cases.setdefault(category, []).append(test_case)
+                        # Cache the case as generated: the caller (and the curl
+                        # command) writes onto a copy, e.g. its execution_result
+                        test_case = dict(test_case)
+                        if include_curl:
+                            self._add_curl_command(test_case, api_info)
+                        with llm_request.paused():
+                            yield category, index, test_case
+        except Exception as e:
+            if test_cases:
+                print(f"OpenAI streaming stopped after {sum(len(c) for c in test_cases.values())} cases: {str(e)}")
+                SUITES_GENERATED.inc(generator='ai')
+                return
+            print(f"OpenAI generation failed --falling back to simple generator: {str(e)}")
 
-        curl_parts.append(f"'{url}'")
-        return " ".join(curl_parts)
+        for error in parser.errors:
+            print(f"Skipped unparseable generated case: {error}")
+
+        if not test_cases:
+            if parser.complete:
+                print("OpenAI generation returned no test cases --falling back to simple generator")
+            SUITES_GENERATED.inc(generator='simple')
+            fallback_suite = self.fallback_generator.generate_tests(api_info, include_curl=include_curl)
+            for category, cases in fallback_suite.items():
+                for index, test_case in enumerate(cases):
+                    yield category, index, test_case
+            return
+
+        SUITES_GENERATED.inc(generator='ai')
+        # Only a fully received suite is worth caching
+        if parser.complete and self.cache is not None:
+            try:
+                self.cache.set(cache_key, test_cases)
+            except OSError as e:
+                print(f"Failed to write generation cache: {str(e)}")
+
+    def _cached_suite(self, cache_key: str, api_info: Dict[str, Any], include_curl: bool):
+        """Return the cached suite for cache_key (with curl commands if requested), or None"""
+        if self.cache is None:
+            return None
+        test_cases = self.cache.get(cache_key)
+        if test_cases is not None:
+            print(f"Generation cache hit for {api_info.get('method', 'GET').upper()} {api_info.get('url', '')}")
+            SUITES_GENERATED.inc(generator='cache')
+            if include_curl:
+                self._add_curl_commands(test_cases, api_info)
+        return test_cases
+
+    def _create_prompt(self, api_info: Dict[str, Any]) -> str:
+        """
+        Create the prompt based on method type, with the response body summarized
+        to fit PROMPT_TOKEN_BUDGET (raises PromptBudgetExceeded if it cannot)
+        """
+        if api_info.get('method', 'GET').upper() in ['POST', 'PUT', 'PATCH']:
+            return fit_prompt(self._create_post_prompt, api_info, system_prompt=SYSTEM_PROMPT)
+        return fit_prompt(self._create_get_prompt, api_info, system_prompt=SYSTEM_PROMPT)
+
+    @staticmethod
+    def _messages(prompt: str):
+        return [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def _add_curl_commands(self, test_cases: Dict[str, Any], api_info: Dict[str, Any]):
+        """Attach a curl command to every test case, defaulting to the original API info"""
+        for category in test_cases.values():
+            for test_case in category:
+                self._add_curl_command(test_case, api_info)
+
+    def _add_curl_command(self, test_case: Dict[str, Any], api_info: Dict[str, Any]):
+        """Attach a curl command to one test case"""
+        test_case['curl_command'] = self._generate_curl_command(
+            test_case.get('endpoint', api_info.get('url', '')),
+            test_case.get('method', api_info.get('method', 'GET')),
+            test_case.get('headers', api_info.get('headers', {})),
+            test_case.get('payload', api_info.get('payload', {})),
+            test_case.get('query_params', api_info.get('query_params', {}))
+        )
+
+    def _generate_curl_command(self, endpoint, method, headers=None, payload=None, query_params=None):
+        """Generate a curl command for the test case"""
+        return render_curl(endpoint, method, headers, payload, query_params)
     def _create_post_prompt(self, api_info: Dict[str, Any]) -> str:
         """
         Create prompt for POST/PUT/PATCH requests
@@ -315,6 +564,44 @@ class TestCaseGenerator:
         """
         return prompt
 
+    def _create_category_prompt(self, api_info: Dict[str, Any], category: str) -> str:
+        """
+        Create the prompt for a single category (fan-out mode)
+        """
+        method = api_info.get('method', 'GET')
+        url = api_info.get('url', '')
+        headers = api_info.get('headers', {})
+        response = api_info.get('response', {})
+
+        if method.upper() in ['POST', 'PUT', 'PATCH']:
+            guidance = CATEGORY_GUIDANCE['body'][category]
+            input_details = f"Payload Structure: {json.dumps(api_info.get('payload', {}), indent=2)}"
+            input_field = '"payload"'
+        else:
+            guidance = CATEGORY_GUIDANCE['query'][category]
+            input_details = f"Query Parameters: {json.dumps(api_info.get('query_params', {}), indent=2)}"
+            input_field = '"query_params"'
+
+        prompt = f"""
+        Generate {category} test cases for the following API endpoint.
+        
+        API Details:
+        Method: {method}
+        URL: {url}
+        Headers: {json.dumps(headers, indent=2)}
+        {input_details}
+        Response Status: {response.get('status_code', 'Unknown')}
+        Response Content: {json.dumps(response.get('content', {}), indent=2)}
+        
+        {category}: {guidance}
+        
+        Return only a JSON object with a single "{category}" key whose value is the list of test cases.
+        Each test case has "description", "endpoint", "method", "headers", {input_field} and "expected_status",
+        plus "expected_response_schema" for success cases or "expected_error" (message, code) for error cases.
+        Use actual field names from the provided API details and ensure all JSON is valid.
+        """
+        return prompt
+
     def _create_get_prompt(self, api_info: Dict[str, Any]) -> str:
         """
         Create prompt for GET requests
@@ -69,6 +69,9 @@ validateJSONInput('payload', 'payloadError');
 
     let currentApiInfo = null;
     let generatedTestCases = null;
+    let currentRunId = null;
+    // Distinct response bodies of the current run, keyed by content_ref
+    let responseBodies = {};
 
     // Helper to show/hide elements
     const show = (element) => element.classList.remove("hidden");
@@ -238,7 +241,7 @@ validateJSONInput('payload', 'payloadError');
         downloadJsonBtn.disabled = true;
 
         try {
-            const response = await fetch("/api/generate-tests", {
+            const response = await fetch("/api/generate-tests/stream", {
                 method: "POST",
                 headers: {
                     "Content-Type": "application/json",
@@ -249,16 +252,50 @@ validateJSONInput('payload', 'payloadError');
                 }),
             });
 
-            const data = await response.json();
-
             if (!response.ok) {
+                const data = await response.json();
                 throw new Error(data.error || "Test generation failed.");
             }
 
-            generatedTestCases = data.test_cases;
-            renderTestCases(generatedTestCases);
-            show(generatedTestCasesSection);
-            downloadJsonBtn.disabled = false;
+            // Results arrive as NDJSON frames: the generated suite first (or one
+            // test_case frame per case while the AI is still writing them),
+            // then one frame per executed case, then a summary
+            const handleFrame = (frame) => {
+                if (frame.type === "suite") {
+                    generatedTestCases = frame.test_cases;
+                    currentRunId = frame.run_id;
+                    responseBodies = {};
+                    renderTestCases(generatedTestCases);
+                    show(generatedTestCasesSection);
+                    downloadJsonBtn.disabled = false;
+                } else if (frame.type === "test_case") {
+                    // Streamed AI generation: cases show up one by one
+                    (generatedTestCases[frame.category] = generatedTestCases[frame.category] || [])[frame.index] = frame.test_case;
+                    renderTestCases(generatedTestCases);
+                } else if (frame.type === "case") {
+                    const testCase = generatedTestCases[frame.category][frame.index];
+                    Object.assign(responseBodies, frame.response_bodies || {});
+                    testCase.execution_result = frame.execution_result;
+                    renderExecutionResult(frame.category, frame.index, testCase);
+                } else if (frame.type === "error") {
+                    throw new Error(frame.error);
+                }
+            };
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffered = "";
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffered += decoder.decode(value, { stream: true });
+                const lines = buffered.split("\n");
+                buffered = lines.pop();
+                lines.filter(line => line.trim()).forEach(line => handleFrame(JSON.parse(line)));
+            }
+            if (buffered.trim()) {
+                handleFrame(JSON.parse(buffered));
+            }
 
         } catch (err) {
             displayError(err.message);
@@ -286,6 +323,7 @@ validateJSONInput('payload', 'payloadError');
                 },
                 body: JSON.stringify({
                     api_info: currentApiInfo,
+                    run_id: currentRunId,
                 }),
             });
 
@@ -313,6 +351,62 @@ validateJSONInput('payload', 'payloadError');
         }
     });
 
+const executionResultHtml = (testCase) => {
+    if (!testCase.execution_result) {
+        return `<div class="execution-results"><em>Running...</em></div>`;
+    }
+    if (!testCase.execution_result.response) {
+        return `<div class="execution-results"><strong>Execution Results:</strong> ${testCase.execution_result.error || 'Execution failed'}</div>`;
+    }
+
+    const response = testCase.execution_result.response;
+    let content = `<div class="execution-results"><strong>Execution Results:</strong>`;
+
+    // Status Code
+    if (response.status_code) {
+        content += `<div><strong>Status Code:</strong> ${response.status_code}</div>`;
+    }
+
+    // Response Time
+    if (response.response_time) {
+        content += `<div><strong>Response Time:</strong> ${response.response_time} seconds</div>`;
+    }
+
+    // Phase breakdown of the response time (dns is null when it is part of connect)
+    if (response.timings) {
+        const phases = ['dns', 'connect', 'tls', 'write', 'ttfb', 'download']
+            .filter(phase => response.timings[phase] !== null && response.timings[phase] !== undefined)
+            .map(phase => `${phase} ${(response.timings[phase] * 1000).toFixed(1)} ms`);
+        content += `<div><strong>Timings:</strong> ${phases.join(' · ')}</div>`;
+    }
+
+    // Response Content (shared bodies are sent once and referenced by content_ref)
+    const responseContent = response.content_ref ? responseBodies[response.content_ref] : response.content;
+    if (responseContent) {
+        const contentStr = typeof responseContent === 'object' ?
+            JSON.stringify(responseContent, null, 2) :
+            responseContent;
+        content += `<div><strong>Response Content:</strong> <pre>${contentStr}</pre></div>`;
+    }
+
+    // Large bodies are only captured up to the server's limit
+    if (response.truncated) {
+        content += `<div><em>Response truncated: showing the first part of ${response.body_size} bytes (sha256 ${response.body_sha256})</em></div>`;
+    }
+
+    content += `</div>`;
+    return content;
+};
+
+// Update a single rendered test case once its execution result arrives
+const renderExecutionResult = (category, index, testCase) => {
+    const testCaseDiv = document.getElementById(`${category.toLowerCase()}-test-${index}`);
+    const slot = testCaseDiv && testCaseDiv.querySelector(".execution-results-slot");
+    if (slot) {
+        slot.innerHTML = executionResultHtml(testCase);
+    }
+};
+
 const renderTestCases = (testCasesData) => {
     console.log("Raw test cases data:", testCasesData); // Debug log
 
@@ -370,35 +464,11 @@ const renderTestCases = (testCasesData) => {
                 content += `<div><strong>Expected Schema:</strong> <pre>${JSON.stringify(testCase.expected_schema, null, 2)}</pre></div>`;
             }
 
-            if (testCase.curl_command) {
-                content += `<div><strong>cURL Command:</strong> <pre class="curl-command-pre">${testCase.curl_command}</pre><button class="copy-curl-btn-small" data-curl="${testCase.curl_command}">Copy</button></div>`;
-            }
+            // The cURL command is rendered by the server when it is asked for
+            content += `<div class="curl-slot"><button class="copy-curl-btn-small show-curl-btn" data-category="${category}" data-index="${index}">Show cURL</button></div>`;
 
-            // Add execution results if available
-            if (testCase.execution_result && testCase.execution_result.response) {
-                const response = testCase.execution_result.response;
-                content += `<div class="execution-results"><strong>Execution Results:</strong>`;
-
-                // Status Code
-                if (response.status_code) {
-                    content += `<div><strong>Status Code:</strong> ${response.status_code}</div>`;
-                }
-
-                // Response Time
-                if (response.response_time) {
-                    content += `<div><strong>Response Time:</strong> ${response.response_time} seconds</div>`;
-                }
-
-                // Response Content
-                if (response.content) {
-                    const contentStr = typeof response.content === 'object' ?
-                        JSON.stringify(response.content, null, 2) :
-                        response.content;
-                    content += `<div><strong>Response Content:</strong> <pre>${contentStr}</pre></div>`;
-                }
-
-                content += `</div>`;
-            }
+            // Execution results are filled in as each case finishes
+            content += `<div class="execution-results-slot">${executionResultHtml(testCase)}</div>`;
 
             testCaseDiv.innerHTML = content;
             testCasesContainer.appendChild(testCaseDiv);
@@ -407,10 +477,25 @@ const renderTestCases = (testCasesData) => {
         tabContentDiv.appendChild(testCasesContainer);
     });
 
-   // Add event listeners for small copy buttons
-    document.querySelectorAll(".copy-curl-btn-small").forEach(button => {
-        button.addEventListener("click", (event) => {
-            copyToClipboard(event.target.dataset.curl);
+    // Fetch a case's cURL command from the stored run on demand
+    document.querySelectorAll(".show-curl-btn").forEach(button => {
+        button.addEventListener("click", async (event) => {
+            const { category, index } = event.target.dataset;
+            const slot = event.target.closest(".curl-slot");
+            try {
+                const response = await fetch(`/api/runs/${currentRunId}/cases/${encodeURIComponent(category)}/${index}/curl`);
+                const data = await response.json();
+                if (!response.ok) {
+                    throw new Error(data.error || "Failed to load cURL command.");
+                }
+                slot.innerHTML = `<strong>cURL Command:</strong> <pre class="curl-command-pre"></pre><button class="copy-curl-btn-small">Copy</button>`;
+                slot.querySelector("pre").textContent = data.curl_command;
+                slot.querySelector(".copy-curl-btn-small").addEventListener("click", () => {
+                    copyToClipboard(data.curl_command);
+                });
+            } catch (err) {
+                displayError(err.message);
+            }
         });
     });
 
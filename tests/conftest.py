@@ -0,0 +1,42 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+# The app creates its run store on import, so point it at a scratch database first
+_database_dir = tempfile.mkdtemp(prefix='run-store-tests-')
+os.environ.setdefault('RUN_STORE_DATABASE_URI', f"sqlite:///{os.path.join(_database_dir, 'runs.db')}")
+os.environ.setdefault('GENERATION_CACHE_ENABLED', 'false')
+
+
+@contextmanager
+def serve(handler_class):
+    """Run handler_class on a local HTTP server and yield its base URL"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{server.server_address[1]}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def app():
+    from src.main import app
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def http_server():
+    """serve(handler_class) as a fixture: `with http_server(Handler) as base_url`"""
+    return serve
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.services.async_executor import AsyncTestCaseExecutor
+# Imported by module: pytest would try to collect a Test* class name
+from src.services import test_executor
+
+# Headers that differ between two otherwise identical responses
+VOLATILE_HEADERS = ('date',)
+
+
+class RedirectHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == '/old':
+            self.send_response(301)
+            self.send_header('location', '/new')
+            self.send_header('content-length', '0')
+            self.end_headers()
+            return
+        body = json.dumps({'moved': True}).encode()
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def redirect_target():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RedirectHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def comparable(response_data):
+    """response_data without the fields that differ between any two requests"""
+    response_data = dict(response_data)
+    for key in ('response_time', 'timings'):
+        response_data.pop(key, None)
+    response_data['headers'] = {
+        name.lower(): value for name, value in response_data['headers'].items()
+        if name.lower() not in VOLATILE_HEADERS
+    }
+    return response_data
+
+
+def test_backends_follow_redirects_alike(redirect_target):
+    test_case = {'method': 'GET', 'endpoint': f'{redirect_target}/old', 'headers': {}}
+
+    thread_result = test_executor.TestCaseExecutor().run(test_case)
+
+    async def run_async():
+        executor = AsyncTestCaseExecutor()
+        async with executor.client(1) as client:
+            return await executor.run(client, test_case)
+
+    async_result = asyncio.run(run_async())
+
+    assert thread_result['success'] and async_result['success']
+    assert thread_result['response']['status_code'] == 200
+    assert comparable(async_result['response']) == comparable(thread_result['response'])
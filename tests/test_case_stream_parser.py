@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from src.services.case_stream_parser import CaseStreamParser, parse_generated_suite
+
+SUITE = {
+    'Positive': [{'description': 'valid {braces} and "quotes"', 'method': 'POST', 'payload': {'a': [1, {'b': 2}]}}],
+    'Negative': [{'description': 'missing', 'method': 'POST'}, {'description': 'escaped \\" }', 'method': 'POST'}]
+}
+
+
+def feed_in_chunks(text, size):
+    parser = CaseStreamParser()
+    cases = []
+    for start in range(0, len(text), size):
+        cases.extend(parser.feed(text[start:start + size]))
+    return parser, cases
+
+
+@pytest.mark.parametrize('size', [1, 3, 17, 10000])
+def test_cases_are_emitted_whatever_the_chunking(size):
+    text = 'Here is the suite:\n```json\n' + json.dumps(SUITE, indent=2) + '\n```'
+    parser, cases = feed_in_chunks(text, size)
+
+    assert parser.complete
+    assert cases == [
+        ('Positive', 0, SUITE['Positive'][0]),
+        ('Negative', 0, SUITE['Negative'][0]),
+        ('Negative', 1, SUITE['Negative'][1]),
+    ]
+
+
+def test_comments_and_trailing_commas_from_the_template_are_tolerated():
+    text = '''{
+      // positive cases
+      "Positive": [
+        {"description": "ok", /* inline */ "method": "GET",},
+      ],
+    }'''
+    parser, cases = feed_in_chunks(text, 5)
+    assert cases == [('Positive', 0, {'description': 'ok', 'method': 'GET'})]
+    assert parser.errors == []
+
+
+def test_truncated_trailing_case_is_left_out():
+    text = json.dumps(SUITE)
+    parser, cases = feed_in_chunks(text[:text.index('"escaped')], 8)
+    assert not parser.complete
+    assert [case['description'] for _, _, case in cases] == ['valid {braces} and "quotes"', 'missing']
+
+
+def test_parse_generated_suite_salvages_a_cut_off_completion():
+    complete, parsed_completely = parse_generated_suite('```json\n' + json.dumps(SUITE) + '\n```')
+    assert complete == SUITE and parsed_completely
+
+    text = json.dumps(SUITE)
+    salvaged, parsed_completely = parse_generated_suite(text[:text.index('"escaped')])
+    assert not parsed_completely
+    assert salvaged == {'Positive': SUITE['Positive'], 'Negative': SUITE['Negative'][:1]}
+
+    with pytest.raises(ValueError):
+        parse_generated_suite('I cannot help with that.')
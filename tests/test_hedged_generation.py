@@ -0,0 +1,98 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from src.routes import api_testing
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('content-length', '0')
+        self.end_headers()
+
+
+class SlowAIGenerator:
+    """Stands in for TestCaseGenerator: returns one AI case once released"""
+
+    def __init__(self, url):
+        self.url = url
+        self.release = threading.Event()
+
+    def generate_test_cases(self, api_info, **kwargs):
+        self.release.wait(5)
+        return {'Positive': [{'description': 'AI case', 'method': 'GET', 'endpoint': self.url,
+                              'headers': {}, 'expected_status': 200}]}
+
+
+@pytest.fixture
+def target(http_server):
+    with http_server(OkHandler) as base_url:
+        yield f'{base_url}/items'
+
+
+def api_info_for(url):
+    return {'method': 'GET', 'url': url, 'headers': {}, 'query_params': {'page': 1},
+            'response': {'status_code': 200, 'content': {}}}
+
+
+def wait_for_run(client, run_id, pending_status='ai_pending', timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        run = client.get(f'/api/runs/{run_id}').get_json()
+        if run['status'] != pending_status or time.monotonic() > deadline:
+            return run
+        time.sleep(0.05)
+
+
+def sources(run):
+    return [case.get('source') for cases in run['test_cases'].values() for case in cases]
+
+
+def test_late_ai_cases_are_attached_with_their_source(client, target, monkeypatch):
+    generator = SlowAIGenerator(target)
+    monkeypatch.setattr(api_testing, 'OPENAI_AVAILABLE', True)
+    monkeypatch.setattr(api_testing, 'get_ai_generator', lambda: generator)
+
+    response = client.post('/api/generate-tests', json={
+        'api_info': api_info_for(target), 'hedge': True, 'hedge_timeout': 0.05
+    }).get_json()
+    assert response['success']
+    assert response['execution_summary']['hedge']['ai_status'] == 'pending'
+    assert set(sources(client.get(f"/api/runs/{response['run_id']}").get_json())) == {'rules'}
+
+    generator.release.set()
+    run = wait_for_run(client, response['run_id'])
+
+    assert run['status'] == 'completed'
+    assert run['summary']['hedge']['ai_status'] == 'attached'
+    assert sources(run).count('ai') == 1
+    assert None not in sources(run)
+    ai_case = next(case for case in run['test_cases']['Positive'] if case['source'] == 'ai')
+    assert ai_case['execution_result']['response']['status_code'] == 200
+
+
+def test_hedge_runs_rules_only_when_the_ai_generator_cannot_be_created(client, target, monkeypatch):
+    def broken_generator():
+        raise RuntimeError('OPENAI_API_KEY is not set')
+
+    monkeypatch.setattr(api_testing, 'OPENAI_AVAILABLE', True)
+    monkeypatch.setattr(api_testing, 'get_ai_generator', broken_generator)
+
+    response = client.post('/api/generate-tests', json={'api_info': api_info_for(target), 'hedge': True})
+    body = response.get_json()
+
+    assert response.status_code == 200
+    assert body['execution_summary']['hedge'] == {
+        'timeout': api_testing.HEDGE_TIMEOUT, 'ai_status': 'failed', 'ai_error': 'OPENAI_API_KEY is not set'
+    }
+    run = client.get(f"/api/runs/{body['run_id']}").get_json()
+    assert run['status'] == 'completed'
+    assert set(sources(run)) == {'rules'}
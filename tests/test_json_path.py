@@ -0,0 +1,62 @@
+import pytest
+
+from src.services.json_path import delete_path, format_path, get_path, iter_fields, parse_path, set_path
+
+
+def document():
+    return {
+        'name': 'Widget',
+        'items': [{'price': 1, 'tags': ['a']}, {'price': 2, 'tags': ['b']}],
+        'meta': {'owner': {'id': 7}}
+    }
+
+
+def test_parse_and_format_round_trip():
+    for path in ("$.items[3].price", "$['odd key'][0]", '$["it\'s"]', '$'):
+        assert format_path(parse_path(path)) == path
+    assert parse_path('$.items[3].price') == ('items', 3, 'price')
+    with pytest.raises(ValueError):
+        parse_path('items.price')
+
+
+def test_set_path_copies_only_along_the_path():
+    original = document()
+    mutated = set_path(original, '$.items[1].price', 99)
+
+    assert get_path(mutated, '$.items[1].price') == 99
+    assert original['items'][1]['price'] == 2
+    # Containers on the path are new, everything else is shared
+    assert mutated is not original
+    assert mutated['items'] is not original['items']
+    assert mutated['items'][1] is not original['items'][1]
+    assert mutated['items'][0] is original['items'][0]
+    assert mutated['items'][1]['tags'] is original['items'][1]['tags']
+    assert mutated['meta'] is original['meta']
+
+
+def test_delete_path_leaves_the_original_untouched():
+    original = document()
+    mutated = delete_path(original, '$.meta.owner.id')
+
+    assert mutated['meta']['owner'] == {}
+    assert original['meta']['owner'] == {'id': 7}
+    assert mutated['items'] is original['items']
+    with pytest.raises(ValueError):
+        delete_path(original, '$')
+
+
+def test_iter_fields_walks_every_field_in_document_order():
+    paths = [format_path(path) for path, _ in iter_fields(document())]
+    assert paths == [
+        '$.name', '$.items', '$.items[0]', '$.items[0].price', '$.items[0].tags', '$.items[0].tags[0]',
+        '$.items[1]', '$.items[1].price', '$.items[1].tags', '$.items[1].tags[0]',
+        '$.meta', '$.meta.owner', '$.meta.owner.id'
+    ]
+
+
+def test_iter_fields_handles_deep_nesting():
+    deep = leaf = {}
+    for _ in range(5000):
+        leaf['child'] = {}
+        leaf = leaf['child']
+    assert sum(1 for _ in iter_fields(deep)) == 5000
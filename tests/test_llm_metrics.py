@@ -0,0 +1,58 @@
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from src.services.metrics import LLM_REQUEST_SECONDS, LLM_REQUESTS
+# Imported by module: pytest would try to collect a Test* class name
+from src.services import test_generator
+
+SUITE = '{"Positive": [{"description": "a", "method": "GET"}, {"description": "b", "method": "GET"}]}'
+API_INFO = {'method': 'GET', 'url': 'http://127.0.0.1:8000/items', 'headers': {}, 'response': {}}
+
+
+def chunk(text):
+    return SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+def streaming_generator():
+    client = mock.MagicMock()
+    client.chat.completions.create.side_effect = lambda **kwargs: iter([chunk(SUITE)])
+    generator = test_generator.TestCaseGenerator(client=client)
+    generator.cache = None
+    return generator
+
+
+def stream_latency():
+    counts, total = LLM_REQUEST_SECONDS._values.get(('stream',)) or ([0], 0.0)
+    return sum(counts), total
+
+
+def stream_requests(outcome):
+    return LLM_REQUESTS._values.get(('stream', outcome), 0)
+
+
+def test_stream_latency_excludes_the_consumers_time():
+    count_before, seconds_before = stream_latency()
+    ok_before = stream_requests('ok')
+
+    for _ in streaming_generator().iter_test_cases(API_INFO, include_curl=False):
+        time.sleep(0.2)
+
+    count, seconds = stream_latency()
+    assert count == count_before + 1
+    assert seconds - seconds_before < 0.1
+    assert stream_requests('ok') == ok_before + 1
+
+
+def test_consumer_going_away_counts_as_cancelled():
+    count_before, _ = stream_latency()
+    cancelled_before = stream_requests('cancelled')
+    error_before = stream_requests('error')
+
+    cases = streaming_generator().iter_test_cases(API_INFO, include_curl=False)
+    next(cases)
+    cases.close()
+
+    assert stream_requests('cancelled') == cancelled_before + 1
+    assert stream_requests('error') == error_before
+    assert stream_latency()[0] == count_before
@@ -0,0 +1,65 @@
+import time
+
+from src.services import load_test
+from src.services.load_test import LatencyHistogram, LoadTest
+
+
+def ok_result(status_code=200):
+    return {'success': True, 'response': {'status_code': status_code}}
+
+
+def test_histogram_percentiles_within_precision():
+    histogram = LatencyHistogram(precision=0.01)
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    for percent, expected in ((50, 0.5), (90, 0.9), (99, 0.99)):
+        assert abs(histogram.percentile(percent) - expected) <= expected * 0.01
+    assert histogram.percentile(100) == 1.0
+
+
+def test_histogram_merge_matches_recording_everything_once():
+    merged, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in (0.001, 0.002, 0.05):
+        first.record(value)
+        merged.record(value)
+    for value in (0.1, 0.3):
+        second.record(value)
+        merged.record(value)
+    first.merge(second)
+    assert first.summary() == merged.summary()
+
+
+def test_open_loop_drops_requests_beyond_the_backlog(monkeypatch):
+    monkeypatch.setattr(load_test, 'MAX_LOAD_BACKLOG', 5)
+
+    def slow_target(test_case):
+        time.sleep(0.1)
+        return ok_result()
+
+    load = LoadTest(slow_target, {'method': 'GET', 'endpoint': 'http://127.0.0.1:1/'},
+                    duration=0.5, concurrency=1, rps=100)
+    report = load.run()
+
+    # 50 requests are scheduled; one worker at 10 requests/s plus 5 queued cannot take them all
+    assert report['dropped'] > 0
+    assert report['requests'] + report['dropped'] == 50
+    assert report['requests'] <= 12
+
+
+def test_errors_with_object_addresses_share_a_kind():
+    def failing_target(test_case):
+        return {'success': False, 'error': f'Request failed: <Connection object at {hex(id(object()))}>'}
+
+    report = LoadTest(failing_target, {'method': 'GET', 'endpoint': 'http://127.0.0.1:1/'},
+                      duration=0.05, concurrency=2).run()
+    assert list(report['errors']) == ['Request failed: <Connection object at 0x...>']
+    assert report['error_rate'] == 1.0
+
+
+def test_route_rejects_a_test_case_that_is_not_an_object(client):
+    for test_case in ('GET http://example.com', ['GET', 'http://example.com']):
+        response = client.post('/api/load-test', json={'test_case': test_case})
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'test_case must be a JSON object'
@@ -0,0 +1,53 @@
+import time
+
+from src.services.rate_limiter import PROBE_POLL_INTERVAL, RateLimiter
+
+URL = 'http://127.0.0.1:8000/items'
+
+
+def test_only_the_probe_response_ends_the_pause():
+    limiter = RateLimiter(rps=0, burst=5)
+    bucket = limiter.bucket(URL)
+    sent_before_pause = time.monotonic()
+
+    limiter.observe(URL, 429, {'retry-after': '0.1'}, sent_at=sent_before_pause)
+    assert bucket.try_acquire() > 0
+
+    # A response to a request that was already in flight when the 429 arrived
+    limiter.observe(URL, 200, {}, sent_at=sent_before_pause)
+    time.sleep(0.12)
+
+    assert bucket.try_acquire() == 0
+    probe_sent_at = time.monotonic()
+    assert bucket.try_acquire() == PROBE_POLL_INTERVAL
+
+    limiter.observe(URL, 200, {}, sent_at=probe_sent_at)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+
+
+def test_probe_answered_with_another_429_pauses_again():
+    limiter = RateLimiter(rps=0, burst=5)
+    bucket = limiter.bucket(URL)
+    limiter.observe(URL, 429, {'retry-after': '0.05'}, sent_at=time.monotonic())
+    time.sleep(0.06)
+    assert bucket.try_acquire() == 0
+
+    limiter.observe(URL, 429, {'retry-after': '30'}, sent_at=time.monotonic())
+    assert bucket.try_acquire() > 1
+
+
+def test_exempt_429_does_not_pause_the_host():
+    limiter = RateLimiter(rps=0, burst=5)
+    limiter.observe(URL, 429, {'retry-after': '30', 'x-ratelimit-remaining': '0', 'x-ratelimit-reset': '30'},
+                    sent_at=time.monotonic(), exempt=True)
+    assert limiter.bucket(URL).try_acquire() == 0
+
+
+def test_remaining_and_reset_spread_requests():
+    limiter = RateLimiter(rps=0, burst=1)
+    bucket = limiter.bucket(URL)
+    limiter.observe(URL, 200, {'x-ratelimit-remaining': '2', 'x-ratelimit-reset': '10'}, sent_at=time.monotonic())
+    assert bucket.try_acquire() == 0
+    # 2 requests over 10 seconds: the next token is about 5 seconds away
+    assert 4 < bucket.try_acquire() <= 5
@@ -0,0 +1,36 @@
+from src.services.response_bodies import ResponseBodies, content_ref
+
+
+def result(content, body_sha256='same-bytes'):
+    return {'success': True, 'response': {'status_code': 200, 'content': content, 'body_sha256': body_sha256}}
+
+
+def test_identical_contents_are_stored_once():
+    bodies = ResponseBodies()
+    first = bodies.intern(result({'ok': True}))
+    second = bodies.intern(result({'ok': True}, body_sha256='other-bytes'))
+
+    assert content_ref(first) == content_ref(second)
+    assert len(bodies) == 1
+    assert 'content' not in first['response']
+
+
+def test_same_bytes_decoded_differently_get_their_own_ref():
+    bodies = ResponseBodies()
+    # One body served as application/json (parsed) and as text/plain (decoded text)
+    as_json = bodies.intern(result({'ok': True}))
+    as_text = bodies.intern(result('{"ok": true}'))
+
+    assert content_ref(as_json) != content_ref(as_text)
+    assert bodies.bodies[content_ref(as_json)] == {'ok': True}
+    assert bodies.bodies[content_ref(as_text)] == '{"ok": true}'
+
+
+def test_intern_leaves_the_input_and_error_results_alone():
+    bodies = ResponseBodies()
+    original = result('body')
+    bodies.intern(original)
+    assert original['response']['content'] == 'body'
+
+    error = {'success': False, 'error': 'Request failed'}
+    assert bodies.intern(error) is error
@@ -0,0 +1,74 @@
+import asyncio
+import hashlib
+import json
+import os
+
+import pytest
+
+from src.services.response_capture import BodyCapture, capture_body, capture_body_async
+
+
+def chunks(body, size=7):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def test_small_json_body_is_parsed_and_hashed():
+    body = json.dumps({'id': 1, 'name': 'Widget'}).encode()
+    fields = capture_body(chunks(body), max_bytes=1024).fields('application/json; charset=utf-8')
+
+    assert fields == {
+        'content': {'id': 1, 'name': 'Widget'},
+        'body_size': len(body),
+        'body_sha256': hashlib.sha256(body).hexdigest(),
+        'truncated': False
+    }
+
+
+def test_large_body_keeps_a_preview_but_hashes_everything():
+    body = b'x' * 100 + b'y' * 100
+    capture = capture_body(chunks(body), max_bytes=150)
+    fields = capture.fields('application/json')
+
+    assert fields['truncated'] is True
+    assert fields['body_size'] == 200
+    assert fields['body_sha256'] == hashlib.sha256(body).hexdigest()
+    # A truncated body is not parsed as JSON; the preview is the first max_bytes
+    assert fields['content'] == body[:150].decode()
+    assert 'body_path' not in fields
+
+
+def test_large_body_spills_to_its_content_addressed_path(tmp_path):
+    body = os.urandom(300)
+    capture = BodyCapture(max_bytes=100, spill_dir=str(tmp_path))
+    for chunk in chunks(body, size=64):
+        capture.feed(chunk)
+    capture.finish()
+
+    assert capture.path == str(tmp_path / f'{hashlib.sha256(body).hexdigest()}.body')
+    with open(capture.path, 'rb') as f:
+        assert f.read() == body
+    assert os.listdir(tmp_path) == [os.path.basename(capture.path)]
+
+
+def test_failed_read_removes_the_partial_spill(tmp_path):
+    def broken_stream():
+        yield b'a' * 200
+        raise ConnectionError('reset')
+
+    capture = BodyCapture(max_bytes=100, spill_dir=str(tmp_path))
+    with pytest.raises(ConnectionError):
+        for chunk in broken_stream():
+            capture.feed(chunk)
+    capture.abort()
+    assert os.listdir(tmp_path) == []
+
+
+def test_async_capture_matches_sync_capture():
+    body = b'plain text body ' * 10
+
+    async def stream():
+        for chunk in chunks(body):
+            yield chunk
+
+    async_fields = asyncio.run(capture_body_async(stream(), max_bytes=64)).fields('text/plain')
+    assert async_fields == capture_body(chunks(body), max_bytes=64).fields('text/plain')
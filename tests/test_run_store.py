@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from src.models.run import ResponseBlob
+from src.services.response_bodies import content_ref
+from src.services.run_store import RunStore
+
+API_INFO = {'method': 'POST', 'url': 'http://127.0.0.1:8000/items'}
+
+
+@pytest.fixture
+def store(app):
+    with app.app_context():
+        yield RunStore()
+
+
+def suite():
+    return {
+        'Positive': [{'description': 'valid', 'headers': {'content-type': 'application/json'},
+                      'payload': {'name': 'Widget'}, 'expected_status': 201, 'source': 'rules',
+                      'curl_command': 'curl ...'}],
+        'Negative': [{'description': 'raw body', 'headers': {'content-type': 'text/plain'},
+                      'payload': 'not json', 'expected_status': 400, 'source': 'ai'},
+                     {'description': 'no payload', 'expected_status': 400}]
+    }
+
+
+def result(status_code, content):
+    return {'success': True, 'response': {'status_code': status_code, 'response_time': 0.01, 'content': content}}
+
+
+def test_run_round_trip_with_shared_bodies(store):
+    run_id = store.create_run(suite(), API_INFO, used_ai=True)
+    error_body = {'error': 'invalid'}
+    store.record_results(run_id, [
+        ('Positive', 0, result(201, {'id': 1}), True),
+        ('Negative', 0, result(400, error_body), True),
+        ('Negative', 1, result(400, error_body), True),
+    ])
+    store.finish_run(run_id, {'executed': 3})
+
+    run = store.get_run(run_id)
+    assert run['status'] == 'completed'
+    assert run['summary'] == {'executed': 3}
+    cases = [case for cases in run['test_cases'].values() for case in cases]
+    assert [case.get('source') for case in cases] == ['rules', 'ai', None]
+    assert 'curl_command' not in cases[0]
+    # The identical error bodies are stored once and both results reference it
+    refs = [content_ref(case['execution_result']) for case in cases]
+    assert refs[1] == refs[2] != refs[0]
+    assert run['response_bodies'] == {refs[0]: {'id': 1}, refs[1]: error_body}
+    assert ResponseBlob.query.filter(ResponseBlob.sha256.in_(refs)).count() == 2
+
+
+def test_download_keeps_only_replayable_fields(store):
+    run_id = store.create_run(suite(), API_INFO)
+    store.record_result(run_id, 'Positive', 0, result(201, {'id': 1}), True)
+
+    test_cases = store.get_test_cases(run_id)
+    assert test_cases['Positive'][0] == {
+        'description': 'valid', 'method': None, 'endpoint': None,
+        'headers': {'content-type': 'application/json'}, 'expected_status': 201, 'payload': {'name': 'Widget'}
+    }
+    assert test_cases['Negative'][0]['payload'] == 'not json'
+    assert store.get_test_cases('unknown') is None
+
+
+def test_stored_cases_replay_and_render_with_the_run_defaults(store):
+    run_id = store.create_run(suite(), API_INFO)
+
+    run_case = store.get_case_at(run_id, 'Negative', 0)
+    assert store.get_case(run_id, 1).id == run_case.id
+    replay = store.replay_case(run_case)
+    assert (replay['method'], replay['endpoint'], replay['payload']) == ('POST', API_INFO['url'], 'not json')
+
+    assert store.curl_command(store.get_case(run_id, 0)) == (
+        "curl -X POST -H 'content-type: application/json' -d '{\"name\": \"Widget\"}' "
+        "http://127.0.0.1:8000/items"
+    )
+    assert store.curl_command(run_case) == (
+        "curl -X POST -H 'content-type: text/plain' -d 'not json' http://127.0.0.1:8000/items"
+    )
+
+
+def test_cases_appended_to_a_running_run_keep_their_order(store):
+    run_id = store.create_run({}, API_INFO)
+    store.add_case(run_id, 'Positive', 0, {'description': 'first'})
+    store.add_cases(run_id, [('Negative', 0, {'description': 'second'}), ('Positive', 1, {'description': 'third'})])
+
+    assert [store.get_case(run_id, ordinal).category for ordinal in range(3)] == ['Positive', 'Negative', 'Positive']
+    assert json.loads(store.get_case(run_id, 2).data)['description'] == 'third'
+    assert store.get_run(run_id)['status'] == 'running'